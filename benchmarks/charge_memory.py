@@ -0,0 +1,59 @@
+"""Measure the memory held by Charge objects built from tests/fixtures/large_charges.json
+
+Usage: python benchmarks/charge_memory.py [--count 10000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from podpointclient.factories import ChargeFactory  # pylint: disable=wrong-import-position
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "large_charges.json")
+
+
+def charges_response(count: int):
+    """A charges response with `count` charges, repeating the fixture's charges"""
+    with open(FIXTURE, "r", encoding="utf-8") as file:
+        fixture = json.load(file)
+
+    charges = fixture["charges"]
+    return {"charges": [charges[i % len(charges)] for i in range(count)]}
+
+
+def measure(count: int):
+    """Build `count` charges, returning bytes per charge and seconds taken"""
+    response = charges_response(count)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+
+    charges = ChargeFactory().build_charges(charge_response=response)
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(charges) == count
+    return (after - before) / count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000, help="number of charges to build")
+    args = parser.parse_args()
+
+    bytes_per_charge, elapsed = measure(args.count)
+    print(f"{args.count} charges: {bytes_per_charge:.0f} bytes per charge, built in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""End to end benchmark of PodPointClient workloads against the fake Pod Point server
+
+Runs one client per account against benchmarks/fake_server.py and reports, for
+each workload, requests per second, p50 and p99 request latency, and the CPU
+time the client process spends per request. Latency is measured from sending a
+request to receiving its response headers. The server is started in a separate
+process, so its CPU time is not counted, unless --server-url points at one that
+is already running with the same --accounts and --pods.
+
+Workloads:
+  sync     authenticate, then list pods, refresh them, and list all charges and the user
+  poll     list pods and refresh their connectivity status every --interval seconds
+  control  bursts of switching every pod to manual, then smart, charge mode
+
+Usage: python benchmarks/client_load.py [--workload sync] [--accounts 50] [--latency 0.05]
+"""
+import argparse
+import asyncio
+from collections import Counter
+import json
+import logging
+import math
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import aiohttp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from podpointclient.client import PodPointClient
+from podpointclient.helpers.retry import RetryPolicy
+from podpointclient.pod import Pod
+from fake_server import FakeServerSession, add_arguments, email_for
+
+FAKE_SERVER = os.path.join(os.path.dirname(__file__), "fake_server.py")
+WORKLOADS = ("sync", "poll", "control")
+
+
+class RequestStats:
+    """Records the latency and status of every request made through a session"""
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.failures: int = 0
+
+    def reset(self) -> None:
+        self.latencies = []
+        self.statuses = Counter()
+        self.failures = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.failures
+
+    @property
+    def errors(self) -> int:
+        """Requests that failed, or returned an error status"""
+        return self.failures + sum(
+            count for status, count in self.statuses.items() if status >= 400
+        )
+
+    def percentile(self, percent: float) -> float:
+        """Nearest rank percentile of the latencies, in seconds"""
+        if len(self.latencies) == 0:
+            return 0.0
+
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """A trace config recording requests into these stats"""
+        async def on_request_start(_session, context, _params) -> None:
+            context.started = time.perf_counter()
+
+        async def on_request_end(_session, context, params) -> None:
+            self.latencies.append(time.perf_counter() - context.started)
+            self.statuses[params.response.status] += 1
+
+        async def on_request_exception(_session, _context, _params) -> None:
+            self.failures += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+
+        return trace_config
+
+
+async def sync(client: PodPointClient, args: argparse.Namespace) -> None:
+    pods = await client.async_get_all_pods(perpage=args.page_size)
+    await client.async_refresh_pods(pods=pods)
+    await client.async_get_all_charges(perpage=args.page_size)
+    await client.async_get_user()
+
+
+async def poll(client: PodPointClient, args: argparse.Namespace) -> None:
+    for number in range(args.polls):
+        if number > 0:
+            await asyncio.sleep(args.interval)
+
+        pods = await client.async_get_pods(perpage=args.page_size)
+        await client.async_refresh_pods(pods=pods, firmware=False, charge_override=False)
+
+
+async def control(client: PodPointClient, args: argparse.Namespace) -> None:
+    pods: List[Pod] = await client.async_get_pods(perpage=args.page_size)
+
+    for _ in range(args.bursts):
+        await asyncio.gather(*[client.async_set_charge_mode_manual(pod) for pod in pods])
+        await asyncio.gather(*[client.async_set_charge_mode_smart(pod) for pod in pods])
+
+
+async def start_server(args: argparse.Namespace) -> asyncio.subprocess.Process:
+    """Start the fake server in a new process, with the same data arguments"""
+    command = [
+        sys.executable, FAKE_SERVER,
+        "--port", "0",
+        "--accounts", str(args.accounts),
+        "--pods", str(args.pods),
+        "--charges", str(args.charges),
+        "--page-size", str(args.page_size),
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate),
+        "--error-status", str(args.error_status),
+    ]
+    if args.seed is not None:
+        command.extend(["--seed", str(args.seed)])
+
+    process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE)
+    line = await process.stdout.readline()
+    if not line.startswith(b"Serving on "):
+        process.kill()
+        raise RuntimeError("Fake server failed to start")
+
+    args.server_url = line.decode().split()[-1]
+    return process
+
+
+async def run_workload(
+    name: str,
+    workload: Callable[[PodPointClient, argparse.Namespace], Awaitable[None]],
+    args: argparse.Namespace
+) -> Dict[str, Any]:
+    """Run a workload for every account, returning its results"""
+    stats = RequestStats()
+    session = FakeServerSession(
+        url=args.server_url,
+        limit=args.connections,
+        trace_configs=[stats.trace_config()]
+    )
+    retry_policy = None
+    if args.retries > 1:
+        retry_policy = RetryPolicy(max_attempts=args.retries, backoff_base=args.backoff)
+
+    clients = [
+        PodPointClient(
+            username=email_for(account),
+            password="password",
+            session=session,
+            retry_policy=retry_policy
+        )
+        for account in range(args.accounts)
+    ]
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run(client: PodPointClient) -> None:
+        async with semaphore:
+            await workload(client, args)
+
+    try:
+        # A full sync starts from nothing, other workloads are measured once logged in
+        if name != "sync":
+            await asyncio.gather(
+                *[client.auth.async_update_access_token() for client in clients],
+                return_exceptions=True
+            )
+            stats.reset()
+
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        results = await asyncio.gather(*[run(client) for client in clients], return_exceptions=True)
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+    finally:
+        await session.close()
+
+    exceptions = Counter(
+        type(result).__name__ for result in results if isinstance(result, BaseException)
+    )
+    requests = max(stats.requests, 1)
+
+    return {
+        "workload": name,
+        "requests": stats.requests,
+        "errors": stats.errors,
+        "failed_clients": dict(exceptions),
+        "seconds": elapsed,
+        "requests_per_second": stats.requests / elapsed,
+        "p50_ms": stats.percentile(50) * 1000,
+        "p99_ms": stats.percentile(99) * 1000,
+        "cpu_ms_per_request": cpu / requests * 1000,
+    }
+
+
+def report(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['workload']:<8} {result['requests']:>8} {result['errors']:>7} "
+        f"{result['seconds']:>8.2f} {result['requests_per_second']:>9.0f} "
+        f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['cpu_ms_per_request']:>11.3f}"
+    )
+    for exception, count in result["failed_clients"].items():
+        print(f"         {count} clients failed with {exception}")
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    process = None
+    if args.server_url is None:
+        process = await start_server(args)
+
+    try:
+        workloads = {"sync": sync, "poll": poll, "control": control}
+        names = args.workload if args.workload else list(WORKLOADS)
+
+        if not args.json:
+            print(
+                f"{'workload':<8} {'requests':>8} {'errors':>7} {'seconds':>8} {'req/s':>9} "
+                f"{'p50 ms':>8} {'p99 ms':>8} {'CPU ms/req':>11}"
+            )
+
+        results = []
+        for name in names:
+            result = await run_workload(name=name, workload=workloads[name], args=args)
+            results.append(result)
+            if not args.json:
+                report(result)
+
+        return results
+    finally:
+        if process is not None:
+            process.terminate()
+            await process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workload", action="append", choices=WORKLOADS, help="run only this workload")
+    parser.add_argument("--server-url", default=None, help="use a fake server that is already running")
+    parser.add_argument("--concurrency", type=int, default=50, help="accounts running at once")
+    parser.add_argument("--connections", type=int, default=100, help="connection pool size")
+    parser.add_argument("--polls", type=int, default=5, help="polls per account")
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between polls")
+    parser.add_argument("--bursts", type=int, default=3, help="control bursts per account")
+    parser.add_argument("--retries", type=int, default=1, help="attempts per request")
+    parser.add_argument("--backoff", type=float, default=0.05, help="retry backoff base, in seconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--log-level", default="CRITICAL", help="client log level, errors are counted either way")
+    add_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
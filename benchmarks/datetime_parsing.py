@@ -0,0 +1,76 @@
+"""Time lazy_convert_to_datetime over the timestamps in tests/fixtures/large_charges.json
+
+Compares the current implementation with the previous regex based one, with a cold
+and a warm memo cache.
+
+Usage: python benchmarks/datetime_parsing.py [--repeat 200]
+"""
+import argparse
+from datetime import datetime
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from podpointclient.helpers.functions import lazy_convert_to_datetime, _convert_to_datetime
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "large_charges.json")
+
+
+def regex_convert_to_datetime(date_string: str) -> datetime:
+    """lazy_convert_to_datetime before the fast path and memo cache were added"""
+    if date_string is None or not isinstance(date_string, str):
+        return None
+
+    date_string = re.sub(r"Z$", "+00:00", date_string)
+
+    try:
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        return None
+
+
+def timestamps():
+    """Every starts_at and ends_at in the fixture"""
+    with open(FIXTURE, "r", encoding="utf-8") as file:
+        charges = json.load(file)["charges"]
+
+    return [
+        charge[key] for charge in charges for key in ("starts_at", "ends_at")
+        if charge.get(key, None) is not None
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="passes over the timestamps")
+    args = parser.parse_args()
+
+    strings = timestamps()
+    parses = len(strings) * args.repeat
+
+    def run(convert):
+        for string in strings:
+            convert(string)
+
+    def run_cold():
+        _convert_to_datetime.cache_clear()
+        run(lazy_convert_to_datetime)
+
+    results = {
+        "regex": min(timeit.repeat(lambda: run(regex_convert_to_datetime), number=args.repeat, repeat=3)),
+        "fast path, cold cache": min(timeit.repeat(run_cold, number=args.repeat, repeat=3)),
+        "fast path, warm cache": min(timeit.repeat(lambda: run(lazy_convert_to_datetime), number=args.repeat, repeat=3)),
+    }
+
+    print(f"{len(strings)} timestamps x {args.repeat} passes")
+    for name, seconds in results.items():
+        print(f"{name:>22}: {seconds * 1e9 / parses:7.0f} ns per timestamp")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+"""A local stand-in for the Pod Point and Google auth APIs, for benchmarking
+
+Serves the endpoints the client uses, for `accounts` accounts named
+user0@example.com, user1@example.com... (any password is accepted), each with
+`pods` pods and `charges` charges built from the test fixtures. Every request is
+delayed by `latency` seconds, plus up to `jitter` seconds, listings are paged
+with at most `page_size` items per page, and `error_rate` of Pod Point API
+requests, other than creating a session, fail with `error_status`.
+
+Production URLs are mapped to the server with FakeServerSession, which can be
+passed to PodPointClient in place of an aiohttp.ClientSession.
+
+Usage: python benchmarks/fake_server.py [--port 8080] [--accounts 10] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple, Union
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from podpointclient.endpoints import (
+    API_VERSION,
+    AUTH,
+    CHARGE_OVERRIDE,
+    CHARGE_SCHEDULES,
+    CHARGERS,
+    CHARGES,
+    CONNECTIVITY_STATUS,
+    FIRMWARE,
+    GOOGLE_BASE_URL,
+    GOOGLE_TOKEN_BASE_URL,
+    MOBILE_API_BASE_URL,
+    PODS,
+    SESSIONS,
+    UNITS,
+    USERS
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+# Where each production base URL is served from on the fake server
+GOOGLE_PREFIX = "/google"
+GOOGLE_TOKEN_PREFIX = "/securetoken"
+API_PREFIX = f"/api3/{API_VERSION}"
+
+TOKEN_LIFETIME = 3600
+FIRST_USER_ID = 1000
+
+
+def fixture(name: str) -> Dict[str, Any]:
+    """Load a JSON fixture"""
+    with open(os.path.join(FIXTURES, f"{name}.json"), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def email_for(account: int) -> str:
+    """The email address of an account on the fake server"""
+    return f"user{account}@example.com"
+
+
+@dataclass
+class FakeServerConfig:
+    """Shape of the data, and behaviour, of a FakePodPointServer"""
+    accounts: int = 10
+    pods: int = 2
+    charges: int = 100
+    page_size: int = 50
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: Union[None, int] = None
+
+
+class Account:
+    """The data held by the fake server for one account"""
+    def __init__(self, index: int, config: FakeServerConfig) -> None:
+        self.user_id: int = FIRST_USER_ID + index
+        self.email: str = email_for(index)
+
+        pod = fixture("complete_pod")
+        self.pods: List[Dict[str, Any]] = []
+        for number in range(config.pods):
+            pod_id = self.user_id * 100 + number
+            self.pods.append({
+                **pod,
+                "id": pod_id,
+                "unit_id": pod_id,
+                "ppid": f"PSL-{pod_id}",
+                "name": f"Pod {number}"
+            })
+
+        charges = fixture("large_charges")["charges"]
+        self.charges: List[Dict[str, Any]] = [
+            {**charges[number % len(charges)], "id": self.user_id * 1_000_000 + number}
+            for number in range(config.charges)
+        ]
+
+        user = fixture("complete_user")
+        self.user: Dict[str, Any] = {
+            "users": {**user["users"], "id": self.user_id, "email": self.email}
+        }
+
+
+class FakePodPointServer:
+    """An aiohttp application implementing the endpoints used by PodPointClient"""
+    def __init__(self, config: FakeServerConfig = None) -> None:
+        self.config: FakeServerConfig = config if config is not None else FakeServerConfig()
+        self.accounts: Dict[str, Account] = {}
+        for index in range(self.config.accounts):
+            account = Account(index=index, config=self.config)
+            self.accounts[account.email] = account
+
+        self.units: Dict[int, Dict[str, Any]] = {
+            pod["unit_id"]: pod for account in self.accounts.values() for pod in account.pods
+        }
+        self.ppids: Dict[str, Dict[str, Any]] = {
+            pod["ppid"]: pod for pod in self.units.values()
+        }
+        self.owners: Dict[int, Account] = {
+            pod["unit_id"]: account for account in self.accounts.values() for pod in account.pods
+        }
+        self.charge_overrides: Dict[int, Union[None, Dict[str, Any]]] = {}
+        self.requests: int = 0
+
+        self._firmware: Dict[str, Any] = fixture("complete_firmware")
+        self._connectivity_status: Dict[str, Any] = fixture("connectivity_status")
+        self._tokens: Dict[str, Account] = {}
+        self._token_ids = itertools.count()
+        self._random = random.Random(self.config.seed)
+        self._runner: web.AppRunner = None
+        self.url: str = None
+
+    def application(self) -> web.Application:
+        """The aiohttp application serving the fake APIs"""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post(f"{GOOGLE_PREFIX}/verifyPassword", self.verify_password)
+        app.router.add_post(f"{GOOGLE_TOKEN_PREFIX}/token", self.refresh_token)
+        app.router.add_post(f"{API_PREFIX}{SESSIONS}", self.create_session)
+        app.router.add_get(f"{API_PREFIX}{AUTH}", self.get_user)
+        app.router.add_get(f"{API_PREFIX}{USERS}/{{user_id}}{PODS}", self.get_pods)
+        app.router.add_get(f"{API_PREFIX}{USERS}/{{user_id}}{CHARGES}", self.get_charges)
+        app.router.add_get(f"{API_PREFIX}{UNITS}/{{unit_id}}{FIRMWARE}", self.get_firmware)
+        app.router.add_put(f"{API_PREFIX}{UNITS}/{{unit_id}}{CHARGE_SCHEDULES}", self.put_schedules)
+        app.router.add_get(f"{API_PREFIX}{UNITS}/{{unit_id}}{CHARGE_OVERRIDE}", self.get_charge_override)
+        app.router.add_put(f"{API_PREFIX}{UNITS}/{{unit_id}}{CHARGE_OVERRIDE}", self.put_charge_override)
+        app.router.add_delete(f"{API_PREFIX}{UNITS}/{{unit_id}}{CHARGE_OVERRIDE}", self.delete_charge_override)
+        app.router.add_get(f"{CHARGERS}/{{ppid}}{CONNECTIVITY_STATUS}", self.get_connectivity_status)
+
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, returning the server's base URL. Port 0 picks a free port."""
+        self._runner = web.AppRunner(self.application(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host=host, port=port)
+        await site.start()
+
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakePodPointServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        self.requests += 1
+
+        delay = self.config.latency
+        if self.config.jitter > 0:
+            delay += self._random.uniform(0, self.config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # Logging in, and creating a session, are left alone
+        if request.path.startswith((GOOGLE_PREFIX, GOOGLE_TOKEN_PREFIX, f"{API_PREFIX}{SESSIONS}")):
+            return await handler(request)
+
+        if self.config.error_rate > 0 and self._random.random() < self.config.error_rate:
+            return web.json_response({"message": "Injected error"}, status=self.config.error_status)
+
+        if self._account(request) is None:
+            return web.json_response({"message": "Unauthenticated."}, status=401)
+
+        return await handler(request)
+
+    def _account(self, request: web.Request) -> Union[None, Account]:
+        """The account an authenticated request was made for"""
+        authorization = request.headers.get("Authorization", "")
+        return self._tokens.get(authorization[len("Bearer "):], None)
+
+    def _issue_tokens(self, account: Account) -> Tuple[str, str]:
+        token_id = next(self._token_ids)
+        access_token = f"access-{account.user_id}-{token_id}"
+        refresh_token = f"refresh-{account.user_id}-{token_id}"
+        self._tokens[access_token] = account
+        self._tokens[refresh_token] = account
+
+        return access_token, refresh_token
+
+    def _page(self, request: web.Request, key: str, items: List[Dict[str, Any]]) -> web.Response:
+        """A page of a listing, with at most `page_size` items"""
+        perpage = request.query.get("perpage", "all")
+        if perpage == "all":
+            size = len(items) or 1
+        else:
+            size = max(1, min(int(perpage), self.config.page_size))
+
+        page = max(1, int(request.query.get("page", 1)))
+        page_count = max(1, -(-len(items) // size))
+
+        return web.json_response({
+            key: items[(page - 1) * size:page * size],
+            "meta": {
+                "pagination": {
+                    "current_page": page,
+                    "per_page": size,
+                    "page_count": page_count,
+                    "item_count": len(items)
+                }
+            }
+        })
+
+    def _owned_unit(self, request: web.Request) -> Union[None, Dict[str, Any]]:
+        """The pod for the unit in a request's path, if the caller owns it"""
+        unit_id = int(request.match_info["unit_id"])
+        if self.owners.get(unit_id, None) is not self._account(request):
+            return None
+
+        return self.units[unit_id]
+
+    async def verify_password(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        account = self.accounts.get(body.get("email", None), None)
+        if account is None:
+            return web.json_response({"error": {"message": "EMAIL_NOT_FOUND"}}, status=400)
+
+        access_token, refresh_token = self._issue_tokens(account)
+        return web.json_response({
+            "idToken": access_token,
+            "refreshToken": refresh_token,
+            "expiresIn": str(TOKEN_LIFETIME)
+        })
+
+    async def refresh_token(self, request: web.Request) -> web.Response:
+        body = await request.post()
+        account = self._tokens.get(body.get("refresh_token", None), None)
+        if account is None:
+            return web.json_response({"error": {"message": "INVALID_REFRESH_TOKEN"}}, status=400)
+
+        access_token, refresh_token = self._issue_tokens(account)
+        return web.json_response({
+            "id_token": access_token,
+            "refresh_token": refresh_token,
+            "expires_in": str(TOKEN_LIFETIME)
+        })
+
+    async def create_session(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        if account is None:
+            return web.json_response({"message": "Unauthenticated."}, status=401)
+
+        return web.json_response(
+            {"sessions": {"id": str(account.user_id), "user_id": str(account.user_id)}},
+            status=201
+        )
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        return web.json_response(self._account(request).user)
+
+    async def get_pods(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        if request.match_info["user_id"] != str(account.user_id):
+            return web.json_response({"message": "Forbidden."}, status=403)
+
+        pods = [
+            {**pod, "charge_override": self.charge_overrides.get(pod["unit_id"], None)}
+            for pod in account.pods
+        ]
+        return self._page(request, "pods", pods)
+
+    async def get_charges(self, request: web.Request) -> web.Response:
+        account = self._account(request)
+        if request.match_info["user_id"] != str(account.user_id):
+            return web.json_response({"message": "Forbidden."}, status=403)
+
+        return self._page(request, "charges", account.charges)
+
+    async def get_firmware(self, request: web.Request) -> web.Response:
+        if self._owned_unit(request) is None:
+            return web.json_response({"message": "Not found."}, status=404)
+
+        return web.json_response(self._firmware)
+
+    async def put_schedules(self, request: web.Request) -> web.Response:
+        if self._owned_unit(request) is None:
+            return web.json_response({"message": "Not found."}, status=404)
+
+        body = await request.json()
+        return web.json_response(body, status=201)
+
+    async def get_charge_override(self, request: web.Request) -> web.Response:
+        pod = self._owned_unit(request)
+        if pod is None:
+            return web.json_response({"message": "Not found."}, status=404)
+
+        charge_override = self.charge_overrides.get(pod["unit_id"], None)
+        if charge_override is None:
+            return web.Response(status=204)
+
+        return web.json_response(charge_override)
+
+    async def put_charge_override(self, request: web.Request) -> web.Response:
+        pod = self._owned_unit(request)
+        if pod is None:
+            return web.json_response({"message": "Not found."}, status=404)
+
+        body = await request.json()
+        charge_override = {
+            "ppid": pod["ppid"],
+            "requested_at": body.get("requested_at", None),
+            "received_at": datetime.now(timezone.utc).isoformat(),
+            "ends_at": body.get("ends_at", None)
+        }
+        self.charge_overrides[pod["unit_id"]] = charge_override
+
+        return web.json_response(charge_override)
+
+    async def delete_charge_override(self, request: web.Request) -> web.Response:
+        pod = self._owned_unit(request)
+        if pod is None:
+            return web.json_response({"message": "Not found."}, status=404)
+
+        self.charge_overrides[pod["unit_id"]] = None
+        return web.Response(status=204)
+
+    async def get_connectivity_status(self, request: web.Request) -> web.Response:
+        pod = self.ppids.get(request.match_info["ppid"], None)
+        if pod is None or self.owners[pod["unit_id"]] is not self._account(request):
+            return web.json_response({"message": "Not found."}, status=404)
+
+        return web.json_response({**self._connectivity_status, "ppid": pod["ppid"]})
+
+
+class FakeServerSession:
+    """Sends requests for the production Pod Point and Google URLs to a fake server.
+    Can be passed to PodPointClient as its session, and shared between clients.
+    Extra keyword arguments, such as trace_configs, are passed to the
+    aiohttp.ClientSession."""
+    def __init__(self, url: str, limit: int = 100, **session_kwargs: Any) -> None:
+        self.url: str = url.rstrip("/")
+        self._prefixes: List[Tuple[str, str]] = [
+            (GOOGLE_TOKEN_BASE_URL, f"{self.url}{GOOGLE_TOKEN_PREFIX}"),
+            (GOOGLE_BASE_URL, f"{self.url}{GOOGLE_PREFIX}"),
+            (MOBILE_API_BASE_URL, self.url),
+        ]
+        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit),
+            **session_kwargs
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Is the underlying session closed"""
+        return self._session.closed
+
+    def rewrite(self, url: str) -> str:
+        """The fake server's URL for a production URL"""
+        for prefix, replacement in self._prefixes:
+            if url.startswith(prefix):
+                return f"{replacement}{url[len(prefix):]}"
+
+        return url
+
+    def get(self, url: str, **kwargs: Any):
+        return self._session.get(self.rewrite(url), **kwargs)
+
+    def put(self, url: str, **kwargs: Any):
+        return self._session.put(self.rewrite(url), **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self._session.post(self.rewrite(url), **kwargs)
+
+    def delete(self, url: str, **kwargs: Any):
+        return self._session.delete(self.rewrite(url), **kwargs)
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add arguments for each FakeServerConfig field to a parser"""
+    defaults = FakeServerConfig()
+    parser.add_argument("--accounts", type=int, default=defaults.accounts)
+    parser.add_argument("--pods", type=int, default=defaults.pods, help="pods per account")
+    parser.add_argument("--charges", type=int, default=defaults.charges, help="charges per account")
+    parser.add_argument("--page-size", type=int, default=defaults.page_size, help="largest page served")
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="up to this many more seconds")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="fraction of API requests that fail")
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from(args: argparse.Namespace) -> FakeServerConfig:
+    """A FakeServerConfig from parsed arguments"""
+    return FakeServerConfig(
+        accounts=args.accounts,
+        pods=args.pods,
+        charges=args.charges,
+        page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed
+    )
+
+
+async def serve(config: FakeServerConfig, host: str, port: int) -> None:
+    server = FakePodPointServer(config=config)
+    url = await server.start(host=host, port=port)
+    # The benchmark harness reads this line to find the server
+    print(f"Serving on {url}", flush=True)
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="0 picks a free port")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(config=config_from(args), host=args.host, port=args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
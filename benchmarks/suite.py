@@ -0,0 +1,241 @@
+"""Benchmarks for the parsing and serialisation hot paths
+
+Each case is timed to give a throughput, in items per second, and run once under
+tracemalloc to give its peak memory. Results are compared with benchmarks/baseline.json
+and the suite exits with a non zero status if any case is slower, or uses more memory,
+than the baseline allows. Baselines are machine specific, record your own with
+--update-baseline before making changes.
+
+Usage: python benchmarks/suite.py [--only NAME] [--update-baseline]
+"""
+import argparse
+from dataclasses import dataclass
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from podpointclient.factories import (
+    PodFactory,
+    ChargeFactory,
+    UserFactory,
+    ConnectivityStatusFactory
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Allowed drop in throughput, and growth in peak memory, before a case fails
+DEFAULT_THROUGHPUT_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.10
+# Peak memory of small cases varies by a few KiB between runs
+MEMORY_SLACK = 4096
+# Each case is repeated until it has run for at least this long
+MIN_RUN_SECONDS = 0.5
+
+
+def fixture(name: str) -> Dict[str, Any]:
+    """Load a JSON fixture"""
+    with open(os.path.join(FIXTURES, f"{name}.json"), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def scaled(items: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """`count` items, repeating `items`, each with a unique id"""
+    return [{**items[i % len(items)], "id": i} for i in range(count)]
+
+
+@dataclass
+class Case:
+    """A benchmark. `setup` builds the input outside of the timed section, `run`
+    processes it and returns how many items it processed."""
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], int]
+
+
+def pods_response(count: int) -> Dict[str, Any]:
+    """A pods response with `count` pods"""
+    return {"pods": scaled([fixture("complete_pod")], count)}
+
+
+def charges_response(count: int) -> Dict[str, Any]:
+    """A charges response with `count` charges"""
+    return {"charges": scaled(fixture("large_charges")["charges"], count)}
+
+
+def build_pods(response: Dict[str, Any]) -> int:
+    return len(PodFactory().build_pods(pods_response=response))
+
+
+def build_lazy_pods(response: Dict[str, Any]) -> int:
+    return len(PodFactory().build_pods(pods_response=response, lazy=True))
+
+
+def build_charges(response: Dict[str, Any]) -> int:
+    return len(ChargeFactory().build_charges(charge_response=response))
+
+
+def build_user(response: Dict[str, Any]) -> int:
+    UserFactory().build_user(user_response=response)
+    return 1
+
+
+def build_connectivity_status(response: Dict[str, Any]) -> int:
+    ConnectivityStatusFactory().build_connectivity_status(connectivity_status_response=response)
+    return 1
+
+
+def round_trip(objects: List[Any]) -> int:
+    """Serialise objects to JSON and load them back"""
+    for obj in objects:
+        json.loads(obj.to_json())
+    return len(objects)
+
+
+CASES = [
+    Case("build_pods[100]", lambda: pods_response(100), build_pods),
+    Case("build_pods[100,lazy]", lambda: pods_response(100), build_lazy_pods),
+    Case("build_charges[fixture]", lambda: fixture("large_charges"), build_charges),
+    Case("build_charges[10k]", lambda: charges_response(10_000), build_charges),
+    Case("build_charges[100k]", lambda: charges_response(100_000), build_charges),
+    Case("build_user", lambda: fixture("complete_user"), build_user),
+    Case("build_connectivity_status", lambda: fixture("connectivity_status"), build_connectivity_status),
+    Case(
+        "pods_round_trip[100]",
+        lambda: PodFactory().build_pods(pods_response=pods_response(100)),
+        round_trip
+    ),
+    Case(
+        "user_round_trip",
+        lambda: [UserFactory().build_user(user_response=fixture("complete_user"))],
+        round_trip
+    ),
+    Case(
+        "connectivity_status_round_trip",
+        lambda: [ConnectivityStatusFactory().build_connectivity_status(
+            connectivity_status_response=fixture("connectivity_status")
+        )],
+        round_trip
+    ),
+]
+
+
+def measure(case: Case) -> Dict[str, float]:
+    """Return the throughput, in items per second, and peak memory, in bytes, of a case"""
+    payload = case.setup()
+    # Warm up, so one-off allocations such as caches are not counted
+    case.run(payload)
+
+    gc.collect()
+    tracemalloc.start()
+    case.run(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    items = 0
+    runs = 0
+    best = None
+    started = time.perf_counter()
+    while runs < 3 or time.perf_counter() - started < MIN_RUN_SECONDS:
+        start = time.perf_counter()
+        items = case.run(payload)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        runs += 1
+
+    return {"throughput": items / best, "peak_memory": peak}
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    throughput_tolerance: float,
+    memory_tolerance: float
+) -> List[str]:
+    """Describe each case that is slower, or uses more memory, than the baseline allows"""
+    failures = []
+    for name, result in results.items():
+        expected = baseline.get(name, None)
+        if expected is None:
+            continue
+
+        minimum = expected["throughput"] * (1 - throughput_tolerance)
+        if result["throughput"] < minimum:
+            failures.append(
+                f"{name}: {result['throughput']:.0f} items/s, baseline {expected['throughput']:.0f}"
+            )
+
+        maximum = expected["peak_memory"] * (1 + memory_tolerance) + MEMORY_SLACK
+        if result["peak_memory"] > maximum:
+            failures.append(
+                f"{name}: {result['peak_memory']:.0f} bytes peak, baseline {expected['peak_memory']:.0f}"
+            )
+
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", help="run only cases whose name starts with this")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--throughput-tolerance", type=float, default=DEFAULT_THROUGHPUT_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    args = parser.parse_args()
+
+    cases = [
+        case for case in CASES
+        if args.only is None or any(case.name.startswith(only) for only in args.only)
+    ]
+
+    results = {}
+    for case in cases:
+        result = measure(case)
+        results[case.name] = result
+        print(
+            f"{case.name:<32} {result['throughput']:>14,.0f} items/s "
+            f"{result['peak_memory'] / 1024:>12,.0f} KiB peak"
+        )
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as file:
+                baseline = json.load(file)
+
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare with, run with --update-baseline to record one")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    failures = regressions(
+        results=results,
+        baseline=baseline,
+        throughput_tolerance=args.throughput_tolerance,
+        memory_tolerance=args.memory_tolerance
+    )
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
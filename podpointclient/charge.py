@@ -2,14 +2,24 @@
 
 from datetime import datetime
 from typing import Dict, Any, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from .helpers.functions import lazy_convert_to_datetime
 
+# Accounts can hold tens of thousands of charges, so every class here uses
+# __slots__ rather than a per instance __dict__. Dataclasses keep their generated
+# __eq__ and __repr__, but have an explicit __init__ as field defaults can not be
+# combined with __slots__ before Python 3.10.
+
 @dataclass
 class ChargeDurationFormat:
     """Representation of Format within Duration within Charge from pod point"""
-    value: str = None
-    unit: str  = None
+    __slots__ = ("value", "unit")
+    value: str
+    unit: str
+
+    def __init__(self, value: str = None, unit: str = None) -> None:
+        self.value = value
+        self.unit = unit
 
     def __str__(self) -> str:
         return " ".join(list(filter(None, [self.value, self.unit])))
@@ -17,6 +27,20 @@ class ChargeDurationFormat:
 
 class Charge:
     """Representation of a Charge from pod point"""
+    __slots__ = (
+        "id",
+        "kwh_used",
+        "duration",
+        "starts_at",
+        "ends_at",
+        "energy_cost",
+        "charging_duration",
+        "billing_event",
+        "location",
+        "pod",
+        "organisation",
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self.id: int             = data.get('id', None)
         self.kwh_used: float     = data.get('kwh_used', 0.0)
@@ -62,10 +86,11 @@ class Charge:
     @dataclass
     class ChargingDuration:
         """Representation of a Duration within a Charge from pod point"""
-        raw: int                                = None
-        formatted: 'list[ChargeDurationFormat]' = field(default_factory=list)
+        __slots__ = ("raw", "formatted")
+        raw: int
+        formatted: 'list[ChargeDurationFormat]'
 
-        def __init__(self, raw: int, formatted: List[Dict[str,str]]) -> None:
+        def __init__(self, raw: int = None, formatted: List[Dict[str,str]] = None) -> None:
             self.raw = raw
             self.formatted: List[ChargeDurationFormat] = []
 
@@ -88,17 +113,43 @@ class Charge:
     @dataclass
     class BillingEvent:
         """Represents a Billing Event from pod point"""
-        id: int                   = None
-        amount: Any               = None
-        currency: Any             = None
-        exchange_rate: int        = 0
-        presentment_amount: Any   = None
-        presentment_currency: Any = None
+        __slots__ = (
+            "id",
+            "amount",
+            "currency",
+            "exchange_rate",
+            "presentment_amount",
+            "presentment_currency",
+        )
+        id: int
+        amount: Any
+        currency: Any
+        exchange_rate: int
+        presentment_amount: Any
+        presentment_currency: Any
+
+        def __init__(
+            self,
+            id: int = None,  # pylint: disable=redefined-builtin
+            amount: Any = None,
+            currency: Any = None,
+            exchange_rate: int = 0,
+            presentment_amount: Any = None,
+            presentment_currency: Any = None
+        ) -> None:
+            self.id = id
+            self.amount = amount
+            self.currency = currency
+            self.exchange_rate = exchange_rate
+            self.presentment_amount = presentment_amount
+            self.presentment_currency = presentment_currency
 
 
     @dataclass
     class Location:
         """Represents a Location within a charge from pod point"""
+        __slots__ = ("id", "home", "timezone", "address")
+
         def __init__(self, data: Dict[str, Any]):
             self.id       = data.get('id', None)
             self.home     = data.get('home', None)
@@ -114,17 +165,39 @@ class Charge:
         @dataclass
         class Address:
             """Represents an address within a Location within a Charge from Pod Point"""
-            id: int            = None
-            business_name: str = ""
+            __slots__ = ("id", "business_name")
+            id: int
+            business_name: str
+
+            def __init__(
+                self,
+                id: int = None,  # pylint: disable=redefined-builtin
+                business_name: str = ""
+            ) -> None:
+                self.id = id
+                self.business_name = business_name
 
 
     @dataclass
     class Pod:
         """Represents a Pod within a Charge from pod point"""
-        id: int = None
+        __slots__ = ("id",)
+        id: int
+
+        def __init__(self, id: int = None) -> None:  # pylint: disable=redefined-builtin
+            self.id = id
 
     @dataclass
     class Organisation:
         """Repreents an Organisation within a Charge from pod point"""
-        id: int   = None
-        name: str = None
+        __slots__ = ("id", "name")
+        id: int
+        name: str
+
+        def __init__(
+            self,
+            id: int = None,  # pylint: disable=redefined-builtin
+            name: str = None
+        ) -> None:
+            self.id = id
+            self.name = name
@@ -1,6 +1,7 @@
 """PodPoint Basic API Client."""
+import asyncio
 import logging
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, AsyncIterator, Callable, Awaitable, Tuple
 from datetime import datetime, timedelta
 
 import aiohttp
@@ -9,6 +10,16 @@ from .endpoints import API_BASE_URL, CHARGE_SCHEDULES, PODS, UNITS, USERS, CHARG
 from .helpers.auth import Auth
 from .helpers.functions import auth_headers
 from .helpers.api_wrapper import APIWrapper
+from .helpers.api_response import APIResponse
+from .helpers.connection_pool import ConnectionPool
+from .helpers.credential_store import CredentialStore
+from .helpers.retry import RetryPolicy
+from .helpers.rate_limiter import RateLimiter
+from .helpers.circuit_breaker import CircuitBreaker
+from .helpers.http_cache import HTTPCache
+from .helpers.ttl_cache import TTLCache, MISSING
+from .helpers.coalescer import RequestCoalescer
+from .helpers.timeouts import RequestTimeout, RequestType, TimeoutPolicy
 from .factories import PodFactory, ScheduleFactory, ChargeFactory, FirmwareFactory, UserFactory, ChargeOverrideFactory, ConnectivityStatusFactory
 from .pod import Pod, Firmware
 from .charge import Charge
@@ -17,7 +28,7 @@ from .charge_override import ChargeOverride
 from .connectivity_status import ConnectivityStatus
 from .schedule import Schedule
 from .user import User
-from .errors import ChargeOverrideValidationError
+from .errors import APIError, ChargeOverrideValidationError
 
 TIMEOUT = 10
 
@@ -26,6 +37,12 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
 DEFAULT_POD_INCLUDES = ["statuses", "price", "model",
                     "unit_connectors", "charge_schedules", "charge_override"]
+DEFAULT_PAGE_CONCURRENCY = 4
+DEFAULT_REFRESH_CONCURRENCY = 8
+# Statuses returned when the API rejects an access token or session. 403 is not
+# included, the API also sends it for real permission errors, such as a pod that
+# belongs to another account, and logging in again would not fix those.
+AUTH_REJECTED_STATUSES = (401,)
 DEFAULT_USER_INCLUDES = ["account", "vehicle", "vehicle.make", "unit.pod.unit_connectors", "unit.pod.statuses", "unit.pod.model", "unit.pod.charge_schedules", "unit.pod.charge_override"]
 
 class PodPointClient:
@@ -35,23 +52,83 @@ class PodPointClient:
         self,
         username: str,
         password: str,
-        session: aiohttp.ClientSession = aiohttp.ClientSession(),
+        session: Union[aiohttp.ClientSession, ConnectionPool, None] = None,
         include_timestamp: bool = False,
-        http_debug: bool = None
+        http_debug: bool = None,
+        credential_store: CredentialStore = None,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        circuit_breaker: CircuitBreaker = None,
+        timeouts: TimeoutPolicy = None,
+        http_cache: HTTPCache = None,
+        response_cache: TTLCache = None,
+        coalesce_requests: bool = True,
+        lazy_pods: bool = False
     ) -> None:
-        """Pod Point API Client."""
+        """Pod Point API Client. If no session is passed, the client creates and owns
+        a ConnectionPool, which is closed by `async_close`. A rate_limiter may be
+        shared between clients to limit their combined request rate, and a
+        circuit_breaker shared to fail fast while Pod Point is unavailable.
+        `timeouts` sets the timeouts used for each type of request, any request
+        method also accepts a `timeout` to override them for a single call. An
+        http_cache revalidates, or reuses, pods, user and firmware responses. A
+        response_cache keeps pods, firmware, connectivity status and charge
+        overrides in memory, writes invalidate the entries for the pod changed.
+        Unless `coalesce_requests` is False, identical GETs made at the same time
+        share one request. With `lazy_pods` set, the nested objects of pods are
+        only built when they are first accessed."""
         self.email = username
         self.password = password
-        self._session = session
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts if timeouts is not None else TimeoutPolicy()
+        self.response_cache = response_cache
+        self._owns_session = session is None
+        self._session = session if session is not None else ConnectionPool()
         self._http_debug = http_debug if http_debug is not None else False
+        self.api_wrapper = APIWrapper(
+            session=self._session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            http_cache=http_cache,
+            coalescer=RequestCoalescer() if coalesce_requests else None
+        )
         self.auth = Auth(
             email=self.email,
             password=self.password,
             session=self._session,
-            http_debug=self._http_debug
+            http_debug=self._http_debug,
+            credential_store=credential_store,
+            api_wrapper=self.api_wrapper,
+            timeout=self.timeouts.auth
         )
-        self.api_wrapper = APIWrapper(session=self._session)
         self.include_timestamp = include_timestamp
+        self.lazy_pods = lazy_pods
+        # pod id -> (perpage, page) the pod was last listed on
+        self._pod_pages: Dict[int, Tuple[Union[str, int], Union[str, int]]] = {}
+
+    @property
+    def api_available(self) -> bool:
+        """Is the Pod Point API expected to accept requests. Always True unless a
+        circuit breaker has opened for the API host."""
+        if self.circuit_breaker is None:
+            return True
+
+        return self.circuit_breaker.is_available(API_BASE_URL)
+
+    async def __aenter__(self) -> "PodPointClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Stop background token refreshes and close the client's connection pool, if
+        the client created it"""
+        await self.auth.stop_background_refresh()
+
+        if self._owns_session:
+            await self._session.close()
 
     async def async_credentials_verified(self) -> bool:
         """Perform a minimum call to verify we have working credentials and can get one Pod"""
@@ -63,63 +140,212 @@ class PodPointClient:
     async def async_get_all_pods(
         self,
         perpage: Union[str, int] = 5,
-        includes: Union[List[str], None] = None
+        includes: Union[List[str], None] = None,
+        timeout: Union[RequestTimeout, float, None] = None
     ) -> List[Pod]:
         """Get all pods from the API"""
-        page = 1
-        pods: List[Pod] = []
+        return [
+            pod async for pod in self.async_iter_pods(
+                perpage=perpage,
+                includes=includes,
+                timeout=timeout
+            )
+        ]
 
-        more_pods = True
-        while more_pods:
-            new_pods: List[Pod] = await self.async_get_pods(
+    async def async_iter_pods(
+        self,
+        perpage: Union[str, int] = 5,
+        includes: Union[List[str], None] = None,
+        prefetch: bool = True,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> AsyncIterator[Pod]:
+        """Iterate over all pods from the API, one page at a time. When `prefetch` is
+        set the next page is requested while the current page is being consumed."""
+        async def get_page(page: int) -> Dict[str, Any]:
+            return await self._async_get_pods_json(
                 perpage=perpage,
                 page=page,
-                includes=includes
+                includes=includes,
+                timeout=timeout
             )
-            # Should be replaced by reading "meta > pagination > page_count" but
-            # would require a larger refactor
-            if len(new_pods) < perpage:
-                more_pods = False
 
-            pods.extend(new_pods)
-            page += 1
-
-        return pods
+        async for json in self._async_iter_pages(
+            get_page=get_page,
+            key='pods',
+            perpage=perpage,
+            prefetch=prefetch
+        ):
+            for pod in PodFactory().build_pods(pods_response=json, lazy=self.lazy_pods):
+                yield pod
 
     async def async_get_pods(
         self,
         perpage: Union[str, int] = 5,
         page: Union[str, int] = 1,
-        includes: Union[List[str], None] = None
+        includes: Union[List[str], None] = None,
+        timeout: Union[RequestTimeout, float, None] = None
     ) -> List[Pod]:
         """Get pods from the API"""
-        await self.auth.async_update_access_token()
+        response = await self._async_get_pods_response(
+            perpage=perpage,
+            page=page,
+            includes=includes,
+            timeout=timeout
+        )
+        json = await self._handle_json_response(response=response)
+
+        # A cached response returns the pods built from it the first time
+        pods = response.memo(
+            "pods",
+            lambda: PodFactory().build_pods(pods_response=json, lazy=self.lazy_pods)
+        )
+
+        return list(pods)
+
+    async def _async_get_pods_json(
+        self,
+        perpage: Union[str, int],
+        page: Union[str, int],
+        includes: Union[List[str], None],
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> Dict[str, Any]:
+        """Get a raw page of pods from the API"""
+        response = await self._async_get_pods_response(
+            perpage=perpage,
+            page=page,
+            includes=includes,
+            timeout=timeout
+        )
+
+        return await self._handle_json_response(response=response)
 
+    async def _async_get_pods_response(
+        self,
+        perpage: Union[str, int],
+        page: Union[str, int],
+        includes: Union[List[str], None],
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> APIResponse:
+        """Get a page of pods from the API, indexing the page each pod is on"""
         if includes is None:
             includes = DEFAULT_POD_INCLUDES
 
+        cache_key = (str(perpage), str(page), tuple(includes))
+        response = self._cached("pods", *cache_key)
+        if response is not MISSING:
+            return response
+
+        generation = self._cache_generation()
+        await self.auth.async_update_access_token()
+
         params = {"perpage": perpage, "page": page}
         if len(includes) > 0:
             params["include"] = ",".join(includes)
 
-        response = await self.api_wrapper.get(
+        response = await self._authorised(
+            self.api_wrapper.get,
             url=self._url_from_path(path=f"{USERS}/{self.auth.user_id}{PODS}"),
             params=self._generate_complete_params(params=params),
-            headers=auth_headers(access_token=self.auth.access_token)
+            timeout=self._timeout(RequestType.LISTING, timeout)
         )
 
-        json = await self._handle_json_response(response=response)
-
-        pods = PodFactory().build_pods(pods_response=json)
+        self._index_pod_pages(json=await response.json(), perpage=perpage, page=page)
+        self._cache("pods", *cache_key, value=response, tags=("pods",), generation=generation)
 
-        return pods
+        return response
 
-    async def async_get_pod(self, pod_id: int) -> Pod:
-        """Get specific pod from the API"""
-        pods = await self.async_get_all_pods()
+    def _index_pod_pages(
+        self,
+        json: Dict[str, Any],
+        perpage: Union[str, int],
+        page: Union[str, int]
+    ) -> None:
+        """Remember which page each pod in a listing response was found on"""
+        pods_data = json.get('pods', None) if isinstance(json, dict) else None
+        if pods_data is None:
+            return
+
+        for pod_data in pods_data:
+            pod_id = pod_data.get('id', None)
+            if pod_id is not None:
+                self._pod_pages[pod_id] = (perpage, page)
+
+    async def async_get_pod(self, pod_id: int, timeout: Union[RequestTimeout, float, None] = None) -> Pod:
+        """Get specific pod from the API. The Pod Point API has no single pod endpoint,
+        so if the pod has been seen in a previous listing only the page it was listed
+        on is requested. Otherwise, all pods are requested and filtered."""
+        location = self._pod_pages.get(pod_id, None)
+        if location is not None:
+            perpage, page = location
+            pods = await self.async_get_pods(perpage=perpage, page=page, timeout=timeout)
+            pod = next((pod for pod in pods if pod.id == pod_id), None)
+            if pod is not None:
+                return pod
+
+            _LOGGER.debug("Pod %s was not found on page %s, getting all pods", pod_id, page)
+
+        pods = await self.async_get_all_pods(timeout=timeout)
         return next((pod for pod in pods if pod.id == pod_id), None)
 
-    async def async_set_schedule(self, enabled: bool, pod: Pod) -> bool:
+    async def async_refresh_pods(
+        self,
+        pods: Union[List[Pod], None] = None,
+        concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
+        firmware: bool = True,
+        connectivity_status: bool = True,
+        charge_override: bool = True,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> List[Pod]:
+        """Fill in the firmware, connectivity status (offering_energy, last_message_at
+        and charging_state) and charge override of pods, in place. If no pods are
+        passed, all pods are requested first. Requests for every pod are made
+        concurrently, at most `concurrency` at a time. A request that fails is
+        logged and leaves the pod's previous value in place."""
+        await self.auth.async_update_access_token()
+
+        if pods is None:
+            pods = await self.async_get_all_pods(timeout=timeout)
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def refresh_firmware(pod: Pod) -> None:
+            async with semaphore:
+                firmwares = await self.async_get_firmware(pod=pod, timeout=timeout)
+            pod.firmware = firmwares[0] if len(firmwares) > 0 else None
+
+        async def refresh_connectivity_status(pod: Pod) -> None:
+            async with semaphore:
+                status = await self.async_get_connectivity_status(pod=pod, timeout=timeout)
+            pod.connectivity_status = status
+            if len(status.evses) > 0:
+                pod.offering_energy = status.offering_energy
+                pod.last_message_at = status.last_message_at
+                pod.charging_state = status.charging_state if status.evses[0].connectors else None
+
+        async def refresh_charge_override(pod: Pod) -> None:
+            async with semaphore:
+                override = await self.async_get_charge_override(pod=pod, timeout=timeout)
+            pod.charge_override = override
+
+        refreshes = []
+        for pod in pods:
+            if firmware:
+                refreshes.append(refresh_firmware(pod))
+            if connectivity_status:
+                refreshes.append(refresh_connectivity_status(pod))
+            if charge_override:
+                refreshes.append(refresh_charge_override(pod))
+
+        results = await asyncio.gather(*refreshes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, APIError):
+                _LOGGER.warning("Unable to refresh pod - %s", result)
+            elif isinstance(result, BaseException):
+                raise result
+
+        return pods
+
+    async def async_set_schedule(self, enabled: bool, pod: Pod, timeout: Union[RequestTimeout, float, None] = None) -> bool:
         """Send data from the API."""
         await self.auth.async_update_access_token()
 
@@ -131,13 +357,17 @@ class PodPointClient:
             enabled
         )
 
-        response = await self.api_wrapper.put(
-            url=self._url_from_path(
-                path=f"{UNITS}/{unit_id}{CHARGE_SCHEDULES}"),
-            params=self._generate_complete_params(params=None),
-            headers=auth_headers(access_token=self.auth.access_token),
-            body=self._schedule_data(enabled=enabled)
-        )
+        try:
+            response = await self._authorised(
+                self.api_wrapper.put,
+                url=self._url_from_path(
+                    path=f"{UNITS}/{unit_id}{CHARGE_SCHEDULES}"),
+                params=self._generate_complete_params(params=None),
+                body=self._schedule_data(enabled=enabled),
+                timeout=self._timeout(RequestType.CONTROL, timeout)
+            )
+        finally:
+            self._invalidate_pod(pod)
 
         #  Quick exit if the response code is 201
         if response.status == 201:
@@ -153,65 +383,172 @@ class PodPointClient:
 
     async def async_get_all_charges(
         self,
-        perpage: Union[str, int] = 50
+        perpage: Union[str, int] = 50,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        timeout: Union[RequestTimeout, float, None] = None
     ) -> List[Charge]:
-        """Get all charges from the API"""
-        page = 1
+        """Get all charges from the API.
+
+        The first page is used to read "meta > pagination > page_count", the
+        remaining pages are then requested concurrently (at most `concurrency`
+        at a time). Charges are returned in page order."""
+        json = await self._async_get_charges_json(perpage=perpage, page=1, timeout=timeout)
+        charges: List[Charge] = ChargeFactory().build_charges(charge_response=json)
+
+        page_count = self._page_count(json)
+        if page_count is None:
+            # Pagination metadata missing, fall back to walking pages until
+            # we receive a short one
+            page = 2
+            new_charges = charges
+            while perpage != "all" and len(new_charges) >= perpage:
+                new_charges = await self.async_get_charges(
+                    perpage=perpage,
+                    page=page,
+                    timeout=timeout
+                )
+                charges.extend(new_charges)
+                page += 1
+
+            return charges
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def get_page(page: int) -> List[Charge]:
+            async with semaphore:
+                return await self.async_get_charges(perpage=perpage, page=page, timeout=timeout)
+
+        pages: List[List[Charge]] = await asyncio.gather(
+            *[get_page(page) for page in range(2, page_count + 1)]
+        )
+        for new_charges in pages:
+            charges.extend(new_charges)
+
+        return charges
+
+    async def async_iter_charges(
+        self,
+        perpage: Union[str, int] = 50,
+        prefetch: bool = True,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> AsyncIterator[Charge]:
+        """Iterate over all charges from the API, one page at a time. When `prefetch`
+        is set the next page is requested while the current page is being consumed."""
+        async def get_page(page: int) -> Dict[str, Any]:
+            return await self._async_get_charges_json(perpage=perpage, page=page, timeout=timeout)
+
+        async for json in self._async_iter_pages(
+            get_page=get_page,
+            key='charges',
+            perpage=perpage,
+            prefetch=prefetch
+        ):
+            for charge in ChargeFactory().build_charges(charge_response=json):
+                yield charge
+
+    async def async_get_new_charges(
+        self,
+        since_charge_id: Union[int, None] = None,
+        since: Union[datetime, None] = None,
+        perpage: Union[str, int] = 50,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> List[Charge]:
+        """Get charges newer than a previously seen charge. Pod Point returns charges
+        most recent first, so pages are requested until a charge matching
+        `since_charge_id`, or starting at or before the timezone-aware `since`, is
+        found. Returns only the new charges, most recent first."""
         charges: List[Charge] = []
 
-        more_charges = True
-        while more_charges:
-            new_charges: List[Charge] = await self.async_get_charges(perpage=perpage, page=page)
-            # Should be replaced by reading "meta > pagination > page_count" but
-            # would require a larger refactor
-            if len(new_charges) < perpage:
-                more_charges = False
+        charge_iterator = self.async_iter_charges(
+            perpage=perpage,
+            prefetch=False,
+            timeout=timeout
+        )
+        try:
+            async for charge in charge_iterator:
+                if since_charge_id is not None and charge.id == since_charge_id:
+                    break
 
-            charges.extend(new_charges)
-            page += 1
+                if since is not None and charge.starts_at is not None and charge.starts_at <= since:
+                    break
+
+                charges.append(charge)
+        finally:
+            await charge_iterator.aclose()
 
         return charges
 
     async def async_get_charges(
         self,
         perpage: Union[str, int] = 5,
-        page: Union[str, int] = 1
+        page: Union[str, int] = 1,
+        timeout: Union[RequestTimeout, float, None] = None
     ) -> List[Charge]:
         """Get charges from the API."""
+        json = await self._async_get_charges_json(perpage=perpage, page=page, timeout=timeout)
+
+        charges = ChargeFactory().build_charges(charge_response=json)
+
+        return charges
+
+    async def _async_get_charges_json(
+        self,
+        perpage: Union[str, int],
+        page: Union[str, int],
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> Dict[str, Any]:
+        """Get a raw page of charges from the API."""
         await self.auth.async_update_access_token()
 
-        response = await self.api_wrapper.get(
+        response = await self._authorised(
+            self.api_wrapper.get,
             url=self._url_from_path(
                 path=f"{USERS}/{self.auth.user_id}{CHARGES}"),
             params=self._generate_complete_params(
                 params={"perpage": perpage, "page": page}),
-            headers=auth_headers(access_token=self.auth.access_token)
+            timeout=self._timeout(RequestType.LISTING, timeout)
         )
 
-        json = await self._handle_json_response(response=response)
-
-        charges = ChargeFactory().build_charges(charge_response=json)
-
-        return charges
+        return await self._handle_json_response(response=response)
 
-    async def async_get_firmware(self, pod: Pod) -> List[Firmware]:
+    async def async_get_firmware(self, pod: Pod, timeout: Union[RequestTimeout, float, None] = None) -> List[Firmware]:
         """Get firmware information for a given unit."""
+        firmwares = self._cached("firmware", pod.unit_id)
+        if firmwares is not MISSING:
+            return list(firmwares)
+
+        generation = self._cache_generation()
         await self.auth.async_update_access_token()
         
-        response = await self.api_wrapper.get(
+        response = await self._authorised(
+            self.api_wrapper.get,
             url=self._url_from_path(
                 path=f"{UNITS}/{pod.unit_id}{FIRMWARE}"),
             params=self._generate_complete_params(params=None),
-            headers=auth_headers(access_token=self.auth.access_token)
+            timeout=self._timeout(RequestType.DEFAULT, timeout)
         )
 
         json = await self._handle_json_response(response=response)
 
-        firmwares = FirmwareFactory().build_firmwares(firmware_response=json)
+        firmwares = response.memo(
+            "firmwares",
+            lambda: FirmwareFactory().build_firmwares(firmware_response=json)
+        )
+        self._cache(
+            "firmware",
+            pod.unit_id,
+            value=firmwares,
+            tags=self._pod_tags(pod),
+            generation=generation
+        )
 
-        return firmwares
+        return list(firmwares)
 
-    async def async_get_user(self, includes: Union[List[str], None] = None) -> User:
+    async def async_get_user(
+        self,
+        includes: Union[List[str], None] = None,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> User:
         """Get user from the API"""
         await self.auth.async_update_access_token()
 
@@ -222,65 +559,125 @@ class PodPointClient:
         if len(includes) > 0:
             params["include"] = ",".join(includes)
 
-        response = await self.api_wrapper.get(
+        response = await self._authorised(
+            self.api_wrapper.get,
             url=self._url_from_path(path=f"{AUTH}"),
             params=self._generate_complete_params(params=params),
-            headers=auth_headers(access_token=self.auth.access_token)
+            timeout=self._timeout(RequestType.LISTING, timeout)
         )
 
         json = await self._handle_json_response(response=response)
 
-        user = UserFactory().build_user(user_response=json)
+        user = response.memo("user", lambda: UserFactory().build_user(user_response=json))
 
         return user
 
-    async def async_get_charge_override(self, pod: Pod) -> Union[None, ChargeOverride]:
+    async def async_get_charge_override(
+        self,
+        pod: Pod,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> Union[None, ChargeOverride]:
+        charge_override = self._cached("charge_override", pod.unit_id)
+        if charge_override is not MISSING:
+            return charge_override
+
+        generation = self._cache_generation()
         await self.auth.async_update_access_token()
         
-        response = await self.api_wrapper.get(
+        response = await self._authorised(
+            self.api_wrapper.get,
             url=self._url_from_path(
                 path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
             params=self._generate_complete_params(params=None),
-            headers=auth_headers(access_token=self.auth.access_token)
+            timeout=self._timeout(RequestType.DEFAULT, timeout)
         )
 
         # If there is no charge mode (smart mode), return None
-        if response.status == 204:
-            return None
+        charge_override = None
+        if response.status != 204:
+            json = await self._handle_json_response(response=response)
+            charge_override = response.memo(
+                "charge_override",
+                lambda: ChargeOverrideFactory().build_charge_override(
+                    charge_override_response=json
+                )
+            )
 
-        json = await self._handle_json_response(response=response)
+        self._cache(
+            "charge_override",
+            pod.unit_id,
+            value=charge_override,
+            tags=self._pod_tags(pod),
+            generation=generation
+        )
 
-        return ChargeOverrideFactory().build_charge_override(charge_override_response=json)
+        return charge_override
 
-    async def async_delete_charge_override(self, pod:Pod) -> bool:
+    async def async_delete_charge_override(self, pod:Pod, timeout: Union[RequestTimeout, float, None] = None) -> bool:
         await self.auth.async_update_access_token()
 
-        response = await self.api_wrapper.delete(
-            url=self._url_from_path(
-                path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
-            params=self._generate_complete_params(params=None),
-            headers=auth_headers(access_token=self.auth.access_token)
-        )
+        try:
+            response = await self._authorised(
+                self.api_wrapper.delete,
+                url=self._url_from_path(
+                    path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
+                params=self._generate_complete_params(params=None),
+                timeout=self._timeout(RequestType.CONTROL, timeout)
+            )
+        finally:
+            self._invalidate_pod(pod)
 
         return response.status == 204
 
-    async def async_get_connectivity_status(self, pod:Pod) -> ConnectivityStatus:
+    async def async_get_connectivity_status(
+        self,
+        pod:Pod,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> ConnectivityStatus:
+        connectivity_status = self._cached("connectivity_status", pod.ppid)
+        if connectivity_status is not MISSING:
+            return connectivity_status
+
+        generation = self._cache_generation()
         await self.auth.async_update_access_token()
 
-        response = await self.api_wrapper.get(
+        response = await self._authorised(
+            self.api_wrapper.get,
             url=self._url_from_path(
                 path=f"{CHARGERS}/{pod.ppid}{CONNECTIVITY_STATUS}",
                 base=MOBILE_API_BASE_URL
             ),
             params=self._generate_complete_params(params=None),
-            headers=auth_headers(access_token=self.auth.access_token)
+            timeout=self._timeout(RequestType.DEFAULT, timeout)
         )
 
         json = await self._handle_json_response(response=response)
 
-        return ConnectivityStatusFactory().build_connectivity_status(connectivity_status_response=json)
+        # Coalesced callers share the response, and the status built from it
+        connectivity_status = response.memo(
+            "connectivity_status",
+            lambda: ConnectivityStatusFactory().build_connectivity_status(
+                connectivity_status_response=json
+            )
+        )
+        self._cache(
+            "connectivity_status",
+            pod.ppid,
+            value=connectivity_status,
+            tags=self._pod_tags(pod),
+            generation=generation
+        )
+
+        return connectivity_status
 
-    async def async_set_charge_override(self, pod:Pod, hours:int=0, minutes:int=0, seconds:int=0) -> ChargeOverride:
+    async def async_set_charge_override(
+        self,
+        pod:Pod,
+        hours:int=0,
+        minutes:int=0,
+        seconds:int=0,
+        timeout: Union[RequestTimeout, float, None] = None
+    ) -> ChargeOverride:
         await self.auth.async_update_access_token()
 
         valid_hours = (hours is not None and type(hours) is int and hours >= 0)
@@ -309,19 +706,23 @@ class PodPointClient:
             "ends_at": ends_at.strftime(datetime_format_string)
         }
 
-        response = await self.api_wrapper.put(
-            url=self._url_from_path(
-                path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
-            params=self._generate_complete_params(params=None),
-            body=body,
-            headers=auth_headers(access_token=self.auth.access_token)
-        )
+        try:
+            response = await self._authorised(
+                self.api_wrapper.put,
+                url=self._url_from_path(
+                    path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
+                params=self._generate_complete_params(params=None),
+                body=body,
+                timeout=self._timeout(RequestType.CONTROL, timeout)
+            )
+        finally:
+            self._invalidate_pod(pod)
 
         json = await self._handle_json_response(response=response)
 
         return ChargeOverrideFactory().build_charge_override(charge_override_response=json)
 
-    async def async_set_charge_mode_manual(self, pod) -> bool:
+    async def async_set_charge_mode_manual(self, pod, timeout: Union[RequestTimeout, float, None] = None) -> bool:
         """Set user's pod into 'manual' charge mode"""
         await self.auth.async_update_access_token()
 
@@ -329,7 +730,7 @@ class PodPointClient:
             "requested_at": datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%S%z") #2023-04-25T09:35:34+01:00
         }
 
-        response = await self._async_set_charge_mode(pod, body)
+        response = await self._async_set_charge_mode(pod, body, timeout=timeout)
 
         expected_response = (
             response.ppid == pod.ppid 
@@ -339,28 +740,36 @@ class PodPointClient:
 
         return expected_response
 
-    async def async_set_charge_mode_smart(self, pod) -> bool:
+    async def async_set_charge_mode_smart(self, pod, timeout: Union[RequestTimeout, float, None] = None) -> bool:
         """Set the user's pod into 'smart' charge mode"""
-        response = await self.api_wrapper.delete(
-            url=self._url_from_path(
-                path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"
-            ),
-            params=self._generate_complete_params(params=None),
-            headers=auth_headers(access_token=self.auth.access_token)
-        )
+        try:
+            response = await self._authorised(
+                self.api_wrapper.delete,
+                url=self._url_from_path(
+                    path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"
+                ),
+                params=self._generate_complete_params(params=None),
+                timeout=self._timeout(RequestType.CONTROL, timeout)
+            )
+        finally:
+            self._invalidate_pod(pod)
 
         return response.status == 204
 
  
-    async def _async_set_charge_mode(self, pod, body) -> ChargeMode:
+    async def _async_set_charge_mode(self, pod, body, timeout: Union[RequestTimeout, float, None] = None) -> ChargeMode:
         """Given a body object, set the charge mode for a user's pod"""
-        response = await self.api_wrapper.put(
-            url=self._url_from_path(
-                path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
-            params=self._generate_complete_params(params=None),
-            body=body,
-            headers=auth_headers(access_token=self.auth.access_token)
-        )
+        try:
+            response = await self._authorised(
+                self.api_wrapper.put,
+                url=self._url_from_path(
+                    path=f"{UNITS}/{pod.unit_id}{CHARGE_OVERRIDE}"),
+                params=self._generate_complete_params(params=None),
+                body=body,
+                timeout=self._timeout(RequestType.CONTROL, timeout)
+            )
+        finally:
+            self._invalidate_pod(pod)
 
         json = await self._handle_json_response(response=response)
 
@@ -376,6 +785,85 @@ class PodPointClient:
 
         return {"data": d_list}
 
+    def _cached(self, endpoint: str, *key: Any) -> Any:
+        """Return a cached result, or MISSING if there isn't one"""
+        if self.response_cache is None:
+            return MISSING
+
+        return self.response_cache.get(endpoint, *key)
+
+    def _cache_generation(self) -> Union[None, int]:
+        """The response cache's generation, taken before requesting a result to cache"""
+        if self.response_cache is None:
+            return None
+
+        return self.response_cache.generation
+
+    def _cache(
+        self,
+        endpoint: str,
+        *key: Any,
+        value: Any,
+        tags: Tuple[str, ...],
+        generation: Union[None, int]
+    ) -> None:
+        """Cache a result, if the client has a response cache and the result has not
+        been invalidated since `generation`"""
+        if self.response_cache is not None:
+            self.response_cache.set(
+                endpoint,
+                *key,
+                value=value,
+                tags=tags,
+                generation=generation
+            )
+
+    def _pod_tags(self, pod: Pod) -> Tuple[str, ...]:
+        """Tags for cached results belonging to a pod"""
+        return (f"unit:{pod.unit_id}", f"ppid:{pod.ppid}")
+
+    def _invalidate_pod(self, pod: Pod) -> None:
+        """Remove cached results for a pod, and pod listings, after a write to it"""
+        if self.response_cache is not None:
+            self.response_cache.invalidate("pods", *self._pod_tags(pod))
+
+    async def _authorised(
+        self,
+        request: Callable[..., Awaitable[APIResponse]],
+        **kwargs: Any
+    ) -> APIResponse:
+        """Make a request with the current access token. If the API rejects the token
+        or session, they are discarded, a new token and session are created and the
+        request is retried once."""
+        await self.auth.async_update_access_token()
+        access_token = self.auth.access_token
+
+        try:
+            return await request(headers=auth_headers(access_token=access_token), **kwargs)
+        except APIError as exception:
+            if len(exception.args) == 0 or exception.args[0] not in AUTH_REJECTED_STATUSES:
+                raise
+
+            _LOGGER.warning("Pod Point rejected the current session, logging in again")
+            # Another request may already have replaced the rejected token
+            if self.auth.access_token == access_token:
+                self.auth.invalidate_session()
+            await self.auth.async_update_access_token(force=True)
+
+        return await request(headers=auth_headers(access_token=self.auth.access_token), **kwargs)
+
+    def _timeout(
+        self,
+        request_type: RequestType,
+        timeout: Union[RequestTimeout, float, None]
+    ) -> RequestTimeout:
+        """The timeout for a request, a per call timeout wins over the client's policy"""
+        timeout = RequestTimeout.coerce(timeout)
+        if timeout is not None:
+            return timeout
+
+        return self.timeouts.for_type(request_type)
+
     def _url_from_path(self, path: str, base: str = API_BASE_URL) -> str:
         """Given a path, return a complete API URL"""
         return f"{base}{path}"
@@ -391,7 +879,68 @@ class PodPointClient:
         params["timestamp"] = datetime.now().astimezone().timestamp()
         return params
 
-    async def _handle_json_response(self, response: aiohttp.ClientResponse) -> Dict[str, any]:
+    async def _async_iter_pages(
+        self,
+        get_page: Callable[[int], Awaitable[Dict[str, Any]]],
+        key: str,
+        perpage: Union[str, int],
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield raw listing pages in order until the last page is reached. The last
+        page is read from "meta > pagination > page_count" when available, otherwise
+        the first page shorter than `perpage` is treated as the last."""
+        page = 1
+        next_page = asyncio.ensure_future(get_page(page))
+
+        try:
+            while next_page is not None:
+                json = await next_page
+                next_page = None
+
+                page_count = self._page_count(json)
+                if page_count is not None:
+                    more_pages = page < page_count
+                else:
+                    items = json.get(key, None) if isinstance(json, dict) else None
+                    more_pages = (
+                        perpage != "all"
+                        and items is not None
+                        and len(items) >= perpage
+                    )
+
+                page += 1
+                if more_pages:
+                    next_page = get_page(page)
+                    if prefetch:
+                        next_page = asyncio.ensure_future(next_page)
+
+                yield json
+        finally:
+            # The caller stopped iterating early, don't leave a request behind. The
+            # request may still fail rather than be cancelled, retrieve its exception
+            # so it is not logged as never retrieved.
+            if isinstance(next_page, asyncio.Future):
+                next_page.cancel()
+                next_page.add_done_callback(
+                    lambda done: done.cancelled() or done.exception()
+                )
+            elif next_page is not None:
+                next_page.close()
+
+    def _page_count(self, json: Dict[str, Any]) -> Union[None, int]:
+        """Given a listing response, return "meta > pagination > page_count" if present"""
+        if not isinstance(json, dict):
+            return None
+
+        pagination = (json.get('meta', None) or {}).get('pagination', None) or {}
+        page_count = pagination.get('page_count', None)
+
+        if isinstance(page_count, int):
+            return page_count
+
+        return None
+
+    async def _handle_json_response(self, response: APIResponse) -> Dict[str, any]:
         """Given a Coroutine (assuming a response from ApiWrapper), await calling
         json() and if needed, debug log the response"""
         json = await response.json()
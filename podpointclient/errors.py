@@ -24,3 +24,9 @@ class ChargeOverrideValidationError(Exception):
     """An error relating to connecting to pod point"""
     def __init__(self):
         super().__init__(f'A validate error occured when processing charge override. Please ensure that an hour, minute or second value is passed and that it is > 0.')
+
+class CircuitOpenError(ApiConnectionError):
+    """Raised without making a request while the circuit for a host is open"""
+    def __init__(self, host):
+        super().__init__(f'Circuit open for {host}, failing fast')
+        self.host = host
@@ -9,8 +9,9 @@ from .connectivity_status import ConnectivityStatus
 
 class PodFactory:
     """Factory for creating Pod objects"""
-    def build_pods(self, pods_response: Dict[str, Any]) -> List[Pod]:
-        """Build a number of pod objects based off of a response from pod point"""
+    def build_pods(self, pods_response: Dict[str, Any], lazy: bool = False) -> List[Pod]:
+        """Build a number of pod objects based off of a response from pod point. With
+        `lazy` set, each pod's nested objects are built when first accessed."""
         pods = []
 
         pods_data = pods_response.get('pods', None)  if pods_response is not None else None
@@ -18,7 +19,7 @@ class PodFactory:
             return pods
 
         for pod_data in pods_data:
-            pods.append(Pod(data=pod_data))
+            pods.append(Pod(data=pod_data, lazy=lazy))
 
         return pods
 
@@ -0,0 +1,235 @@
+"""Polls many Pod Point accounts from one process"""
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Union
+
+import aiohttp
+
+from .client import PodPointClient
+from .helpers.auth import DEFAULT_REFRESH_MARGIN
+from .helpers.connection_pool import ConnectionPool
+from .helpers.functions import async_sleep
+from .pod import Pod
+
+DEFAULT_FLEET_CONCURRENCY = 10
+DEFAULT_POLL_INTERVAL = 60.0
+DEFAULT_POLL_JITTER = 15.0
+DEFAULT_REFRESH_JITTER = timedelta(minutes=10)
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+Poll = Callable[[PodPointClient], Awaitable[Any]]
+
+
+async def poll_pods(client: PodPointClient) -> List[Pod]:
+    """The default poll, all of an account's pods with their firmware, connectivity
+    status and charge override refreshed"""
+    pods = await client.async_get_all_pods()
+    return await client.async_refresh_pods(pods=pods)
+
+
+@dataclass
+class FleetResult:
+    """The outcome of polling one account. `value` is whatever the poll returned,
+    the account's pods by default, and is None if the poll failed with `error`."""
+    username: str
+    cycle: int
+    value: Any = None
+    error: Union[None, Exception] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Did the poll succeed"""
+        return self.error is None
+
+
+@dataclass
+class FleetCycle:
+    """The results of polling every account once, in the order accounts were added"""
+    number: int
+    results: List[FleetResult] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> List[FleetResult]:
+        """Results of the accounts polled successfully"""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[FleetResult]:
+        """Results of the accounts that could not be polled"""
+        return [result for result in self.results if not result.ok]
+
+
+class PodPointFleet:
+    """Polls many accounts, each with its own PodPointClient, over one shared
+    connection pool. At most `concurrency` accounts are polled at once, and each
+    account's poll in a cycle starts after a random delay of up to `jitter`
+    seconds, so that polls do not align. Once an account has logged in, its
+    access token is refreshed in the background, between `refresh_margin` and
+    `refresh_margin + refresh_jitter` before it expires, so refreshes are spread
+    out rather than all falling due together.
+
+    `poll` is called with an account's client and returns that account's result,
+    by default its pods. Any other keyword arguments are passed to every client,
+    e.g. a shared rate_limiter or circuit_breaker. Caches must not be shared
+    between accounts, pass those to `add_account` instead."""
+    def __init__(
+        self,
+        session: Union[aiohttp.ClientSession, ConnectionPool, None] = None,
+        concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+        poll: Poll = None,
+        background_refresh: bool = True,
+        refresh_margin: timedelta = DEFAULT_REFRESH_MARGIN,
+        refresh_jitter: timedelta = DEFAULT_REFRESH_JITTER,
+        sleep: Callable[[float], Awaitable[None]] = None,
+        **client_kwargs: Any
+    ) -> None:
+        self.concurrency: int = max(concurrency, 1)
+        self.interval: float = interval
+        self.jitter: float = jitter
+        self.background_refresh: bool = background_refresh
+        self.refresh_margin: timedelta = refresh_margin
+        self.refresh_jitter: timedelta = refresh_jitter
+        self._poll: Poll = poll if poll is not None else poll_pods
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._client_kwargs: Dict[str, Any] = client_kwargs
+        self._owns_session: bool = session is None
+        self._session = (
+            session if session is not None else ConnectionPool(limit_per_host=self.concurrency)
+        )
+        self._clients: Dict[str, PodPointClient] = {}
+        self._refresh_margins: Dict[str, timedelta] = {}
+        self._semaphore: asyncio.Semaphore = None
+        self._cycles: int = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @property
+    def clients(self) -> Dict[str, PodPointClient]:
+        """The client for each account, by username"""
+        return dict(self._clients)
+
+    def add_account(self, username: str, password: str, **client_kwargs: Any) -> PodPointClient:
+        """Add an account to the fleet, returning its client. Keyword arguments are
+        passed to this account's client, overriding those given to the fleet."""
+        if username in self._clients:
+            raise ValueError(f"Account '{username}' is already in the fleet")
+
+        client = PodPointClient(
+            username=username,
+            password=password,
+            session=self._session,
+            **{**self._client_kwargs, **client_kwargs}
+        )
+        self._clients[username] = client
+        self._refresh_margins[username] = self.refresh_margin + timedelta(
+            seconds=random.uniform(0, self.refresh_jitter.total_seconds())
+        )
+
+        return client
+
+    async def remove_account(self, username: str) -> None:
+        """Remove an account from the fleet, stopping its background refresh"""
+        client = self._clients.pop(username)
+        self._refresh_margins.pop(username, None)
+        await client.async_close()
+
+    async def async_iter_poll(self) -> AsyncIterator[FleetResult]:
+        """Poll every account once, yielding each result as soon as it is ready"""
+        self._cycles += 1
+        cycle = self._cycles
+
+        tasks = [
+            asyncio.ensure_future(self.__poll_account(username, client, cycle))
+            for username, client in self._clients.items()
+        ]
+
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # The caller stopped iterating early, don't leave polls behind
+            for task in tasks:
+                task.cancel()
+
+    async def async_poll(self) -> FleetCycle:
+        """Poll every account once"""
+        started = time.monotonic()
+        order = {username: index for index, username in enumerate(self._clients)}
+
+        results = [result async for result in self.async_iter_poll()]
+        results.sort(key=lambda result: order.get(result.username, len(order)))
+
+        return FleetCycle(
+            number=self._cycles,
+            results=results,
+            duration=time.monotonic() - started
+        )
+
+    async def async_iter_cycles(self, cycles: int = None) -> AsyncIterator[FleetCycle]:
+        """Poll every account every `interval` seconds, yielding the results of each
+        cycle, forever or for `cycles` cycles. A cycle that takes longer than
+        `interval` is followed immediately by the next."""
+        completed = 0
+        while cycles is None or completed < cycles:
+            if completed > 0:
+                await async_sleep(max(self.interval - cycle.duration, 0), sleep=self._sleep)
+
+            cycle = await self.async_poll()
+            completed += 1
+
+            _LOGGER.debug(
+                "Fleet poll %s complete in %.2fs, %s of %s accounts failed",
+                cycle.number,
+                cycle.duration,
+                len(cycle.failed),
+                len(cycle.results)
+            )
+            yield cycle
+
+    async def async_close(self) -> None:
+        """Stop every account's background refresh and close the fleet's connection
+        pool, if the fleet created it"""
+        await asyncio.gather(*[client.async_close() for client in self._clients.values()])
+
+        if self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self) -> "PodPointFleet":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.async_close()
+
+    async def __poll_account(self, username: str, client: PodPointClient, cycle: int) -> FleetResult:
+        if self.jitter > 0:
+            await async_sleep(random.uniform(0, self.jitter), sleep=self._sleep)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        result = FleetResult(username=username, cycle=cycle)
+        async with self._semaphore:
+            started = time.monotonic()
+            try:
+                result.value = await self._poll(client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:  # pylint: disable=broad-except
+                _LOGGER.warning("Unable to poll account %s - %s", username, exception)
+                result.error = exception
+            result.duration = time.monotonic() - started
+
+        if self.background_refresh and client.auth.access_token_set():
+            client.auth.start_background_refresh(margin=self._refresh_margins[username])
+
+        return result
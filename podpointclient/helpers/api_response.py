@@ -0,0 +1,137 @@
+"""Responses returned by the APIWrapper"""
+import json
+from typing import Any, Callable, Dict, Mapping
+
+import aiohttp
+
+DEFAULT_ENCODING = "utf-8"
+
+_UNSET = object()
+
+
+class APIResponse:
+    """A response from the pod point API. By default the body has already been
+    read and the connection released back to the pool, so a response can be kept,
+    or dropped, without tying up a connection. Streamed responses hold their
+    connection until the body is read or `release` is called, use them as an async
+    context manager to make sure they are released."""
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes = None,
+        encoding: str = None,
+        response: aiohttp.ClientResponse = None
+    ) -> None:
+        self.method: str = method
+        self.url: str = url
+        self.status: int = status
+        self.headers: Mapping[str, str] = headers
+        self.encoding: str = encoding if encoding is not None else DEFAULT_ENCODING
+        self._body: bytes = body
+        self._response: aiohttp.ClientResponse = response
+        self._json: Any = _UNSET
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    async def read(cls, method: str, response: aiohttp.ClientResponse) -> "APIResponse":
+        """Read the whole body of an aiohttp response and release its connection"""
+        try:
+            body = await response.read()
+        finally:
+            response.release()
+
+        return cls(
+            method=method,
+            url=str(response.url),
+            status=response.status,
+            headers=response.headers,
+            body=body,
+            encoding=response.charset
+        )
+
+    @classmethod
+    def stream(cls, method: str, response: aiohttp.ClientResponse) -> "APIResponse":
+        """Wrap an aiohttp response without reading its body"""
+        return cls(
+            method=method,
+            url=str(response.url),
+            status=response.status,
+            headers=response.headers,
+            encoding=response.charset,
+            response=response
+        )
+
+    @property
+    def streaming(self) -> bool:
+        """Is the body still to be read from the connection"""
+        return self._body is None and self._response is not None
+
+    @property
+    def content(self) -> aiohttp.StreamReader:
+        """The stream reader for a streamed response"""
+        if self._response is None:
+            raise RuntimeError("Response body has already been read, use body instead")
+
+        return self._response.content
+
+    @property
+    def body(self) -> bytes:
+        """The raw body of a response that has been read"""
+        if self._body is None:
+            raise RuntimeError("Response body has not been read, await read_body() first")
+
+        return self._body
+
+    async def read_body(self) -> bytes:
+        """Return the raw body, reading and releasing a streamed response if needed"""
+        if self._body is None:
+            if self._response is None:
+                self._body = b""
+            else:
+                try:
+                    self._body = await self._response.read()
+                finally:
+                    self.release()
+
+        return self._body
+
+    async def text(self, encoding: str = None) -> str:
+        """Return the body decoded as text"""
+        body = await self.read_body()
+
+        return body.decode(encoding if encoding is not None else self.encoding)
+
+    async def json(self, loads: Callable[[str], Any] = json.loads) -> Any:
+        """Return the body decoded as JSON, or None if the body is empty. The decoded
+        JSON is kept, so a cached response is only decoded once."""
+        if self._json is _UNSET:
+            text = await self.text()
+            self._json = loads(text) if text.strip() else None
+
+        return self._json
+
+    def memo(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return the value built from this response under `key`, calling `build`
+        the first time. Used to keep models parsed from a cached response."""
+        if key not in self._memo:
+            self._memo[key] = build()
+
+        return self._memo[key]
+
+    def release(self) -> None:
+        """Release the connection held by a streamed response"""
+        if self._response is not None:
+            self._response.release()
+            self._response = None
+
+    async def __aenter__(self) -> "APIResponse":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"<APIResponse {self.method.upper()} {self.url} [{self.status}]>"
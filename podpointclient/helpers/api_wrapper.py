@@ -1,6 +1,6 @@
 """Wrapper around calls to the pod point API"""
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Union
 import time
 import logging
 from socket import gaierror
@@ -8,6 +8,14 @@ import aiohttp
 import async_timeout
 
 from ..errors import APIError, AuthError, SessionError, ApiConnectionError
+from .retry import RetryPolicy
+from .rate_limiter import RateLimiter
+from .circuit_breaker import CircuitBreaker
+from .timeouts import RequestTimeout
+from .api_response import APIResponse
+from .http_cache import HTTPCache
+from .coalescer import RequestCoalescer
+from .functions import request_key
 
 TIMEOUT=10
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
@@ -15,44 +23,146 @@ HEADERS = {"Content-type": "application/json; charset=UTF-8"}
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+class _RetryableStatusError(Exception):
+    """Raised internally when a response has a status that should be retried"""
+    def __init__(self, status: int, retry_after: str = None):
+        super().__init__(f'Retryable status {status}')
+        self.status: int = status
+        self.retry_after: str = retry_after
+
+
 class APIWrapper:
     """Wrapper around calls to the pod point API"""
-    def __init__(self, session: aiohttp.ClientSession, timeout: int = TIMEOUT) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        timeout: int = TIMEOUT,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        circuit_breaker: CircuitBreaker = None,
+        http_cache: HTTPCache = None,
+        coalescer: RequestCoalescer = None
+    ) -> None:
         self._timeout: int = timeout
         self._session: aiohttp.ClientSession = session
+        self._retry_policy: RetryPolicy = retry_policy
+        self._rate_limiter: RateLimiter = rate_limiter
+        self._circuit_breaker: CircuitBreaker = circuit_breaker
+        self._http_cache: HTTPCache = http_cache
+        self._coalescer: RequestCoalescer = coalescer
 
     async def get(
         self,
         url: str,
         headers: Dict[str, Any],
         params: Dict[str, Any] = None,
-        exception_class=APIError
-    ) -> aiohttp.ClientResponse:
-        """Make a GET request"""
-        return await self.__wrapper(
+        exception_class=APIError,
+        timeout: Union[RequestTimeout, float] = None,
+        stream: bool = False
+    ) -> APIResponse:
+        """Make a GET request. Unless `stream` is set the body is read and the
+        connection released before returning, the HTTP cache is used if set, and
+        identical GETs already in flight are shared if there is a coalescer. Only
+        GETs with the same timeout are shared, so no caller waits longer, or gives
+        up sooner, than its own timeout allows."""
+        if stream:
+            return await self.__wrapper(
+                method="get",
+                url=url,
+                params=params,
+                headers=headers,
+                exception_class=exception_class,
+                timeout=timeout,
+                stream=stream
+            )
+
+        async def request() -> APIResponse:
+            return await self.__get(
+                url=url,
+                headers=headers,
+                params=params,
+                exception_class=exception_class,
+                timeout=timeout
+            )
+
+        if self._coalescer is None:
+            return await request()
+
+        timeout_key = RequestTimeout.coerce(timeout)
+        if timeout_key is not None:
+            timeout_key = timeout_key.key
+
+        return await self._coalescer.run(
+            key=(*request_key(method="get", url=url, params=params), timeout_key),
+            request=request
+        )
+
+    async def __get(
+        self,
+        url: str,
+        headers: Dict[str, Any],
+        params: Dict[str, Any] = None,
+        exception_class=APIError,
+        timeout: Union[RequestTimeout, float] = None
+    ) -> APIResponse:
+        """Make a GET request, using the HTTP cache if set"""
+        cache = self._http_cache
+        if cache is None:
+            return await self.__wrapper(
+                method="get",
+                url=url,
+                params=params,
+                headers=headers,
+                exception_class=exception_class,
+                timeout=timeout
+            )
+
+        key = cache.key_for(url=url, params=params)
+        generation = cache.generation
+        entry = cache.get(key)
+        if entry is not None and cache.fresh(entry):
+            _LOGGER.debug("Using cached %s", url)
+            return entry.response
+
+        if entry is not None:
+            headers = {**(headers or {}), **entry.validators}
+
+        response = await self.__wrapper(
             method="get",
             url=url,
             params=params,
             headers=headers,
-            exception_class=exception_class
+            exception_class=exception_class,
+            timeout=timeout,
+            not_modified=entry is not None
         )
 
+        if response.status == 304 and entry is not None:
+            return cache.revalidated(entry=entry, response=response)
+
+        if response.status == 200:
+            cache.store(key=key, response=response, generation=generation)
+
+        return response
+
     async def put(
         self,
         url: str,
         body: Any,
         headers: Dict[str, Any],
         params: Dict[str, Any] = None,
-        exception_class=APIError
-    ) -> aiohttp.ClientResponse:
+        exception_class=APIError,
+        timeout: Union[RequestTimeout, float] = None
+    ) -> APIResponse:
         """Make a PUT request"""
-        return await self.__wrapper(
+        return await self.__write(
             method="put",
             url=url,
             params=params,
             data=body,
             headers=headers,
-            exception_class=exception_class
+            exception_class=exception_class,
+            timeout=timeout
         )
 
     async def post(
@@ -61,8 +171,9 @@ class APIWrapper:
         body: Any,
         headers: Dict[str, Any],
         params: Dict[str, Any] = None,
-        exception_class=APIError
-    ) -> aiohttp.ClientResponse:
+        exception_class=APIError,
+        timeout: Union[RequestTimeout, float] = None
+    ) -> APIResponse:
         """Make a POST request"""
         return await self.__wrapper(
             method="post",
@@ -70,7 +181,8 @@ class APIWrapper:
             params=params,
             data=body,
             headers=headers,
-            exception_class=exception_class
+            exception_class=exception_class,
+            timeout=timeout
         )
 
     async def delete(
@@ -78,17 +190,34 @@ class APIWrapper:
         url: str,
         headers: Dict[str, Any],
         params: Dict[str, Any] = None,
-        exception_class=APIError
-    ) -> aiohttp.ClientResponse:
-        """Make a GET request"""
-        return await self.__wrapper(
+        exception_class=APIError,
+        timeout: Union[RequestTimeout, float] = None
+    ) -> APIResponse:
+        """Make a DELETE request"""
+        return await self.__write(
             method="delete",
             url=url,
             params=params,
             headers=headers,
-            exception_class=exception_class
+            exception_class=exception_class,
+            timeout=timeout
         )
 
+    async def __write(self, **kwargs) -> APIResponse:
+        """Make a request that changes data, clearing the HTTP cache once it succeeds
+        so stale pods and charge overrides are not served from it. Reads made after
+        the write do not join reads that were in flight before it."""
+        try:
+            response = await self.__wrapper(**kwargs)
+        finally:
+            if self._coalescer is not None:
+                self._coalescer.forget()
+
+        if self._http_cache is not None:
+            self._http_cache.clear()
+
+        return response
+
     async def __wrapper(
         self,
         method: str,
@@ -96,9 +225,73 @@ class APIWrapper:
         data: Dict[str, Any] = None,
         headers: Dict[str, Any] = None,
         params: Dict[str, Any] = None,
-        exception_class=APIError
-    ) -> aiohttp.ClientResponse:
-        """Get information from the API."""
+        exception_class=APIError,
+        timeout: Union[RequestTimeout, float] = None,
+        stream: bool = False,
+        not_modified: bool = False
+    ) -> APIResponse:
+        """Get information from the API, retrying according to the retry policy. Each
+        attempt uses `timeout` if given, otherwise the wrapper's total timeout."""
+        timeout = RequestTimeout.coerce(timeout)
+        policy = self._retry_policy
+        attempt = 1
+
+        while True:
+            retry = policy is not None and policy.can_retry(method=method, attempt=attempt)
+
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(url)
+
+            try:
+                return await self.__request(
+                    method=method,
+                    url=url,
+                    data=data,
+                    headers=headers,
+                    params=params,
+                    exception_class=exception_class,
+                    retry_statuses=policy.retry_statuses if retry else (),
+                    timeout=timeout,
+                    stream=stream,
+                    not_modified=not_modified
+                )
+            except _RetryableStatusError as exception:
+                delay = policy.delay(attempt=attempt, retry_after=exception.retry_after)
+                reason = f"status {exception.status}"
+            except ApiConnectionError as exception:
+                if not retry or not policy.retries_exception(exception.__cause__):
+                    raise exception
+
+                delay = policy.delay(attempt=attempt)
+                reason = str(exception)
+
+            _LOGGER.debug(
+                "Retrying %s %s in %.2fs (attempt %s of %s) after %s",
+                method.upper(),
+                url,
+                delay,
+                attempt + 1,
+                policy.max_attempts,
+                reason
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __request(
+        self,
+        method: str,
+        url: str,
+        data: Dict[str, Any] = None,
+        headers: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        exception_class=APIError,
+        retry_statuses=(),
+        timeout: RequestTimeout = None,
+        stream: bool = False,
+        not_modified: bool = False
+    ) -> APIResponse:
+        """Make a single request to the API. A 304 is only accepted when
+        `not_modified` is set, for a conditional request."""
         if data is None:
             data = {}
         if headers is None:
@@ -106,42 +299,40 @@ class APIWrapper:
         if params is None:
             params = {}
 
+        total_timeout = self._timeout
+        request_kwargs = {"headers": headers, "params": params}
+        if timeout is not None:
+            total_timeout = timeout.total
+            request_kwargs["timeout"] = timeout.client_timeout
+
+        breaker = self._circuit_breaker
+        if breaker is not None:
+            breaker.before_request(url)
+        # Is the upstream host healthy, None if the request never completed
+        healthy = None
+        response = None
+        # Has a streamed response been handed to the caller, who must release it
+        streamed = False
+
         try:
-            async with async_timeout.timeout(self._timeout):
+            async with async_timeout.timeout(total_timeout):
                 start_time = time.time()
                 _LOGGER.debug("%s %s %s %s",method.upper(), url, params, data)
 
-                response = None
-
                 if method == "get":
-                    response = await self._session.get(url, headers=headers, params=params)
+                    response = await self._session.get(url, **request_kwargs)
 
                 elif method == "put":
-                    response = await self._session.put(
-                        url,
-                        headers=headers,
-                        params=params,
-                        json=data
-                    )
+                    response = await self._session.put(url, json=data, **request_kwargs)
 
                 elif method == "post":
                     if isinstance(data, str):
-                        response = await self._session.post(
-                            url,
-                            headers=headers,
-                            params=params,
-                            data=data
-                        )
+                        response = await self._session.post(url, data=data, **request_kwargs)
                     else:
-                        response = await self._session.post(
-                            url,
-                            headers=headers,
-                            params=params,
-                            json=data
-                        )
+                        response = await self._session.post(url, json=data, **request_kwargs)
 
                 elif method == "delete":
-                    response = await self._session.delete(url, headers=headers, params=params)
+                    response = await self._session.delete(url, **request_kwargs)
 
                 else:
                     raise ValueError(f'Method \'{method}\' not supported')
@@ -154,16 +345,29 @@ Received a None response when querying."
 
                 end_time = time.time()
                 _LOGGER.debug("%s - %ss", response.status, end_time - start_time)
+                healthy = response.status < 500
+
+                if response.status in retry_statuses:
+                    retry_after = response.headers.get('Retry-After', None)
+                    raise _RetryableStatusError(response.status, retry_after)
 
-                if response.status < 200 or response.status > 204:
+                accepted = 200 <= response.status <= 204 or (
+                    not_modified and response.status == 304
+                )
+                if not accepted:
                     await self.__handle_response_error(
                         response=response,
                         exception_class=exception_class
                     )
 
-                return response
+                if stream:
+                    streamed = True
+                    return APIResponse.stream(method=method, response=response)
+
+                return await APIResponse.read(method=method, response=response)
 
         except asyncio.TimeoutError as exception:
+            healthy = False
             message = f"Timeout error fetching information from {url} - {exception}"
             raise ApiConnectionError(message) from exception
 
@@ -176,9 +380,13 @@ Received a None response when querying."
             raise exception
 
         except (aiohttp.ClientError, gaierror) as exception:
+            healthy = False
             message = f"Error connecting to Pod Point ({url}) - {exception}"
             raise ApiConnectionError(message) from exception
 
+        except _RetryableStatusError as exception:
+            raise exception
+
         except (AuthError, SessionError) as exception:
             _LOGGER.error(
                 "Authentication error when creating auth or session. (%s)",
@@ -190,6 +398,18 @@ Received a None response when querying."
             _LOGGER.error("Something really wrong happened")
             raise exception
 
+        finally:
+            if response is not None and not streamed:
+                response.release()
+
+            if breaker is not None:
+                if healthy is True:
+                    breaker.record_success(url)
+                elif healthy is False:
+                    breaker.record_failure(url)
+                else:
+                    breaker.release(url)
+
     async def __handle_response_error(self, response: aiohttp.ClientResponse, exception_class):
         status = response.status
         response = await response.text()
@@ -1,15 +1,23 @@
 """Auth module for pod point, handled access token lifecycle."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from typing import Awaitable, Callable
 
 import aiohttp
 
 from ..errors import APIError, AuthError, SessionError
 from .session import Session
+from .credential_store import CredentialStore
 from ..endpoints import GOOGLE_BASE_URL, PASSWORD_VERIFY, GOOGLE_TOKEN_BASE_URL, TOKEN
-from .functions import HEADERS
+from .functions import HEADERS, async_sleep
 from .api_wrapper import APIWrapper
+from .timeouts import RequestTimeout
+
+DEFAULT_REFRESH_MARGIN = timedelta(minutes=5)
+BACKGROUND_REFRESH_MIN_INTERVAL = 30
+BACKGROUND_REFRESH_RETRY_INTERVAL = 30
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -20,7 +28,12 @@ class Auth():
         email: str,
         password: str,
         session: aiohttp.ClientSession,
-        http_debug: bool = None
+        http_debug: bool = None,
+        clock: Callable[[], datetime] = None,
+        sleep: Callable[[float], Awaitable[None]] = None,
+        credential_store: CredentialStore = None,
+        api_wrapper: APIWrapper = None,
+        timeout: RequestTimeout = None
     ):
         self.email: str = email
         self.password: str = password
@@ -29,8 +42,17 @@ class Auth():
         self.access_token_expiry: datetime = None
         self.session: Session = None
         self._session: aiohttp.ClientSession = session
-        self._api_wrapper: APIWrapper = APIWrapper(session=self._session)
+        self._api_wrapper: APIWrapper = (
+            api_wrapper if api_wrapper is not None else APIWrapper(session=self._session)
+        )
         self._http_debug: bool = http_debug if http_debug is not None else False
+        self._timeout: RequestTimeout = timeout
+        self._update_task: asyncio.Future = None
+        self._background_refresh_task: asyncio.Task = None
+        self._clock: Callable[[], datetime] = clock
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._credential_store: CredentialStore = credential_store
+        self._credentials_loaded: bool = False
 
     @property
     def user_id(self):
@@ -52,35 +74,189 @@ class Auth():
 
     def access_token_expired(self) -> bool:
         """Is the current access token expired"""
-        return self.access_token_set() and datetime.now() > self.access_token_expiry
+        return self.access_token_set() and self._now() > self.access_token_expiry
+
+    async def async_update_access_token(self, force: bool = False) -> bool:
+        """Update access token, if needed, or always when `force` is set. Concurrent
+        callers share a single in-flight update, so only one token request and
+        session creation is made."""
+        if self._credential_store is not None and self._credentials_loaded is False:
+            self._credentials_loaded = True
+            self.__load_credentials()
 
-    async def async_update_access_token(self) -> bool:
-        """Update access token, if needed."""
-        if self.check_access_token():
+        if force is False and self.check_access_token():
             return True
 
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.ensure_future(
+                self.__async_update_access_token(force=force)
+            )
+
+        # Shield the shared update so that one cancelled caller does not cancel it
+        # for everyone else
+        return await asyncio.shield(self._update_task)
+
+    def invalidate_session(self) -> None:
+        """Discard the current session and tokens, e.g. after the API has rejected
+        them. The next access token update logs in with the password and creates a
+        new session."""
+        self.session = None
+        self.access_token = None
+        self.refresh_token = None
+        self.access_token_expiry = None
+
+        if self._credential_store is not None:
+            try:
+                self._credential_store.clear(self.email)
+            except OSError as exception:
+                _LOGGER.warning("Unable to clear stored credentials. %s", exception)
+
+    def start_background_refresh(
+        self,
+        margin: timedelta = DEFAULT_REFRESH_MARGIN
+    ) -> asyncio.Task:
+        """Start a background task that refreshes the access token `margin` before
+        it expires, so requests do not have to wait for auth in steady state."""
+        if self._background_refresh_task is None or self._background_refresh_task.done():
+            self._background_refresh_task = asyncio.ensure_future(
+                self.__async_background_refresh(margin=margin)
+            )
+
+        return self._background_refresh_task
+
+    async def stop_background_refresh(self) -> None:
+        """Stop the background refresh task, if running"""
+        task = self._background_refresh_task
+        self._background_refresh_task = None
+
+        if task is None or task.done():
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def __async_background_refresh(self, margin: timedelta) -> None:
+        min_interval = 0
+        while True:
+            delay = 0
+            if self.access_token_set():
+                delay = (self.access_token_expiry - margin - self._now()).total_seconds()
+
+            # Never refresh in a tight loop, e.g. if the margin is longer than the
+            # lifetime of a token
+            await async_sleep(max(delay, min_interval), sleep=self._sleep)
+            min_interval = BACKGROUND_REFRESH_MIN_INTERVAL
+
+            try:
+                _LOGGER.debug('Refreshing access token in the background')
+                await self.async_update_access_token(force=True)
+            except APIError as exception:
+                _LOGGER.warning(
+                    "Background access token refresh failed, retrying in %ss. %s",
+                    BACKGROUND_REFRESH_RETRY_INTERVAL,
+                    exception
+                )
+                await async_sleep(BACKGROUND_REFRESH_RETRY_INTERVAL, sleep=self._sleep)
+
+    def __load_credentials(self) -> None:
+        credentials = self._credential_store.load(self.email)
+        if not credentials:
+            return
+
+        try:
+            expiry = datetime.fromisoformat(credentials['access_token_expiry'])
+            access_token = credentials['access_token']
+            refresh_token = credentials['refresh_token']
+            user_id = credentials['user_id']
+            session_id = credentials.get('session_id', None)
+        except (KeyError, TypeError, ValueError) as exception:
+            _LOGGER.warning("Ignoring invalid stored credentials. %s", exception)
+            return
+
+        _LOGGER.debug("Loaded stored credentials. Expiration: %s", expiry)
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.access_token_expiry = expiry
+        self.session = Session(
+            email=self.email,
+            password=self.password,
+            access_token=self.access_token,
+            session=self._session,
+            http_debug=self._http_debug,
+            api_wrapper=self._api_wrapper,
+            timeout=self._timeout
+        )
+        self.session.user_id = user_id
+        self.session.session_id = session_id
+
+    def __save_credentials(self) -> None:
+        if self._credential_store is None:
+            return
+
+        try:
+            self._credential_store.save(self.email, {
+                "access_token": self.access_token,
+                "refresh_token": self.refresh_token,
+                "access_token_expiry": self.access_token_expiry.isoformat(),
+                "user_id": self.session.user_id,
+                "session_id": self.session.session_id
+            })
+        except OSError as exception:
+            _LOGGER.warning("Unable to store credentials. %s", exception)
+
+    def _now(self) -> datetime:
+        """Current time, from the injected clock if one was given"""
+        if self._clock is not None:
+            return self._clock()
+
+        return datetime.now()
+
+    async def __async_update_access_token(self, force: bool = False) -> bool:
         try:
             _LOGGER.debug('Updating access token')
-            access_token_updated: bool = await self.__update_access_token(
-                refresh=self.access_token_expired()
-            )
+            refresh = self.access_token_expired() or (force and self.access_token_set())
+            try:
+                access_token_updated: bool = await self.__update_access_token(refresh=refresh)
+            except AuthError as exception:
+                if refresh is False:
+                    raise
+
+                # The refresh token may be expired or revoked, e.g. one loaded from
+                # the credential store. Discard it so it is not used again.
+                _LOGGER.warning("Unable to refresh access token, logging in again. %s", exception)
+                self.invalidate_session()
+                access_token_updated = await self.__update_access_token(refresh=False)
 
             _LOGGER.debug(
                 "Updated access token. New expiration: %s",
                 self.access_token_expiry
             )
 
-            self.session = Session(
-                email=self.email,
-                password=self.password,
-                access_token=self.access_token,
-                session=self._session,
-                http_debug=self._http_debug
-            )
-            session_created = await self.session.create()
+            if self.session is not None and self.session.user_id is not None:
+                # The user a session belongs to cannot change between token
+                # refreshes, so keep using it rather than creating a new one
+                _LOGGER.debug('Reusing existing session')
+                self.session.access_token = self.access_token
+                session_created = True
+            else:
+                self.session = Session(
+                    email=self.email,
+                    password=self.password,
+                    access_token=self.access_token,
+                    session=self._session,
+                    http_debug=self._http_debug,
+                    api_wrapper=self._api_wrapper,
+                    timeout=self._timeout
+                )
+                session_created = await self.session.create()
 
             if session_created is False:
                 _LOGGER.error("Error creating session")
+            elif access_token_updated:
+                self.__save_credentials()
 
             return access_token_updated and session_created
         except AuthError as exception:
@@ -97,8 +273,6 @@ class Auth():
         expires_in_response = 'expiresIn'
 
         try:
-            wrapper = APIWrapper(session=self._session)
-
             if refresh:
                 _LOGGER.debug('Refreshing access token')
                 headers = HEADERS.copy()
@@ -117,11 +291,12 @@ class Auth():
                 body = {"email": self.email, "returnSecureToken": True, "password": self.password}
                 headers = HEADERS.copy()
 
-            response = await wrapper.post(
+            response = await self._api_wrapper.post(
                 url=url,
                 body=body,
                 headers=headers,
-                exception_class=AuthError)
+                exception_class=AuthError,
+                timeout=self._timeout)
 
             if response.status != 200:
                 await self.__handle_response_error(response, AuthError)
@@ -129,7 +304,7 @@ class Auth():
             json = await response.json()
             self.access_token = json[id_token_response]
             self.refresh_token = json[refresh_token_response]
-            self.access_token_expiry = datetime.now() + timedelta(
+            self.access_token_expiry = self._now() + timedelta(
                 seconds=int(json[expires_in_response]) - 10
             )
             return_value = True
@@ -0,0 +1,134 @@
+"""Circuit breaker, used to fail fast while an upstream host is unavailable"""
+from dataclasses import dataclass
+import logging
+import time
+from typing import Callable, Dict
+from urllib.parse import urlsplit
+
+from strenum import StrEnum
+
+from ..errors import CircuitOpenError
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class CircuitState(StrEnum):
+    """An ENUM representing the state of a circuit"""
+    CLOSED    = "closed"
+    OPEN      = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    """Tracked state for a single host"""
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probe_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """Per host circuit breaker. After `failure_threshold` consecutive failures the
+    circuit opens and requests fail fast with CircuitOpenError. Once
+    `recovery_timeout` seconds have passed a single probe request is let through
+    (half open). If it succeeds the circuit closes, otherwise it opens again."""
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = None
+    ) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self._clock: Callable[[], float] = clock if clock is not None else time.monotonic
+        self._circuits: Dict[str, _Circuit] = {}
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """The circuit key, the host, for a given URL or host"""
+        return urlsplit(url).hostname or url
+
+    def state(self, url: str) -> CircuitState:
+        """The current state of the circuit for a URL or host"""
+        circuit = self.__circuit(url)
+        self.__check_recovery(circuit)
+        return circuit.state
+
+    def is_available(self, url: str) -> bool:
+        """Would a request to a URL or host be let through right now"""
+        circuit = self.__circuit(url)
+        self.__check_recovery(circuit)
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            return circuit.probe_in_flight is False
+
+        return circuit.state == CircuitState.CLOSED
+
+    def before_request(self, url: str) -> None:
+        """Raise CircuitOpenError if a request to a URL should not be made"""
+        circuit = self.__circuit(url)
+        self.__check_recovery(circuit)
+
+        if circuit.state == CircuitState.OPEN:
+            raise CircuitOpenError(self.key_for(url))
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            if circuit.probe_in_flight:
+                raise CircuitOpenError(self.key_for(url))
+
+            circuit.probe_in_flight = True
+
+    def record_success(self, url: str) -> None:
+        """Record a successful request, closing the circuit"""
+        circuit = self.__circuit(url)
+
+        if circuit.state != CircuitState.CLOSED:
+            _LOGGER.info("Circuit for %s closed", self.key_for(url))
+
+        circuit.state = CircuitState.CLOSED
+        circuit.failures = 0
+        circuit.probe_in_flight = False
+
+    def record_failure(self, url: str) -> None:
+        """Record a failed request, opening the circuit if needed"""
+        circuit = self.__circuit(url)
+        circuit.failures += 1
+        circuit.probe_in_flight = False
+
+        if circuit.state == CircuitState.HALF_OPEN or circuit.failures >= self.failure_threshold:
+            if circuit.state != CircuitState.OPEN:
+                _LOGGER.warning(
+                    "Circuit for %s opened after %s consecutive failure(s)",
+                    self.key_for(url),
+                    circuit.failures
+                )
+
+            circuit.state = CircuitState.OPEN
+            circuit.opened_at = self._clock()
+
+    def release(self, url: str) -> None:
+        """Release a half open probe without recording an outcome, e.g. if the
+        request was cancelled"""
+        self.__circuit(url).probe_in_flight = False
+
+    def __circuit(self, url: str) -> _Circuit:
+        key = self.key_for(url)
+
+        circuit = self._circuits.get(key, None)
+        if circuit is None:
+            circuit = _Circuit()
+            self._circuits[key] = circuit
+
+        return circuit
+
+    def __check_recovery(self, circuit: _Circuit) -> None:
+        if (
+            circuit.state == CircuitState.OPEN
+            and self._clock() - circuit.opened_at >= self.recovery_timeout
+        ):
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probe_in_flight = False
@@ -0,0 +1,44 @@
+"""Coalesces identical requests made while one is already in flight"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class RequestCoalescer:
+    """Shares one in-flight request between every caller making the same request.
+    The first caller starts the request, callers arriving before it completes wait
+    for, and receive, the same result or exception. A caller being cancelled does
+    not cancel the request for the others."""
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of `request`, or of the in-flight request for `key`"""
+        future = self._in_flight.get(key, None)
+
+        if future is None:
+            future = asyncio.ensure_future(request())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self.__done(key, done))
+        else:
+            _LOGGER.debug("Joining in-flight request %s", key)
+
+        return await asyncio.shield(future)
+
+    def forget(self) -> None:
+        """Stop sharing the requests in flight, later callers start new requests.
+        Their current callers still receive their results."""
+        self._in_flight.clear()
+
+    def __done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key, None) is future:
+            del self._in_flight[key]
+
+        # Retrieve the exception, all waiters may have been cancelled
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,85 @@
+"""Lazily created aiohttp connection pool with tunable connector limits"""
+import logging
+from typing import Any
+
+import aiohttp
+
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+DEFAULT_TTL_DNS_CACHE = 300
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class ConnectionPool:
+    """Owns an aiohttp.ClientSession backed by a tuned TCPConnector. The session is
+    only created on first use, so a pool can be constructed outside of an event loop.
+    A pool can be passed anywhere the client expects an aiohttp.ClientSession, and
+    can be shared between many clients."""
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: int = DEFAULT_TTL_DNS_CACHE
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: int = ttl_dns_cache
+        self._session: aiohttp.ClientSession = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the underlying session, creating it if needed"""
+        if self._session is None or self._session.closed:
+            _LOGGER.debug(
+                "Creating connection pool (limit: %s, limit per host: %s)",
+                self.limit,
+                self.limit_per_host
+            )
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.ttl_dns_cache
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        """Is there no open session in this pool"""
+        return self._session is None or self._session.closed
+
+    def get(self, url: str, **kwargs: Any):
+        """Make a GET request using the pooled session"""
+        return self.session.get(url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any):
+        """Make a PUT request using the pooled session"""
+        return self.session.put(url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        """Make a POST request using the pooled session"""
+        return self.session.post(url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any):
+        """Make a DELETE request using the pooled session"""
+        return self.session.delete(url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying session and all of its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+
+    async def __aenter__(self) -> "ConnectionPool":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,75 @@
+"""Credential stores, used to persist access tokens and sessions between restarts"""
+from abc import ABC, abstractmethod
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Union
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class CredentialStore(ABC):
+    """Base class for storing credentials for one or more accounts, keyed by email.
+    Credentials are a dictionary of access_token, refresh_token,
+    access_token_expiry, user_id and session_id. Passwords are never stored."""
+    @abstractmethod
+    def load(self, email: str) -> Union[None, Dict[str, Any]]:
+        """Load stored credentials for an account, if there are any"""
+
+    @abstractmethod
+    def save(self, email: str, credentials: Dict[str, Any]) -> None:
+        """Store credentials for an account"""
+
+    @abstractmethod
+    def clear(self, email: str) -> None:
+        """Remove stored credentials for an account"""
+
+
+class FileCredentialStore(CredentialStore):
+    """Stores credentials in a JSON file. Writes are atomic, the file is written
+    to a temporary file alongside it and then moved into place."""
+    def __init__(self, path: str) -> None:
+        self.path: str = os.path.expanduser(path)
+
+    def load(self, email: str) -> Union[None, Dict[str, Any]]:
+        return self.__read().get(email, None)
+
+    def save(self, email: str, credentials: Dict[str, Any]) -> None:
+        data = self.__read()
+        data[email] = credentials
+        self.__write(data)
+
+    def clear(self, email: str) -> None:
+        data = self.__read()
+        if data.pop(email, None) is not None:
+            self.__write(data)
+
+    def __read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exception:
+            _LOGGER.warning("Unable to read credentials from %s - %s", self.path, exception)
+            return {}
+
+        if not isinstance(data, dict):
+            _LOGGER.warning("Ignoring unexpected credentials in %s", self.path)
+            return {}
+
+        return data
+
+    def __write(self, data: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".credentials-")
+
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -1,15 +1,26 @@
 """A set of helper functions used internally"""
-from typing import Dict
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
 import logging
 from datetime import datetime
-import re
+from functools import lru_cache
 
 
 TIMEOUT=10
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
+DATETIME_CACHE_SIZE = 4096
+# Params that do not change the response, such as the timestamp cache-buster
+IGNORED_PARAMS = ("timestamp",)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+async def async_sleep(seconds: float, sleep: Callable[[float], Awaitable[None]] = None) -> None:
+    """Sleep for `seconds` with `sleep`, if one was injected, or asyncio.sleep"""
+    if sleep is not None:
+        await sleep(seconds)
+    else:
+        await asyncio.sleep(seconds)
+
 def auth_headers(access_token: str) -> Dict[str, str]:
     """Given an access token, return the headers we should send to pod point."""
     auth_header = {"Authorization": f"Bearer {access_token}"}
@@ -17,23 +28,47 @@ def auth_headers(access_token: str) -> Dict[str, str]:
     combined_headers.update(auth_header)
     return combined_headers
 
+def request_key(method: str, url: str, params: Dict[str, Any] = None) -> Tuple[Hashable, ...]:
+    """Given a request, return a key identifying it, ignoring the timestamp param
+    and the order of params."""
+    if params is None:
+        params = {}
+
+    return (
+        method.lower(),
+        url,
+        tuple(sorted(
+            (str(key), str(value))
+            for key, value in params.items()
+            if key not in IGNORED_PARAMS
+        ))
+    )
+
 def lazy_convert_to_datetime(date_string: str) -> datetime:
     """Convert a string datetime representation to a time-zoned datetime object."""
     if date_string is None or not isinstance(date_string, str):
         return None
 
-    # Convert a 'Z' ending string to +00:00 for correct support
-    date_string = re.sub(r"Z$", "+00:00", date_string)
-
     date_time = None
     # Example: 2022-01-25T09:00:00+00:00
     try:
-        date_time = datetime.fromisoformat(date_string)
+        date_time = _convert_to_datetime(date_string)
     except ValueError as error:
         _LOGGER.warning("Tried to convert '%s' to datetime but got: %s", date_string, error)
 
     return date_time
 
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _convert_to_datetime(date_string: str) -> datetime:
+    """Parse an ISO 8601 string. Results are cached, as the same timestamps are
+    often repeated across pods and charges, and datetimes are immutable. Strings
+    that fail to parse raise, so are not cached."""
+    # Convert a 'Z' ending string to +00:00 for correct support
+    if date_string.endswith("Z"):
+        date_string = date_string[:-1] + "+00:00"
+
+    return datetime.fromisoformat(date_string)
+
 def lazy_iso_format_datetime(date_time: datetime) -> str:
     """Format a datetime object into an iso_format, if a datetime is passed."""
     if not isinstance(date_time, datetime):
@@ -0,0 +1,134 @@
+"""HTTP cache for GET requests made to the pod point API"""
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple, Union
+
+from .api_response import APIResponse
+from .functions import request_key
+
+DEFAULT_MAX_ENTRIES = 256
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class CacheEntry:
+    """A cached response and the validators used to revalidate it"""
+    response: APIResponse
+    etag: Union[None, str]
+    last_modified: Union[None, str]
+    stored_at: float
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for this entry"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class HTTPCache:
+    """Caches successful GET responses. Responses with an ETag or Last-Modified
+    header are revalidated with a conditional request, and a 304 returns the
+    cached response. When `ttl` is set, responses younger than `ttl` seconds are
+    returned without making a request at all. The `timestamp` param is ignored
+    when matching requests. Use one cache per account.
+
+    Take the `generation` before making a request and pass it to `store`, so a
+    response read before the cache was cleared is not stored after it."""
+    def __init__(
+        self,
+        ttl: float = 0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = None
+    ) -> None:
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self._clock: Callable[[], float] = clock if clock is not None else time.monotonic
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._generation: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Increases each time the cache is cleared"""
+        return self._generation
+
+    @staticmethod
+    def key_for(url: str, params: Union[None, Dict[str, Any]]) -> CacheKey:
+        """The cache key for a GET request"""
+        return request_key(method="get", url=url, params=params)
+
+    def get(self, key: CacheKey) -> Union[None, CacheEntry]:
+        """Return the entry for a key, if there is one"""
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def fresh(self, entry: CacheEntry) -> bool:
+        """Can an entry be used without making a request"""
+        return self.ttl > 0 and (self._clock() - entry.stored_at) < self.ttl
+
+    def store(
+        self,
+        key: CacheKey,
+        response: APIResponse,
+        generation: Union[None, int] = None
+    ) -> Union[None, CacheEntry]:
+        """Cache a response if it can be reused, returning the new entry. A response
+        requested in an earlier `generation` is not stored."""
+        if generation is not None and generation != self._generation:
+            _LOGGER.debug("Not caching %s, the cache was cleared while it was requested", response.url)
+            return None
+
+        cache_control = response.headers.get("Cache-Control", "")
+        if "no-store" in cache_control.lower():
+            self._entries.pop(key, None)
+            return None
+
+        etag = response.headers.get("ETag", None)
+        last_modified = response.headers.get("Last-Modified", None)
+        if etag is None and last_modified is None and self.ttl <= 0:
+            self._entries.pop(key, None)
+            return None
+
+        entry = CacheEntry(
+            response=response,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=self._clock()
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def revalidated(self, entry: CacheEntry, response: APIResponse) -> APIResponse:
+        """Update an entry the server confirmed is unchanged with a 304 `response`,
+        returning the cached response"""
+        entry.etag = response.headers.get("ETag", entry.etag)
+        entry.last_modified = response.headers.get("Last-Modified", entry.last_modified)
+        entry.stored_at = self._clock()
+        _LOGGER.debug("Not modified, using cached %s", entry.response.url)
+
+        return entry.response
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        self._generation += 1
+        self._entries.clear()
@@ -0,0 +1,25 @@
+"""A property that is computed on first access and then cached on the instance"""
+from typing import Any, Callable
+
+
+class lazy_property:  # pylint: disable=invalid-name
+    """Decorator for a method computing an attribute on first access. The result is
+    stored in the instance's __dict__ under the same name, so later reads are plain
+    attribute lookups and the attribute can be assigned to like any other.
+    Equivalent to functools.cached_property, which needs Python 3.8."""
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func: Callable[[Any], Any] = func
+        self.name: str = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+
+        return value
@@ -0,0 +1,126 @@
+"""Client side rate limiting for requests made to pod point and its auth provider"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+from urllib.parse import urlsplit
+
+from ..endpoints import API_BASE_URL, MOBILE_API_BASE_URL, GOOGLE_BASE_URL, GOOGLE_TOKEN_BASE_URL
+from .functions import async_sleep
+
+DEFAULT_RATE = 5.0
+DEFAULT_CAPACITY = 10.0
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class TokenBucket:
+    """A token bucket refilled at `rate` tokens per second, holding at most
+    `capacity` tokens. Callers wait, in order, for a token to become available."""
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = None,
+        sleep: Callable[[float], Awaitable[None]] = None
+    ) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._clock: Callable[[], float] = clock if clock is not None else time.monotonic
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._tokens: float = capacity
+        self._updated_at: float = self._clock()
+        self._lock: asyncio.Lock = None
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available"""
+        self.__refill()
+        return self._tokens
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until `tokens` are available and take them. Returns the time waited."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self.__refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                delay = (tokens - self._tokens) / self.rate
+                waited += delay
+                await async_sleep(delay, sleep=self._sleep)
+
+    def __refill(self) -> None:
+        now = self._clock()
+        elapsed = max(now - self._updated_at, 0.0)
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + (elapsed * self.rate))
+
+
+class RateLimiter:
+    """Token bucket rate limits keyed by upstream. The pod point API, the mobile
+    connectivity API and the Google auth endpoints each get their own bucket, any
+    other URL is limited by host. Share one RateLimiter between clients to limit
+    them together."""
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        capacity: float = DEFAULT_CAPACITY,
+        limits: Dict[str, Tuple[float, float]] = None,
+        clock: Callable[[], float] = None,
+        sleep: Callable[[float], Awaitable[None]] = None
+    ) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._limits: Dict[str, Tuple[float, float]] = {
+            base: (rate, capacity) for base in (
+                API_BASE_URL, MOBILE_API_BASE_URL, GOOGLE_BASE_URL, GOOGLE_TOKEN_BASE_URL
+            )
+        }
+        if limits is not None:
+            self._limits.update(limits)
+
+        # Match the most specific base URL first
+        self._bases = sorted(self._limits.keys(), key=len, reverse=True)
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def key_for(self, url: str) -> str:
+        """The bucket key for a given URL"""
+        for base in self._bases:
+            if url.startswith(base):
+                return base
+
+        return urlsplit(url).hostname or url
+
+    def bucket(self, url: str) -> TokenBucket:
+        """The bucket used for requests to a given URL"""
+        key = self.key_for(url)
+
+        bucket = self._buckets.get(key, None)
+        if bucket is None:
+            rate, capacity = self._limits.get(key, (self.rate, self.capacity))
+            bucket = TokenBucket(
+                rate=rate,
+                capacity=capacity,
+                clock=self._clock,
+                sleep=self._sleep
+            )
+            self._buckets[key] = bucket
+
+        return bucket
+
+    async def acquire(self, url: str) -> float:
+        """Wait for permission to make a request to `url`. Returns the time waited."""
+        waited = await self.bucket(url).acquire()
+
+        if waited > 0:
+            _LOGGER.debug("Rate limited request to %s for %.2fs", url, waited)
+
+        return waited
@@ -0,0 +1,76 @@
+"""Retry policy for requests made to the pod point API"""
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+from socket import gaierror
+from typing import Tuple, Union
+
+import aiohttp
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_EXCEPTIONS = (asyncio.TimeoutError, aiohttp.ClientError, gaierror)
+IDEMPOTENT_METHODS = ("get", "put", "delete")
+
+
+@dataclass
+class RetryPolicy:
+    """Describes when, and how long to wait before, a failed request is retried.
+    Only idempotent methods are retried by default."""
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    jitter: bool = True
+    retry_statuses: Tuple[int, ...] = DEFAULT_RETRY_STATUSES
+    retry_exceptions: Tuple[type, ...] = DEFAULT_RETRY_EXCEPTIONS
+    methods: Tuple[str, ...] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    retry_after_max: float = 60.0
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Can a request using `method` be retried after `attempt` attempts"""
+        return method.lower() in self.methods and attempt < self.max_attempts
+
+    def retries_exception(self, exception: BaseException) -> bool:
+        """Should a request that failed with `exception` be retried"""
+        return isinstance(exception, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff, with full jitter if enabled, after `attempt` attempts"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+    def delay(self, attempt: int, retry_after: Union[None, str] = None) -> float:
+        """How long to wait before the next attempt, honouring a Retry-After header"""
+        if self.respect_retry_after and retry_after is not None:
+            seconds = self.parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(max(seconds, 0.0), self.retry_after_max)
+
+        return self.backoff(attempt)
+
+    @staticmethod
+    def parse_retry_after(retry_after: str) -> Union[None, float]:
+        """Parse a Retry-After header, either delay-seconds or an HTTP date"""
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+        if retry_at is None:
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return (retry_at - datetime.now(timezone.utc)).total_seconds()
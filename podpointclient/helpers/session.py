@@ -6,6 +6,7 @@ from .functions import auth_headers
 from ..errors import SessionError
 from ..endpoints import API_BASE_URL, SESSIONS
 from .api_wrapper import APIWrapper
+from .timeouts import RequestTimeout
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -17,7 +18,9 @@ class Session:
         password: str,
         access_token: str,
         session: aiohttp.ClientSession,
-        http_debug: bool = None
+        http_debug: bool = None,
+        api_wrapper: APIWrapper = None,
+        timeout: RequestTimeout = None
     ) -> None:
         self.email: str = email
         self.password: str = password
@@ -26,18 +29,22 @@ class Session:
         self.user_id: str = None
         self._session: aiohttp.ClientSession = session
         self._http_debug: bool = http_debug if http_debug is not None else False
+        self._api_wrapper: APIWrapper = (
+            api_wrapper if api_wrapper is not None else APIWrapper(session=self._session)
+        )
+        self._timeout: RequestTimeout = timeout
 
     async def create(self):
         """Create a session using credentials passed in initialisation"""
         return_value = False
 
         try:
-            wrapper = APIWrapper(session=self._session)
-            response = await wrapper.post(
+            response = await self._api_wrapper.post(
                 url=f"{API_BASE_URL}{SESSIONS}",
                 body={"email": self.email, "password": self.password},
                 headers=auth_headers(self.access_token),
-                exception_class=SessionError
+                exception_class=SessionError,
+                timeout=self._timeout
             )
 
             json = await response.json()
@@ -0,0 +1,70 @@
+"""Timeouts for requests made to pod point, by type of request"""
+from dataclasses import dataclass, field
+from typing import Tuple, Union
+
+import aiohttp
+from strenum import StrEnum
+
+TIMEOUT = 10
+
+
+class RequestType(StrEnum):
+    """An ENUM representing the types of request made to pod point"""
+    AUTH    = "auth"
+    LISTING = "listing"
+    CONTROL = "control"
+    DEFAULT = "default"
+
+
+@dataclass
+class RequestTimeout:
+    """Timeouts, in seconds, for a request. `total` covers the whole request,
+    `connect` establishing a connection and `first_byte` waiting for data once
+    connected. None disables a timeout."""
+    total: float = TIMEOUT
+    connect: float = None
+    first_byte: float = None
+
+    @property
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """The equivalent aiohttp.ClientTimeout"""
+        return aiohttp.ClientTimeout(
+            total=self.total,
+            sock_connect=self.connect,
+            sock_read=self.first_byte
+        )
+
+    @property
+    def key(self) -> Tuple[Union[float, None], ...]:
+        """A hashable key, equal for requests with the same timeouts"""
+        return (self.total, self.connect, self.first_byte)
+
+    @classmethod
+    def coerce(cls, timeout: Union["RequestTimeout", float, None]) -> Union["RequestTimeout", None]:
+        """Allow a number of seconds to be used as a total timeout"""
+        if timeout is None or isinstance(timeout, RequestTimeout):
+            return timeout
+
+        return cls(total=timeout)
+
+
+@dataclass
+class TimeoutPolicy:
+    """Timeouts for each type of request. Control requests, such as setting a
+    charge override, fail fast while listings with many includes get longer."""
+    auth: RequestTimeout = field(
+        default_factory=lambda: RequestTimeout(total=TIMEOUT, connect=5)
+    )
+    listing: RequestTimeout = field(
+        default_factory=lambda: RequestTimeout(total=30, connect=5, first_byte=20)
+    )
+    control: RequestTimeout = field(
+        default_factory=lambda: RequestTimeout(total=5, connect=3, first_byte=5)
+    )
+    default: RequestTimeout = field(
+        default_factory=lambda: RequestTimeout(total=TIMEOUT, connect=5)
+    )
+
+    def for_type(self, request_type: RequestType) -> RequestTimeout:
+        """The timeout for a given type of request"""
+        return getattr(self, str(request_type), self.default)
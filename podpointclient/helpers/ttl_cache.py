@@ -0,0 +1,140 @@
+"""In memory cache for results of read requests, with per endpoint TTLs"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Set, Tuple, Union
+
+DEFAULT_TTLS = {
+    "pods": 30,
+    "firmware": 3600,
+    "connectivity_status": 10,
+    "charge_override": 30,
+}
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+CacheKey = Tuple[Hashable, ...]
+
+MISSING = object()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: Set[str] = field(default_factory=set)
+
+
+class TTLCache:
+    """Caches results of read requests for a TTL set per endpoint. An endpoint
+    without a TTL, or with a TTL of 0, is not cached. Entries are tagged, for
+    example with the unit they belong to, so writes can invalidate them. When
+    `max_entries` is set the least recently used entries are evicted first.
+
+    Take the `generation` before making a request and pass it to `set`, so a
+    result read before an invalidation of its tags is not cached after it."""
+    def __init__(
+        self,
+        ttls: Dict[str, float] = None,
+        max_entries: Union[None, int] = None,
+        clock: Callable[[], float] = None
+    ) -> None:
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+
+        self.max_entries: Union[None, int] = max_entries
+        self._clock: Callable[[], float] = clock if clock is not None else time.monotonic
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._generation: int = 0
+        # Generation each tag, and the whole cache, was last invalidated in
+        self._invalidated_in: Dict[str, int] = {}
+        self._cleared_in: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Increases each time entries are invalidated or cleared"""
+        return self._generation
+
+    def caches(self, endpoint: str) -> bool:
+        """Are results for an endpoint cached"""
+        return self.ttls.get(endpoint, 0) > 0
+
+    def get(self, endpoint: str, *key: Hashable) -> Any:
+        """Return a cached result, or MISSING if there is no fresh result"""
+        cache_key = (endpoint, *key)
+
+        entry = self._entries.get(cache_key, None)
+        if entry is None:
+            return MISSING
+
+        if self._clock() >= entry.expires_at:
+            del self._entries[cache_key]
+            return MISSING
+
+        self._entries.move_to_end(cache_key)
+        return entry.value
+
+    def set(
+        self,
+        endpoint: str,
+        *key: Hashable,
+        value: Any,
+        tags: Iterable[str] = (),
+        generation: Union[None, int] = None
+    ) -> None:
+        """Cache a result for an endpoint, if the endpoint is cached. If the result
+        was requested in `generation`, it is not cached when any of its tags have
+        been invalidated since."""
+        if not self.caches(endpoint):
+            return
+
+        tags = set(tags)
+        if generation is not None and self.__invalidated_since(generation, tags):
+            _LOGGER.debug("Not caching %s %s, invalidated while it was requested", endpoint, key)
+            return
+
+        cache_key = (endpoint, *key)
+        self._entries[cache_key] = _Entry(
+            value=value,
+            expires_at=self._clock() + self.ttls[endpoint],
+            tags=tags
+        )
+        self._entries.move_to_end(cache_key)
+
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str) -> int:
+        """Remove every entry with any of the given tags, returning how many were removed"""
+        tags = set(tags)
+        self._generation += 1
+        for tag in tags:
+            self._invalidated_in[tag] = self._generation
+
+        stale = [key for key, entry in self._entries.items() if entry.tags & tags]
+
+        for key in stale:
+            del self._entries[key]
+
+        if stale:
+            _LOGGER.debug("Invalidated %s cached results for %s", len(stale), tags)
+
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        self._generation += 1
+        self._cleared_in = self._generation
+        self._entries.clear()
+
+    def __invalidated_since(self, generation: int, tags: Set[str]) -> bool:
+        if self._cleared_in > generation:
+            return True
+
+        return any(self._invalidated_in.get(tag, 0) > generation for tag in tags)
@@ -7,6 +7,7 @@ import json
 from strenum import StrEnum, KebabCaseStrEnum
 
 from .helpers.functions import lazy_convert_to_datetime, lazy_iso_format_datetime
+from .helpers.lazy_property import lazy_property
 from .schedule import Schedule, ScheduleStatus
 from .charge import Charge
 from .charge_mode import ChargeMode
@@ -140,8 +141,23 @@ class Firmware:
 
 
 class Pod:
-    """Representation of a Pod from pod point"""
-    def __init__(self, data: Dict[str, Any]):
+    """Representation of a Pod from pod point. With `lazy` set, nested objects
+    and datetimes are built from the raw data the first time they are accessed,
+    rather than when the pod is created."""
+    LAZY_ATTRIBUTES = (
+        "commissioned_at",
+        "created_at",
+        "last_contact_at",
+        "model",
+        "location",
+        "statuses",
+        "unit_connectors",
+        "charge_schedules",
+        "charge_override",
+    )
+
+    def __init__(self, data: Dict[str, Any], lazy: bool = False):
+        self._data: Dict[str, Any]     = data
         self.id: int                   = data.get('id', None)
         self.name: str                 = data.get('name', None)
         self.ppid: str                 = data.get('ppid', None)
@@ -151,9 +167,6 @@ class Pod:
         self.ev_zone: bool              = data.get('evZone', None)
         self.address_id: int           = data.get('address_id', None)
         self.description: str          = data.get('description', "")
-        self.commissioned_at: datetime = lazy_convert_to_datetime(data.get('commissioned_at', None))
-        self.created_at: datetime      = lazy_convert_to_datetime(data.get('created_at', None))
-        self.last_contact_at: datetime = lazy_convert_to_datetime(data.get('last_contact_at', None))
         self.contactless_enabled: bool = data.get('contactless_enabled', None)
         self.unit_id: int              = data.get('unit_id', None)
         self.timezone: str             = data.get('timezone', None)
@@ -170,8 +183,33 @@ class Pod:
 
         self.firmware: Union(Firmware, None) = None
 
-        model_data = data.get('model', {})
-        self.model = self.Model(
+        if not lazy:
+            for attribute in self.LAZY_ATTRIBUTES:
+                getattr(self, attribute)
+
+            # Everything has been built, don't keep the raw data alive
+            del self._data
+
+    @lazy_property
+    def commissioned_at(self) -> datetime:
+        """When the pod was commissioned"""
+        return lazy_convert_to_datetime(self._data.get('commissioned_at', None))
+
+    @lazy_property
+    def created_at(self) -> datetime:
+        """When the pod was created"""
+        return lazy_convert_to_datetime(self._data.get('created_at', None))
+
+    @lazy_property
+    def last_contact_at(self) -> datetime:
+        """When pod point last heard from the pod"""
+        return lazy_convert_to_datetime(self._data.get('last_contact_at', None))
+
+    @lazy_property
+    def model(self) -> "Pod.Model":
+        """The model of the pod"""
+        model_data = self._data.get('model', {})
+        return self.Model(
             id                   = model_data.get('id', None),
             name                 = model_data.get('name', None),
             vendor               = model_data.get('vendor', None),
@@ -181,16 +219,22 @@ class Pod:
             image_url            = model_data.get('image_url', None)
         )
 
-        location_data = data.get('location', {})
-        self.location = self.Location(
+    @lazy_property
+    def location(self) -> "Pod.Location":
+        """The location of the pod"""
+        location_data = self._data.get('location', {})
+        return self.Location(
             lat = location_data.get('lat', 0.0),
             lng = location_data.get('lng', 0.0)
         )
 
-        self.statuses = []
-        statuses_data = data.get('statuses', [])
+    @lazy_property
+    def statuses(self) -> List["Pod.Status"]:
+        """The status of each of the pod's doors"""
+        statuses = []
+        statuses_data = self._data.get('statuses', [])
         for status in statuses_data:
-            self.statuses.append(
+            statuses.append(
                 self.Status(
                     id       = status.get('id', None),
                     name     = status.get('name', None),
@@ -201,8 +245,13 @@ class Pod:
                 )
             )
 
-        self.unit_connectors = []
-        unit_connectors_data = data.get('unit_connectors', [])
+        return statuses
+
+    @lazy_property
+    def unit_connectors(self) -> List["Pod.Connector"]:
+        """The pod's connectors"""
+        unit_connectors = []
+        unit_connectors_data = self._data.get('unit_connectors', [])
         for unit_connector in unit_connectors_data:
             connector_data = unit_connector.get('connector', {})
 
@@ -216,7 +265,7 @@ class Pod:
                     ocpp_code = socket_data.get('ocpp_code', None),
                 )
 
-            self.unit_connectors.append(
+            unit_connectors.append(
                 self.Connector(
                     id = connector_data.get('id', None),
                     door = connector_data.get('door', None),
@@ -230,8 +279,13 @@ class Pod:
                 )
             )
 
-        self.charge_schedules = []
-        charge_schedules_data = data.get('charge_schedules', [])
+        return unit_connectors
+
+    @lazy_property
+    def charge_schedules(self) -> List[Schedule]:
+        """The pod's charge schedules"""
+        charge_schedules = []
+        charge_schedules_data = self._data.get('charge_schedules', [])
         for charge_schedule_data in charge_schedules_data:
             status_data = charge_schedule_data.get('status', None)
             status_obj = None
@@ -240,7 +294,7 @@ class Pod:
                     is_active = status_data.get('is_active', None)
                 )
 
-            self.charge_schedules.append(
+            charge_schedules.append(
                 Schedule(
                     uid = charge_schedule_data.get('uid', None),
                     start_day = charge_schedule_data.get('start_day', None),
@@ -251,11 +305,16 @@ class Pod:
                 )
             )
 
-        self.charge_override = None
-        charge_override_data = data.get('charge_override', None)
-        if charge_override_data is not None:
-            self.charge_override = ChargeOverride(data=charge_override_data)
+        return charge_schedules
+
+    @lazy_property
+    def charge_override(self) -> Union[None, ChargeOverride]:
+        """The pod's charge override, if there is one"""
+        charge_override_data = self._data.get('charge_override', None)
+        if charge_override_data is None:
+            return None
 
+        return ChargeOverride(data=charge_override_data)
 
     @property
     def dict(self) -> Dict[str, Any]:
@@ -0,0 +1,238 @@
+"""Adaptive polling of pods, more often while they are in use"""
+from dataclasses import dataclass
+import logging
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Union
+
+from strenum import StrEnum
+
+from .client import PodPointClient
+from .charge_override import ChargeOverride
+from .errors import APIError
+from .helpers.functions import async_sleep
+from .pod import Pod
+
+ONLINE = "ONLINE"
+CHARGING = "CHARGING"
+# Charging states of a connector with a vehicle plugged in that is not charging
+CONNECTED_CHARGING_STATES = ("SUSPENDED_EV", "SUSPENDED_EVSE")
+POLL_RETRY_INTERVAL = 30
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class PodState(StrEnum):
+    """An ENUM representing how busy a pod is, for deciding how often to poll it"""
+    UNKNOWN   = "unknown"
+    CHARGING  = "charging"
+    OVERRIDE  = "override"
+    CONNECTED = "connected"
+    IDLE      = "idle"
+    OFFLINE   = "offline"
+
+
+def pod_state(pod: Pod) -> PodState:
+    """The state of a pod, from its last refreshed connectivity status and charge
+    override. A pod that has not been refreshed is UNKNOWN."""
+    status = pod.connectivity_status
+    if status is None or len(status.evses) == 0:
+        return PodState.UNKNOWN
+
+    if status.connectivity_status != ONLINE:
+        return PodState.OFFLINE
+
+    if pod.charging_state == CHARGING:
+        return PodState.CHARGING
+
+    override = pod.charge_override
+    if isinstance(override, ChargeOverride) and override.active:
+        return PodState.OVERRIDE
+
+    # A vehicle is plugged in, or the pod is ready to charge one
+    if pod.offering_energy or pod.charging_state in CONNECTED_CHARGING_STATES:
+        return PodState.CONNECTED
+
+    return PodState.IDLE
+
+
+@dataclass
+class PollingPolicy:
+    """Seconds between polls of a pod in each state. Each interval is varied by up
+    to `jitter` (a fraction of the interval) so pods polled together drift apart,
+    and is never less than `min_interval`. A pod still UNKNOWN after being polled
+    could not be refreshed, its interval doubles with each failed poll up to the
+    `offline` interval. Pods are listed again every `listing_interval` seconds to
+    pick up new pods."""
+    charging: float = 30
+    override: float = 60
+    connected: float = 120
+    idle: float = 600
+    offline: float = 900
+    unknown: float = 30
+    min_interval: float = 5
+    jitter: float = 0.1
+    listing_interval: float = 3600
+
+    def interval_for(self, pod: Pod, failures: int = 0) -> float:
+        """Seconds until a pod should next be polled, after `failures` polls in a row
+        that left it UNKNOWN. Override to add rules."""
+        state = pod_state(pod)
+        interval = getattr(self, state.value)
+
+        if state == PodState.UNKNOWN and failures > 1:
+            interval = min(interval * 2 ** (failures - 1), max(interval, self.offline))
+
+        # Poll as soon as an override ends, the pod's state will have changed
+        if state == PodState.OVERRIDE:
+            remaining = pod.charge_override.remaining_time
+            if remaining is not None:
+                interval = min(interval, remaining.total_seconds())
+
+        if self.jitter > 0:
+            interval *= 1 + random.uniform(-self.jitter, self.jitter)
+
+        return max(interval, self.min_interval)
+
+
+class PollScheduler:
+    """Polls an account's pods at intervals depending on their state, so charging
+    pods, and pods with an active charge override, are polled often and idle or
+    offline pods rarely. Each poll refreshes a pod's connectivity status and
+    charge override with `async_refresh_pods`."""
+    def __init__(
+        self,
+        client: PodPointClient,
+        policy: PollingPolicy = None,
+        clock: Callable[[], float] = None,
+        sleep: Callable[[float], Awaitable[None]] = None
+    ) -> None:
+        self.client: PodPointClient = client
+        self.policy: PollingPolicy = policy if policy is not None else PollingPolicy()
+        self._clock: Callable[[], float] = clock if clock is not None else time.monotonic
+        self._sleep: Callable[[float], Awaitable[None]] = sleep
+        self._pods: Dict[int, Pod] = {}
+        self._next_poll_at: Dict[int, float] = {}
+        # Polls in a row that left each pod UNKNOWN
+        self._failures: Dict[int, int] = {}
+        self._listed_at: Union[None, float] = None
+
+    @property
+    def pods(self) -> List[Pod]:
+        """The pods being polled"""
+        return list(self._pods.values())
+
+    def update(self, pods: List[Pod]) -> None:
+        """Replace the pods being polled with a new listing. Pods already known keep
+        their schedule and last refreshed state, new pods are due straight away."""
+        now = self._clock()
+        previous = self._pods
+        self._pods = {}
+
+        for pod in pods:
+            known = previous.get(pod.unit_id, None)
+            if known is not None:
+                pod.connectivity_status = known.connectivity_status
+                pod.offering_energy = known.offering_energy
+                pod.last_message_at = known.last_message_at
+                pod.charging_state = known.charging_state
+                pod.firmware = known.firmware
+            else:
+                self._next_poll_at[pod.unit_id] = now
+
+            self._pods[pod.unit_id] = pod
+
+        for unit_id in list(self._next_poll_at):
+            if unit_id not in self._pods:
+                del self._next_poll_at[unit_id]
+                self._failures.pop(unit_id, None)
+
+        self._listed_at = now
+
+    def schedule(self, pod: Pod) -> float:
+        """Schedule a pod's next poll from the state it was left in by a poll,
+        returning the delay. Pods that are still UNKNOWN are backed off."""
+        failures = 0
+        if pod_state(pod) == PodState.UNKNOWN:
+            failures = self._failures.get(pod.unit_id, 0) + 1
+            self._failures[pod.unit_id] = failures
+        else:
+            self._failures.pop(pod.unit_id, None)
+
+        interval = self.policy.interval_for(pod, failures=failures)
+        self._next_poll_at[pod.unit_id] = self._clock() + interval
+
+        return interval
+
+    def due(self) -> List[Pod]:
+        """Pods that are due to be polled"""
+        now = self._clock()
+        return [
+            pod for unit_id, pod in self._pods.items()
+            if self._next_poll_at.get(unit_id, now) <= now
+        ]
+
+    def next_due_in(self) -> float:
+        """Seconds until a pod, or the pod listing, is next due"""
+        now = self._clock()
+        due_at = list(self._next_poll_at.values())
+        if self._listed_at is not None:
+            due_at.append(self._listed_at + self.policy.listing_interval)
+
+        if len(due_at) == 0:
+            return 0.0
+
+        return max(min(due_at) - now, 0.0)
+
+    async def async_list_pods(self) -> List[Pod]:
+        """List the account's pods, adding new pods and removing deleted ones"""
+        self.update(await self.client.async_get_all_pods())
+        return self.pods
+
+    async def async_poll_due(self) -> List[Pod]:
+        """Refresh the pods that are due, or list pods if the listing is due, and
+        reschedule them. Returns the pods refreshed."""
+        listing_due = (
+            self._listed_at is None
+            or self._clock() - self._listed_at >= self.policy.listing_interval
+        )
+        if listing_due:
+            await self.async_list_pods()
+
+        pods = self.due()
+        if len(pods) == 0:
+            return pods
+
+        await self.client.async_refresh_pods(pods=pods, firmware=False)
+
+        for pod in pods:
+            interval = self.schedule(pod)
+            _LOGGER.debug(
+                "Pod %s is %s, polling again in %.0fs",
+                pod.ppid,
+                pod_state(pod),
+                interval
+            )
+
+        return pods
+
+    async def async_iter_updates(self) -> AsyncIterator[List[Pod]]:
+        """Poll pods as they fall due, forever, yielding the pods refreshed by each
+        poll. If pods can not be listed, listing is retried every
+        POLL_RETRY_INTERVAL seconds."""
+        while True:
+            try:
+                pods = await self.async_poll_due()
+            except APIError as exception:
+                _LOGGER.warning(
+                    "Unable to poll pods, retrying in %ss. %s",
+                    POLL_RETRY_INTERVAL,
+                    exception
+                )
+                await async_sleep(POLL_RETRY_INTERVAL, sleep=self._sleep)
+                continue
+
+            if len(pods) > 0:
+                yield pods
+
+            await async_sleep(self.next_due_in(), sleep=self._sleep)
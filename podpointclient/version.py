@@ -1,3 +1,3 @@
 """Version for the podpointclient library"""
 
-__version__ = "1.6.1"
+__version__ = "1.7.0"
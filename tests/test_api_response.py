@@ -0,0 +1,60 @@
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from podpointclient.helpers.api_response import APIResponse
+
+@pytest.mark.asyncio
+async def test_read_releases_the_connection():
+    with aioresponses() as m:
+        m.get('https://google.com/api/v1/test', status=200, payload={"foo": "bar"}, headers={"X-Test": "1"})
+
+        async with aiohttp.ClientSession() as session:
+            raw = await session.get('https://google.com/api/v1/test')
+            response = await APIResponse.read(method="get", response=raw)
+
+            assert raw.closed is True
+            assert 200 == response.status
+            assert "1" == response.headers["X-Test"]
+            assert b'{"foo": "bar"}' == response.body
+            assert {"foo": "bar"} == await response.json()
+            assert response.streaming is False
+
+@pytest.mark.asyncio
+async def test_stream_holds_the_connection_until_read():
+    with aioresponses() as m:
+        m.get('https://google.com/api/v1/test', status=200, body="OK")
+
+        async with aiohttp.ClientSession() as session:
+            raw = await session.get('https://google.com/api/v1/test')
+            response = APIResponse.stream(method="get", response=raw)
+
+            assert response.streaming is True
+            with pytest.raises(RuntimeError):
+                response.body
+
+            assert "OK" == await response.text()
+            assert response.streaming is False
+            assert b"OK" == response.body
+
+@pytest.mark.asyncio
+async def test_stream_is_released_by_context_manager():
+    with aioresponses() as m:
+        m.get('https://google.com/api/v1/test', status=200, body="OK")
+
+        async with aiohttp.ClientSession() as session:
+            raw = await session.get('https://google.com/api/v1/test')
+
+            async with APIResponse.stream(method="get", response=raw) as response:
+                assert b"OK" == await response.content.read()
+
+            assert raw.closed is True
+            with pytest.raises(RuntimeError):
+                response.content
+
+@pytest.mark.asyncio
+async def test_json_of_empty_body_is_none():
+    response = APIResponse(method="delete", url="https://google.com", status=204, headers={}, body=b"")
+
+    assert await response.json() is None
+    assert "" == await response.text()
@@ -1,9 +1,17 @@
 from urllib import response
+import asyncio
+import re
 import aiohttp
 from podpointclient.errors import APIError, ApiConnectionError
 from podpointclient.helpers.api_wrapper import APIWrapper
 import pytest
 from aioresponses import aioresponses
+from yarl import URL
+from podpointclient.helpers.retry import RetryPolicy
+from podpointclient.helpers.timeouts import RequestTimeout
+from podpointclient.helpers.api_response import APIResponse
+from podpointclient.helpers.http_cache import HTTPCache
+from podpointclient.helpers.coalescer import RequestCoalescer
 
 @pytest.mark.asyncio
 async def test_get(aiohttp_client):
@@ -85,3 +93,173 @@ async def test_connection_errors(aiohttp_client):
         await wrapper.get("https://google.com/api/v1/test", headers={}, params={"foo": "bar"})
 
       assert "Connection Error: Timeout error fetching information from https://google.com/api/v1/test - Connection timeout test" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_retries_retryable_statuses(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=503, body="Unavailable")
+    m.get('https://google.com/api/v1/test', status=429, body="Slow down", headers={"Retry-After": "0"})
+    m.get('https://google.com/api/v1/test', status=200, body="OK")
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, retry_policy=RetryPolicy(max_attempts=3, backoff_base=0))
+      async with await wrapper.get("https://google.com/api/v1/test", headers={}) as result:
+        assert 200 == result.status
+        assert "OK" == await result.text()
+
+@pytest.mark.asyncio
+async def test_retries_connection_errors(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', timeout=True)
+    m.get('https://google.com/api/v1/test', status=200, body="OK")
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, retry_policy=RetryPolicy(backoff_base=0))
+      async with await wrapper.get("https://google.com/api/v1/test", headers={}) as result:
+        assert 200 == result.status
+
+@pytest.mark.asyncio
+async def test_raises_once_retries_are_exhausted(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=500, body="Error", repeat=True)
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, retry_policy=RetryPolicy(max_attempts=2, backoff_base=0))
+
+      with pytest.raises(APIError) as exc_info:
+        await wrapper.get("https://google.com/api/v1/test", headers={})
+
+      assert "(500, 'Error')" in str(exc_info.value)
+      assert 2 == len(m.requests[('GET', URL('https://google.com/api/v1/test'))])
+
+@pytest.mark.asyncio
+async def test_does_not_retry_non_idempotent_methods(aiohttp_client):
+  with aioresponses() as m:
+    m.post('https://google.com/api/v1/test', status=503, body="Unavailable", repeat=True)
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, retry_policy=RetryPolicy(backoff_base=0))
+
+      with pytest.raises(APIError):
+        await wrapper.post("https://google.com/api/v1/test", body={}, headers={})
+
+      assert 1 == len(m.requests[('POST', URL('https://google.com/api/v1/test'))])
+
+@pytest.mark.asyncio
+async def test_request_timeout_is_passed_to_the_session(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=200, body="OK")
+    m.get('https://google.com/api/v1/other', status=200, body="OK")
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session)
+      await wrapper.get(
+        "https://google.com/api/v1/test",
+        headers={},
+        timeout=RequestTimeout(total=3, connect=1, first_byte=2)
+      )
+      await wrapper.get("https://google.com/api/v1/other", headers={})
+
+      request = m.requests[('GET', URL('https://google.com/api/v1/test'))][0]
+      assert aiohttp.ClientTimeout(total=3, sock_connect=1, sock_read=2) == request.kwargs['timeout']
+
+      request = m.requests[('GET', URL('https://google.com/api/v1/other'))][0]
+      assert 'timeout' not in request.kwargs
+
+@pytest.mark.asyncio
+async def test_request_timeout_accepts_seconds(aiohttp_client):
+  with aioresponses() as m:
+    m.put('https://google.com/api/v1/test', status=200, body="OK")
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session)
+      await wrapper.put("https://google.com/api/v1/test", body={}, headers={}, timeout=2)
+
+      request = m.requests[('PUT', URL('https://google.com/api/v1/test'))][0]
+      assert aiohttp.ClientTimeout(total=2) == request.kwargs['timeout']
+
+@pytest.mark.asyncio
+async def test_responses_are_read_and_released(aiohttp_client):
+  with aioresponses() as m:
+    m.delete('https://google.com/api/v1/test', status=204)
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session)
+      result = await wrapper.delete("https://google.com/api/v1/test", headers={})
+
+      assert isinstance(result, APIResponse)
+      assert result.streaming is False
+      assert 204 == result.status
+      assert b"" == result.body
+
+@pytest.mark.asyncio
+async def test_get_can_stream_the_body(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=200, body="OK")
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session)
+      async with await wrapper.get("https://google.com/api/v1/test", headers={}, stream=True) as result:
+        assert result.streaming is True
+        assert b"OK" == await result.content.read()
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_cached_response_when_not_modified(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=200, payload={"foo": "bar"}, headers={"ETag": '"abc"'})
+    m.get('https://google.com/api/v1/test', status=304)
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, http_cache=HTTPCache())
+      first = await wrapper.get("https://google.com/api/v1/test", headers={})
+      second = await wrapper.get("https://google.com/api/v1/test", headers={})
+
+      assert first is second
+      assert {"foo": "bar"} == await second.json()
+
+      requests = m.requests[('GET', URL('https://google.com/api/v1/test'))]
+      assert 'If-None-Match' not in requests[0].kwargs['headers']
+      assert '"abc"' == requests[1].kwargs['headers']['If-None-Match']
+
+@pytest.mark.asyncio
+async def test_304_is_an_error_without_a_cached_response(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=304)
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, http_cache=HTTPCache())
+
+      with pytest.raises(APIError):
+        await wrapper.get("https://google.com/api/v1/test", headers={})
+
+@pytest.mark.asyncio
+async def test_ttl_cache_skips_requests_until_a_write(aiohttp_client):
+  with aioresponses() as m:
+    m.get(re.compile(r'^https://google\.com/api/v1/test.*$'), status=200, body="OK", repeat=True)
+    m.put('https://google.com/api/v1/test', status=200, body="OK")
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, http_cache=HTTPCache(ttl=60))
+      await wrapper.get("https://google.com/api/v1/test", headers={}, params={"timestamp": 1})
+      await wrapper.get("https://google.com/api/v1/test", headers={}, params={"timestamp": 2})
+      assert 1 == sum(len(calls) for key, calls in m.requests.items() if key[0] == 'GET')
+
+      await wrapper.put("https://google.com/api/v1/test", body={}, headers={})
+      await wrapper.get("https://google.com/api/v1/test", headers={})
+      assert 2 == sum(len(calls) for key, calls in m.requests.items() if key[0] == 'GET')
+
+@pytest.mark.asyncio
+async def test_only_gets_with_the_same_timeout_are_coalesced(aiohttp_client):
+  with aioresponses() as m:
+    m.get('https://google.com/api/v1/test', status=200, body="OK", repeat=True)
+
+    async with aiohttp.ClientSession() as session:
+      wrapper = APIWrapper(session, coalescer=RequestCoalescer())
+      await asyncio.gather(
+        wrapper.get("https://google.com/api/v1/test", headers={}, timeout=5),
+        wrapper.get("https://google.com/api/v1/test", headers={}, timeout=RequestTimeout(total=5)),
+        wrapper.get("https://google.com/api/v1/test", headers={}, timeout=30)
+      )
+
+      timeouts = [request.kwargs['timeout'] for request in m.requests[('GET', URL('https://google.com/api/v1/test'))]]
+      assert [aiohttp.ClientTimeout(total=5), aiohttp.ClientTimeout(total=30)] == timeouts
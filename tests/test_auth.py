@@ -6,6 +6,7 @@ from podpointclient.helpers.auth import Auth
 import aiohttp
 import asyncio
 from aioresponses import aioresponses
+from yarl import URL
 import logging
 
 from podpointclient.endpoints import GOOGLE_BASE_URL, PASSWORD_VERIFY, API_BASE_URL, API_VERSION, AUTH, SESSIONS, GOOGLE_TOKEN_BASE_URL, TOKEN
@@ -188,6 +189,8 @@ async def test_update_access_token_when_token_valid():
 async def test_auth_401_error():
     with aioresponses() as m:
         m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', status=401 , body="foo error")
+        # A rejected refresh falls back to logging in with the password
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', status=401 , body="foo error")
 
         async with aiohttp.ClientSession() as session:
             auth = expired_subject(session)
@@ -197,7 +200,7 @@ async def test_auth_401_error():
 
             assert "Auth Error (401) - foo error" in str(exc_info.value)
 
-async def test_auth_json_error():
+async def test_auth_json_error(caplog):
     # MISSING id_token ELEMENT
     refresh_response = {
         "access_token": "1234",
@@ -209,6 +212,7 @@ async def test_auth_json_error():
 
     with aioresponses() as m:
         m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', payload=refresh_response)
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', status=400, body="bar error")
 
         async with aiohttp.ClientSession() as session:
             auth = expired_subject(session)
@@ -216,7 +220,8 @@ async def test_auth_json_error():
             with pytest.raises(AuthError) as exc_info:   
                 await auth.async_update_access_token()
 
-            assert "Auth Error (200) - Error processing access token response. 'id_token' not found in json." in str(exc_info.value)
+            assert "Auth Error (400) - bar error" in str(exc_info.value)
+            assert "Auth Error (200) - Error processing access token response. 'id_token' not found in json." in caplog.text
 
     # INVALID EXPIRES_IN
     refresh_response = {
@@ -230,6 +235,7 @@ async def test_auth_json_error():
 
     with aioresponses() as m:
         m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', payload=refresh_response)
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', status=400, body="bar error")
 
         async with aiohttp.ClientSession() as session:
             auth = expired_subject(session)
@@ -237,7 +243,8 @@ async def test_auth_json_error():
             with pytest.raises(AuthError) as exc_info:   
                 await auth.async_update_access_token()
 
-            assert "Auth Error (200) - Error processing access token response. When calculating expiry date, got: invalid literal for int() with base 10: 'F14A3'." in str(exc_info.value)
+            assert "Auth Error (400) - bar error" in str(exc_info.value)
+            assert "Auth Error (200) - Error processing access token response. When calculating expiry date, got: invalid literal for int() with base 10: 'F14A3'." in caplog.text
 
 
 async def test_session_401_error():
@@ -292,3 +299,205 @@ async def test_session_json_error():
 def test_auth_no_session():
     auth = Auth(email=EMAIL, password=PASSWORD, session=False)
     assert auth.user_id == None
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_share_a_single_request(aiohttp_client):
+    auth_response = {
+        "expiresIn": "1234",
+        "idToken": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        # Each response is only registered once, a second request would fail
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+
+        async with aiohttp.ClientSession() as session:
+            auth = subject(session)
+
+            results = await asyncio.gather(*[auth.async_update_access_token() for _ in range(5)])
+
+            assert [True] * 5 == results
+            assert auth.access_token == "1234"
+            assert auth.user_id == "1234"
+            assert 1 == len(m.requests[('POST', URL(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}'))])
+            assert 1 == len(m.requests[('POST', URL(f'{API_BASE_URL}{SESSIONS}'))])
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_all_receive_errors(aiohttp_client):
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', status=401, body="Unauthorised")
+
+        async with aiohttp.ClientSession() as session:
+            auth = subject(session)
+
+            results = await asyncio.gather(
+                *[auth.async_update_access_token() for _ in range(3)],
+                return_exceptions=True
+            )
+
+            assert 3 == len(results)
+            for result in results:
+                assert isinstance(result, AuthError)
+
+@pytest.mark.asyncio
+async def test_background_refresh_ahead_of_expiry(aiohttp_client):
+    refresh_response = {
+        "id_token": "5678",
+        "refresh_token": "5678",
+        "expires_in": "3600"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    start = datetime(2022, 1, 1, 12, 0, 0)
+    clock = {"now": start}
+    sleeps = []
+    second_sleep = asyncio.Event()
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) > 1:
+            second_sleep.set()
+            await asyncio.Future()
+
+        clock["now"] += timedelta(seconds=seconds)
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', payload=refresh_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+
+        async with aiohttp.ClientSession() as session:
+            auth = Auth(
+                email=EMAIL,
+                password=PASSWORD,
+                session=session,
+                clock=lambda: clock["now"],
+                sleep=fake_sleep
+            )
+            auth.access_token = "1234"
+            auth.refresh_token = "1234"
+            auth.access_token_expiry = start + timedelta(hours=1)
+
+            auth.start_background_refresh(margin=timedelta(minutes=5))
+            await asyncio.wait_for(second_sleep.wait(), timeout=1)
+
+            # Slept until 5 minutes before expiry, then refreshed the token
+            assert sleeps[0] == 55 * 60
+            assert auth.access_token == "5678"
+            assert auth.access_token_expiry == clock["now"] + timedelta(seconds=3590)
+            assert auth.check_access_token() is True
+
+            # Then sleeps until 5 minutes before the new expiry
+            assert sleeps[1] == 3590 - 5 * 60
+
+            await auth.stop_background_refresh()
+            assert auth._background_refresh_task is None
+
+@pytest.mark.asyncio
+async def test_background_refresh_retries_after_an_error(aiohttp_client):
+    sleeps = []
+    retried = asyncio.Event()
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) > 1:
+            retried.set()
+            await asyncio.Future()
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', status=500, body="Error")
+
+        async with aiohttp.ClientSession() as session:
+            auth = Auth(email=EMAIL, password=PASSWORD, session=session, sleep=fake_sleep)
+            auth.access_token = "1234"
+            auth.refresh_token = "1234"
+            auth.access_token_expiry = datetime.now() - timedelta(minutes=1)
+
+            auth.start_background_refresh()
+            await asyncio.wait_for(retried.wait(), timeout=1)
+
+            assert sleeps == [0, 30]
+
+            await auth.stop_background_refresh()
+
+@pytest.mark.asyncio
+async def test_session_is_reused_when_refreshing(aiohttp_client):
+    auth_response = {
+        "expiresIn": "1234",
+        "idToken": "1234",
+        "refreshToken": "1234"
+    }
+    refresh_response = {
+        "id_token": "5678",
+        "refresh_token": "5678",
+        "expires_in": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', payload=refresh_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+
+        async with aiohttp.ClientSession() as session:
+            auth = subject(session)
+
+            assert await auth.async_update_access_token() is True
+            first_session = auth.session
+
+            auth.access_token_expiry = datetime.now() - timedelta(minutes=10)
+            assert await auth.async_update_access_token() is True
+
+            assert auth.access_token == "5678"
+            assert auth.session is first_session
+            assert auth.session.access_token == "5678"
+            assert auth.user_id == "1234"
+            assert 1 == len(m.requests[('POST', URL(f'{API_BASE_URL}{SESSIONS}'))])
+
+@pytest.mark.asyncio
+async def test_invalidated_session_is_recreated(aiohttp_client):
+    auth_response = {
+        "expiresIn": "1234",
+        "idToken": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response, repeat=True)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response, repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            auth = subject(session)
+
+            assert await auth.async_update_access_token() is True
+            first_session = auth.session
+
+            auth.invalidate_session()
+            assert auth.user_id is None
+            assert auth.check_access_token() is False
+
+            assert await auth.async_update_access_token() is True
+            assert auth.session is not first_session
+            assert 2 == len(m.requests[('POST', URL(f'{API_BASE_URL}{SESSIONS}'))])
@@ -89,4 +89,22 @@ def test_charge():
 
     assert None == completed_charge.organisation.id
     assert None == completed_charge.organisation.name
-    assert True == completed_charge.home
\ No newline at end of file
+    assert True == completed_charge.home
+
+def test_charge_uses_slots():
+    charge = Charge(data=json.load(open('./tests/fixtures/complete_charges.json'))['charges'][1])
+
+    for obj in [
+        charge,
+        charge.charging_duration,
+        charge.charging_duration.formatted[0],
+        charge.billing_event,
+        charge.location,
+        charge.location.address,
+        charge.pod,
+        charge.organisation
+    ]:
+        assert hasattr(obj, '__dict__') is False
+
+    assert Charge.BillingEvent(id=1) == Charge.BillingEvent(id=1, exchange_rate=0)
+    assert Charge.Location.Address() == Charge.Location.Address(id=None, business_name="")
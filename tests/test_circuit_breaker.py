@@ -0,0 +1,127 @@
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from podpointclient.client import PodPointClient
+from podpointclient.errors import APIError, CircuitOpenError
+from podpointclient.helpers.api_wrapper import APIWrapper
+from podpointclient.helpers.circuit_breaker import CircuitBreaker, CircuitState
+
+URL = 'https://google.com/api/v1/test'
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=FakeClock())
+
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == CircuitState.CLOSED
+
+    breaker.record_success(URL)
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == CircuitState.CLOSED
+
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == CircuitState.OPEN
+    assert breaker.state('google.com') == CircuitState.OPEN
+    assert breaker.is_available(URL) is False
+    assert breaker.is_available('https://example.com') is True
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_request(URL)
+
+    assert "Circuit open for google.com" in str(exc_info.value)
+
+def test_half_open_allows_a_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+
+    breaker.record_failure(URL)
+    clock.now = 10
+    assert breaker.state(URL) == CircuitState.HALF_OPEN
+    assert breaker.is_available(URL) is True
+
+    breaker.before_request(URL)
+    assert breaker.is_available(URL) is False
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    # A failed probe re-opens the circuit
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == CircuitState.OPEN
+
+    # A successful probe closes it
+    clock.now = 20
+    breaker.before_request(URL)
+    breaker.record_success(URL)
+    assert breaker.state(URL) == CircuitState.CLOSED
+
+def test_released_probe_can_be_retried():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+
+    breaker.record_failure(URL)
+    clock.now = 10
+    breaker.before_request(URL)
+    breaker.release(URL)
+
+    assert breaker.state(URL) == CircuitState.HALF_OPEN
+    assert breaker.is_available(URL) is True
+
+@pytest.mark.asyncio
+async def test_wrapper_fails_fast_while_open(aiohttp_client):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=FakeClock())
+
+    with aioresponses() as m:
+        m.get(URL, status=503, body="Unavailable", repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            wrapper = APIWrapper(session, circuit_breaker=breaker)
+
+            for _ in range(2):
+                with pytest.raises(APIError):
+                    await wrapper.get(URL, headers={})
+
+            with pytest.raises(CircuitOpenError):
+                await wrapper.get(URL, headers={})
+
+            # Only the first two requests were made
+            assert 2 == len(list(m.requests.values())[0])
+
+@pytest.mark.asyncio
+async def test_wrapper_client_errors_do_not_open_the_circuit(aiohttp_client):
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with aioresponses() as m:
+        m.get(URL, status=404, body="Not found")
+        m.get(URL, timeout=True)
+
+        async with aiohttp.ClientSession() as session:
+            wrapper = APIWrapper(session, circuit_breaker=breaker)
+
+            with pytest.raises(APIError):
+                await wrapper.get(URL, headers={})
+            assert breaker.state(URL) == CircuitState.CLOSED
+
+            with pytest.raises(APIError):
+                await wrapper.get(URL, headers={})
+            assert breaker.state(URL) == CircuitState.OPEN
+
+@pytest.mark.asyncio
+async def test_client_api_available():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async with aiohttp.ClientSession() as session:
+        client = PodPointClient(username="1233", password="1234", session=session)
+        assert client.api_available is True
+
+        client = PodPointClient(username="1233", password="1234", session=session, circuit_breaker=breaker)
+        assert client.api_available is True
+
+        breaker.record_failure("https://mobile-api.pod-point.com")
+        assert client.api_available is False
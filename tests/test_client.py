@@ -1,6 +1,8 @@
 import imp
+import asyncio
+import gc
 
-from aioresponses import aioresponses
+from aioresponses import aioresponses, CallbackResult
 import aiohttp
 from podpointclient.client import PodPointClient
 from typing import List
@@ -9,8 +11,9 @@ from podpointclient.charge import Charge
 from podpointclient.charge_override import ChargeOverride
 from podpointclient.connectivity_status import ConnectivityStatus, Evse
 from podpointclient.user import User
-from podpointclient.errors import ChargeOverrideValidationError
+from podpointclient.errors import APIError, ChargeOverrideValidationError
 import pytest
+from yarl import URL
 from datetime import datetime, timezone
 from freezegun import freeze_time
 import json
@@ -18,6 +21,9 @@ import pytz
 from datetime import timedelta
 
 from podpointclient.endpoints import GOOGLE_BASE_URL, PASSWORD_VERIFY, API_BASE_URL, AUTH, CHARGE_SCHEDULES, CHARGES, FIRMWARE, PODS, SESSIONS, UNITS, USERS, CHARGE_OVERRIDE, MOBILE_API_BASE_URL, CHARGERS, CONNECTIVITY_STATUS
+from podpointclient.helpers.timeouts import RequestTimeout, TimeoutPolicy
+from podpointclient.helpers.http_cache import HTTPCache
+from podpointclient.helpers.ttl_cache import TTLCache
 
 @pytest.mark.asyncio
 @freeze_time("Jan 1st, 2022")
@@ -1007,10 +1013,9 @@ async def test_async_set_charge_mode_manual_with_unexpected_response():
 @freeze_time("Jan 1st, 2022")
 async def test_async_set_charge_mode_smart_with_204_response():
     auth_response = {
-        "token_type": "Bearer",
-        "expires_in": 1234,
-        "access_token": "1234",
-        "refresh_token": "1234"
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
     }
     session_response = {
         "sessions": {
@@ -1053,3 +1058,765 @@ async def test_async_set_charge_mode_smart_with_unexpected_response():
             client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
             override = await client.async_set_charge_mode_smart(pod=Pod(data={"unit_id": 1234}))
             assert override is False
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_async_get_all_charges_uses_page_count_and_preserves_order():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    charge_data = json.load(open('./tests/fixtures/small_charges.json'))['charges'][0]
+
+    def charges_page(page):
+        charges = []
+        for i in range(5):
+            charge = dict(charge_data)
+            charge['id'] = ((page - 1) * 5) + i + 1
+            charges.append(charge)
+
+        return {
+            "charges": charges,
+            "meta": {"pagination": {"current_page": page, "per_page": 5, "page_count": 4, "item_count": 20}}
+        }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        for page in range(1, 5):
+            m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=5&page={page}&timestamp=1640995200.0', payload=charges_page(page))
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
+
+            resp: List[Charge] = await client.async_get_all_charges(perpage=5, concurrency=2)
+            assert 20 == len(resp)
+            assert list(range(1, 21)) == [charge.id for charge in resp]
+
+            # Only the pages reported by page_count should have been requested
+            get_requests = [key for key in m.requests.keys() if key[0] == 'GET']
+            assert 4 == len(get_requests)
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_async_get_all_charges_without_pagination_meta():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    charges_reponse_small = json.load(open('./tests/fixtures/small_charges.json'))
+    del charges_reponse_small['meta']
+    charges_reponse_small_page_2 = json.load(open('./tests/fixtures/small_charges_page_2.json'))
+    del charges_reponse_small_page_2['meta']
+    charges_reponse_empty = json.load(open('./tests/fixtures/charges_empty.json'))
+    del charges_reponse_empty['meta']
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=5&page=1&timestamp=1640995200.0', payload=charges_reponse_small)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=5&page=2&timestamp=1640995200.0', payload=charges_reponse_small_page_2)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=5&page=3&timestamp=1640995200.0', payload=charges_reponse_empty)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
+
+            resp: List[Charge] = await client.async_get_all_charges(perpage=5)
+            assert 10 == len(resp)
+            assert 6 == resp[5].id
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_async_iter_charges():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    charges_reponse_large = json.load(open('./tests/fixtures/large_charges.json'))
+    charges_reponse_small_page_2 = json.load(open('./tests/fixtures/small_charges_page_2.json'))
+    charges_reponse_small_page_2['meta']['pagination']['page_count'] = 2
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=50&page=1&timestamp=1640995200.0', payload=charges_reponse_large)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=50&page=2&timestamp=1640995200.0', payload=charges_reponse_small_page_2)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
+
+            charges = []
+            async for charge in client.async_iter_charges():
+                assert Charge == type(charge)
+                charges.append(charge)
+
+            assert 55 == len(charges)
+            assert 1 == charges[0].id
+            assert 6 == charges[50].id
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_async_iter_charges_stopping_early_without_prefetch():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    charges_reponse_large = json.load(open('./tests/fixtures/large_charges.json'))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=50&page=1&timestamp=1640995200.0', payload=charges_reponse_large)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
+
+            charges = client.async_iter_charges(prefetch=False)
+            async for charge in charges:
+                if charge.id == 3:
+                    break
+            await charges.aclose()
+
+            # The second page is never requested
+            get_requests = [key for key in m.requests.keys() if key[0] == 'GET']
+            assert 1 == len(get_requests)
+
+@pytest.mark.asyncio
+async def test_prefetched_page_failing_after_stopping_early_is_retrieved():
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+
+    async def get_page(page):
+        if page == 1:
+            return {"charges": [{"id": 1}]}
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # e.g. a timeout raising its own error when the request is cancelled
+            raise APIError("Cancelled")
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            pages = client._async_iter_pages(get_page=get_page, key="charges", perpage=1)
+            async for _ in pages:
+                await asyncio.sleep(0)
+                break
+            await pages.aclose()
+            del pages
+            for _ in range(3):
+                await asyncio.sleep(0)
+            gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    # The prefetch's exception was retrieved, so is not logged as never retrieved
+    assert [] == unhandled
+
+@pytest.mark.asyncio
+async def test_async_iter_pods():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    pods_response = {
+        "pods": [json.load(open('./tests/fixtures/complete_pod.json'))] * 5,
+        "meta": {"pagination": {"current_page": 1, "per_page": 5, "page_count": 2, "item_count": 7}}
+    }
+    pods_response_page_2 = {
+        "pods": [json.load(open('./tests/fixtures/complete_pod.json'))] * 2,
+        "meta": {"pagination": {"current_page": 2, "per_page": 5, "page_count": 2, "item_count": 7}}
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=5&page=1', payload=pods_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=5&page=2', payload=pods_response_page_2)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+
+            pods = [pod async for pod in client.async_iter_pods(includes=[])]
+            assert 7 == len(pods)
+            assert Pod == type(pods[0])
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_async_get_new_charges():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    charges_reponse_large = json.load(open('./tests/fixtures/large_charges.json'))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{CHARGES}?perpage=50&page=1&timestamp=1640995200.0', payload=charges_reponse_large, repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
+
+            # Stops at the last seen charge
+            charges = await client.async_get_new_charges(since_charge_id=4)
+            assert [1, 2, 3] == [charge.id for charge in charges]
+
+            # Stops at the first charge starting at or before the high-water mark
+            charges = await client.async_get_new_charges(
+                since=datetime(2022, 5, 21, 10, 57, 34, tzinfo=timezone.utc)
+            )
+            assert [1] == [charge.id for charge in charges]
+
+            # The second page is never requested
+            get_requests = [key for key in m.requests.keys() if key[0] == 'GET']
+            assert 1 == len(get_requests)
+
+@pytest.mark.asyncio
+async def test_async_get_pod_only_requests_the_page_it_was_listed_on():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    pod_data = json.load(open('./tests/fixtures/complete_pod.json'))
+    other_pod_data = dict(pod_data)
+    other_pod_data['id'] = 4321
+    pods_response = { "pods": [other_pod_data] * 5 }
+    pods_response_page_2 = { "pods": [pod_data] }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=5&page=1', payload=pods_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=5&page=2', payload=pods_response_page_2)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?include=statuses%252Cprice%252Cmodel%252Cunit_connectors%252Ccharge_schedules%252Ccharge_override&perpage=5&page=2', payload=pods_response_page_2)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+
+            pods = await client.async_get_all_pods(includes=[])
+            assert 6 == len(pods)
+
+            pod = await client.async_get_pod(pod_id=pod_data['id'])
+            assert pod.id == pod_data['id']
+
+            # Two listing requests, followed by a single request for page 2
+            get_requests = [key for key in m.requests.keys() if key[0] == 'GET']
+            assert 3 == len(get_requests)
+
+@pytest.mark.asyncio
+async def test_async_get_pod_for_an_unknown_pod_gets_all_pods():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    pod_data = json.load(open('./tests/fixtures/complete_pod.json'))
+    pods_response = { "pods": [pod_data] }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?include=statuses%252Cprice%252Cmodel%252Cunit_connectors%252Ccharge_schedules%252Ccharge_override&perpage=5&page=1', payload=pods_response, repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+
+            pod = await client.async_get_pod(pod_id=pod_data['id'])
+            assert pod.id == pod_data['id']
+
+            pod = await client.async_get_pod(pod_id=999)
+            assert pod is None
+
+@pytest.mark.asyncio
+async def test_requests_use_timeouts_for_their_type():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    timeouts = TimeoutPolicy(
+        auth=RequestTimeout(total=7),
+        listing=RequestTimeout(total=60),
+        control=RequestTimeout(total=2)
+    )
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=1&page=1', payload={"pods": []})
+        m.delete(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', status=204)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, timeouts=timeouts)
+            await client.async_get_pods(perpage=1, page=1, includes=[])
+            await client.async_delete_charge_override(pod=Pod(data={"unit_id": 1234}))
+
+            requests = {key[0]: calls[0].kwargs['timeout'] for key, calls in m.requests.items() if key[0] != 'POST'}
+            assert aiohttp.ClientTimeout(total=60) == requests['GET']
+            assert aiohttp.ClientTimeout(total=2) == requests['DELETE']
+
+            post_timeouts = [calls[0].kwargs['timeout'] for key, calls in m.requests.items() if key[0] == 'POST']
+            assert [aiohttp.ClientTimeout(total=7)] * 2 == post_timeouts
+
+@pytest.mark.asyncio
+async def test_timeout_can_be_overridden_per_call():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.delete(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', status=204)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            await client.async_delete_charge_override(pod=Pod(data={"unit_id": 1234}), timeout=1.5)
+
+            requests = [calls[0].kwargs['timeout'] for key, calls in m.requests.items() if key[0] == 'DELETE']
+            assert [aiohttp.ClientTimeout(total=1.5)] == requests
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_async_get_firmware_returns_cached_models_when_not_modified():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    pod_data = json.load(open('./tests/fixtures/complete_pod.json'))
+    firmware_response = json.load(open('./tests/fixtures/complete_firmware.json'))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{UNITS}/198765{FIRMWARE}?timestamp=1640995200.0', payload=firmware_response, headers={"ETag": '"1"'})
+        m.get(f'{API_BASE_URL}{UNITS}/198765{FIRMWARE}?timestamp=1640995200.0', status=304)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True, http_cache=HTTPCache())
+            first = await client.async_get_firmware(pod=Pod(data=pod_data))
+            second = await client.async_get_firmware(pod=Pod(data=pod_data))
+
+            assert 1 == len(second)
+            assert first[0] is second[0]
+
+@pytest.mark.asyncio
+async def test_response_cache_is_invalidated_by_writes():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    override_response = {
+        "ppid": "PSL-123456",
+        "requested_at": "2022-01-01T00:00:00.000Z",
+        "received_at": "2022-01-01T00:00:00.000Z",
+        "ends_at": "2022-01-01T03:02:01.000Z"
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', status=204)
+        m.get(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', payload=override_response)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=1&page=1', payload={"pods": []})
+        m.put(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', payload=override_response)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, response_cache=TTLCache())
+            pod = Pod(data={"unit_id": 1234})
+
+            assert await client.async_get_charge_override(pod=pod) is None
+            assert await client.async_get_charge_override(pod=pod) is None
+            await client.async_get_pods(perpage=1, page=1, includes=[])
+            await client.async_get_pods(perpage=1, page=1, includes=[])
+
+            gets = sum(len(calls) for key, calls in m.requests.items() if key[0] == 'GET')
+            assert 2 == gets
+
+            await client.async_set_charge_override(pod=pod, hours=1)
+
+            assert 0 == len(client.response_cache)
+            override = await client.async_get_charge_override(pod=pod)
+            assert ChargeOverride == type(override)
+
+@pytest.mark.asyncio
+async def test_reads_in_flight_during_a_write_are_not_cached():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    override_response = {
+        "ppid": "PSL-123456",
+        "requested_at": "2022-01-01T00:00:00.000Z",
+        "received_at": "2022-01-01T00:00:00.000Z",
+        "ends_at": "2022-01-01T03:02:01.000Z"
+    }
+    requested = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold(url, **kwargs):
+        requested.set()
+        await release.wait()
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(
+            f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}',
+            payload=override_response,
+            headers={"ETag": '"abc"'},
+            callback=hold
+        )
+        m.delete(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', status=204)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(
+                username="1233",
+                password="1234",
+                session=session,
+                response_cache=TTLCache(),
+                http_cache=HTTPCache()
+            )
+            pod = Pod(data={"unit_id": 1234})
+
+            read = asyncio.ensure_future(client.async_get_charge_override(pod=pod))
+            await requested.wait()
+            assert await client.async_delete_charge_override(pod=pod) is True
+            release.set()
+
+            assert ChargeOverride == type(await read)
+            assert 0 == len(client.response_cache)
+            assert 0 == len(client.api_wrapper._http_cache)
+
+@pytest.mark.asyncio
+@freeze_time("Jan 1st, 2022")
+async def test_concurrent_identical_gets_are_coalesced():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    connectivity_status_response = json.load(open('./tests/fixtures/connectivity_status.json'))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response, repeat=True)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response, repeat=True)
+        m.get(f'{MOBILE_API_BASE_URL}{CHARGERS}/PSL-123456{CONNECTIVITY_STATUS}?timestamp=1640995200.0', payload=connectivity_status_response, repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True)
+            await client.auth.async_update_access_token()
+            pod = Pod(data={"ppid": "PSL-123456"})
+
+            statuses = await asyncio.gather(*[client.async_get_connectivity_status(pod=pod) for _ in range(3)])
+
+            gets = sum(len(calls) for key, calls in m.requests.items() if key[0] == 'GET')
+            assert 1 == gets
+            assert statuses[0] is statuses[1] is statuses[2]
+
+            client = PodPointClient(username="1233", password="1234", session=session, include_timestamp=True, coalesce_requests=False)
+            await client.auth.async_update_access_token()
+            await asyncio.gather(*[client.async_get_connectivity_status(pod=pod) for _ in range(2)])
+
+            gets = sum(len(calls) for key, calls in m.requests.items() if key[0] == 'GET')
+            assert 3 == gets
+
+@pytest.mark.asyncio
+async def test_gets_after_a_write_do_not_join_gets_from_before_it():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    override_response = {
+        "ppid": "PSL-123456",
+        "requested_at": "2022-01-01T00:00:00.000Z",
+        "received_at": "2022-01-01T00:00:00.000Z",
+        "ends_at": "2022-01-01T03:02:01.000Z"
+    }
+    requested = asyncio.Event()
+    release = asyncio.Event()
+    overrides = []
+
+    async def override(url, **kwargs):
+        # The first GET is held until after the write, and sees no override
+        if len(overrides) == 0:
+            overrides.append(None)
+            requested.set()
+            await release.wait()
+            return CallbackResult(status=204)
+
+        return CallbackResult(payload=override_response)
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', callback=override, repeat=True)
+        m.put(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}', payload=override_response)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            pod = Pod(data={"unit_id": 1234})
+
+            before = asyncio.ensure_future(client.async_get_charge_override(pod=pod))
+            await requested.wait()
+            await client.async_set_charge_override(pod=pod, hours=1)
+            after = asyncio.ensure_future(client.async_get_charge_override(pod=pod))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await before is None
+            assert ChargeOverride == type(await after)
+            assert 2 == len(m.requests[('GET', URL(f'{API_BASE_URL}{UNITS}/1234{CHARGE_OVERRIDE}'))])
+
+@pytest.mark.asyncio
+async def test_async_refresh_pods():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    firmware_response = json.load(open('./tests/fixtures/complete_firmware.json'))
+    connectivity_status_response = json.load(open('./tests/fixtures/connectivity_status.json'))
+    override_response = {
+        "ppid": "PSL-123456",
+        "requested_at": "2022-01-01T00:00:00.000Z",
+        "received_at": "2022-01-01T00:00:00.000Z",
+        "ends_at": "2022-01-01T03:02:01.000Z"
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}', payload=firmware_response)
+        m.get(f'{API_BASE_URL}{UNITS}/2{FIRMWARE}', status=500, body="Error")
+        m.get(f'{MOBILE_API_BASE_URL}{CHARGERS}/PSL-1{CONNECTIVITY_STATUS}', payload=connectivity_status_response)
+        m.get(f'{MOBILE_API_BASE_URL}{CHARGERS}/PSL-2{CONNECTIVITY_STATUS}', payload=connectivity_status_response)
+        m.get(f'{API_BASE_URL}{UNITS}/1{CHARGE_OVERRIDE}', payload=override_response)
+        m.get(f'{API_BASE_URL}{UNITS}/2{CHARGE_OVERRIDE}', status=204)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            pods = [Pod(data={"unit_id": 1, "ppid": "PSL-1"}), Pod(data={"unit_id": 2, "ppid": "PSL-2"})]
+
+            refreshed = await client.async_refresh_pods(pods=pods, concurrency=2)
+
+            assert pods == refreshed
+            first, second = pods
+            assert isinstance(first.firmware, Firmware)
+            assert first.firmware.serial_number == '123456789'
+            assert second.firmware is None
+
+            for pod in pods:
+                assert isinstance(pod.connectivity_status, ConnectivityStatus)
+                assert pod.offering_energy is True
+                assert pod.charging_state == "SUSPENDED_EV"
+                assert pod.last_message_at == datetime(2024, 4, 5, 18, 26, 28, tzinfo=timezone.utc)
+
+            assert isinstance(first.charge_override, ChargeOverride)
+            assert second.charge_override is None
+
+            session_posts = sum(len(calls) for key, calls in m.requests.items() if key[0] == 'POST')
+            assert 2 == session_posts
+
+@pytest.mark.asyncio
+async def test_rejected_session_is_recreated_and_the_request_retried():
+    first_auth_response = {
+        "idToken": "rejected",
+        "expiresIn": "3600",
+        "refreshToken": "1234"
+    }
+    second_auth_response = {
+        "idToken": "accepted",
+        "expiresIn": "3600",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    firmware_response = json.load(open('./tests/fixtures/complete_firmware.json'))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=first_auth_response)
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=second_auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response, repeat=True)
+        m.get(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}', status=401, body="Unauthenticated.")
+        m.get(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}', payload=firmware_response)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            firmwares = await client.async_get_firmware(pod=Pod(data={"unit_id": 1}))
+
+            assert '123456789' == firmwares[0].serial_number
+            assert "accepted" == client.auth.access_token
+
+            firmware_calls = m.requests[('GET', URL(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}'))]
+            assert ["Bearer rejected", "Bearer accepted"] == [call.kwargs["headers"]["Authorization"] for call in firmware_calls]
+            assert 2 == len(m.requests[('POST', URL(f'{API_BASE_URL}{SESSIONS}'))])
+
+@pytest.mark.asyncio
+async def test_a_second_rejection_is_raised():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "3600",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response, repeat=True)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response, repeat=True)
+        m.get(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}', status=401, body="Unauthorized.", repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            with pytest.raises(APIError):
+                await client.async_get_firmware(pod=Pod(data={"unit_id": 1}))
+
+            assert 2 == len(m.requests[('GET', URL(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}'))])
+
+@pytest.mark.asyncio
+async def test_forbidden_requests_are_not_retried():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "3600",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response, repeat=True)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response, repeat=True)
+        m.get(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}', status=403, body="Forbidden.", repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            client = PodPointClient(username="1233", password="1234", session=session)
+            with pytest.raises(APIError) as exc_info:
+                await client.async_get_firmware(pod=Pod(data={"unit_id": 1}))
+
+            assert 403 == exc_info.value.args[0]
+            assert 1 == len(m.requests[('GET', URL(f'{API_BASE_URL}{UNITS}/1{FIRMWARE}'))])
+            assert 1 == len(m.requests[('POST', URL(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}'))])
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from podpointclient.helpers.coalescer import RequestCoalescer
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_call():
+    coalescer = RequestCoalescer()
+    calls = []
+    release = asyncio.Event()
+
+    async def request():
+        calls.append(1)
+        await release.wait()
+        return object()
+
+    tasks = [asyncio.ensure_future(coalescer.run("key", request)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert 1 == len(coalescer)
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert 1 == len(calls)
+    assert results[0] is results[1] is results[2]
+    assert 0 == len(coalescer)
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_shared():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return len(calls)
+
+    await asyncio.gather(coalescer.run("one", request), coalescer.run("two", request))
+
+    assert 2 == len(calls)
+
+@pytest.mark.asyncio
+async def test_exceptions_are_shared_and_not_cached():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        coalescer.run("key", request),
+        coalescer.run("key", request),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert 1 == len(calls)
+
+    with pytest.raises(ValueError):
+        await coalescer.run("key", request)
+    assert 2 == len(calls)
+
+@pytest.mark.asyncio
+async def test_cancelling_a_caller_does_not_cancel_the_request():
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def request():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(coalescer.run("key", request))
+    second = asyncio.ensure_future(coalescer.run("key", request))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert "done" == await second
+    assert first.cancelled() is True
+
+@pytest.mark.asyncio
+async def test_forgotten_requests_are_not_joined():
+    coalescer = RequestCoalescer()
+    calls = []
+    release = asyncio.Event()
+
+    async def request():
+        calls.append(1)
+        call = len(calls)
+        await release.wait()
+        return call
+
+    first = asyncio.ensure_future(coalescer.run("key", request))
+    await asyncio.sleep(0)
+    coalescer.forget()
+    assert 0 == len(coalescer)
+
+    second = asyncio.ensure_future(coalescer.run("key", request))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert [1, 2] == [await first, await second]
+    assert 2 == len(calls)
@@ -0,0 +1,57 @@
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from podpointclient.client import PodPointClient
+from podpointclient.helpers.api_wrapper import APIWrapper
+from podpointclient.helpers.connection_pool import ConnectionPool
+
+def test_session_is_not_created_until_used():
+    pool = ConnectionPool()
+
+    assert pool.closed is True
+    assert pool._session is None
+
+@pytest.mark.asyncio
+async def test_connector_is_configured():
+    pool = ConnectionPool(limit=20, limit_per_host=5, keepalive_timeout=15, ttl_dns_cache=60)
+
+    session = pool.session
+    assert isinstance(session, aiohttp.ClientSession)
+    assert pool.session is session
+    assert session.connector.limit == 20
+    assert session.connector.limit_per_host == 5
+    assert session.connector.use_dns_cache is True
+
+    await pool.close()
+    assert pool.closed is True
+    assert session.closed is True
+
+@pytest.mark.asyncio
+async def test_pool_can_be_used_as_a_session():
+    with aioresponses() as m:
+        m.get('https://google.com/api/v1/test', status=200, body="OK")
+
+        async with ConnectionPool() as pool:
+            wrapper = APIWrapper(pool)
+            async with await wrapper.get("https://google.com/api/v1/test", headers={}) as result:
+                assert 200 == result.status
+                assert "OK" == await result.text()
+
+        assert pool.closed is True
+
+@pytest.mark.asyncio
+async def test_client_closes_pool_it_owns():
+    async with PodPointClient(username="1233", password="1234") as client:
+        assert isinstance(client._session, ConnectionPool)
+        session = client._session.session
+
+    assert session.closed is True
+
+@pytest.mark.asyncio
+async def test_client_does_not_close_a_session_it_was_given():
+    async with aiohttp.ClientSession() as session:
+        async with PodPointClient(username="1233", password="1234", session=session):
+            pass
+
+        assert session.closed is False
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+import json
+import os
+
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from yarl import URL
+
+from podpointclient.endpoints import GOOGLE_BASE_URL, PASSWORD_VERIFY, GOOGLE_TOKEN_BASE_URL, TOKEN, API_BASE_URL, SESSIONS
+from podpointclient.helpers.auth import Auth
+from podpointclient.helpers.credential_store import CredentialStore, FileCredentialStore
+
+EMAIL: str = 'test@example.com'
+PASSWORD: str = 'passw0rd!'
+
+def credentials(expiry: datetime):
+    return {
+        "access_token": "1234",
+        "refresh_token": "5678",
+        "access_token_expiry": expiry.isoformat(),
+        "user_id": 1234,
+        "session_id": "abcd"
+    }
+
+def test_base_store_is_abstract():
+    with pytest.raises(TypeError):
+        CredentialStore()
+
+def test_store_missing_a_method_can_not_be_created():
+    class LoadOnlyStore(CredentialStore):
+        def load(self, email):
+            return None
+
+    with pytest.raises(TypeError):
+        LoadOnlyStore()
+
+def test_file_store_round_trip(tmp_path):
+    path = tmp_path / "credentials.json"
+    store = FileCredentialStore(str(path))
+    expiry = datetime(2022, 1, 1, 12, 0, 0)
+
+    assert store.load(EMAIL) is None
+
+    store.save(EMAIL, credentials(expiry))
+    store.save("other@example.com", credentials(expiry))
+
+    assert store.load(EMAIL) == credentials(expiry)
+    assert json.load(open(path))["other@example.com"] == credentials(expiry)
+    assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+    # Only the credentials file remains, temporary files are moved into place
+    assert os.listdir(tmp_path) == ["credentials.json"]
+
+    store.clear(EMAIL)
+    assert store.load(EMAIL) is None
+    assert store.load("other@example.com") is not None
+
+def test_file_store_ignores_invalid_files(tmp_path):
+    path = tmp_path / "credentials.json"
+    path.write_text("not json")
+
+    store = FileCredentialStore(str(path))
+    assert store.load(EMAIL) is None
+
+@pytest.mark.asyncio
+async def test_auth_uses_stored_credentials_without_requests(tmp_path):
+    store = FileCredentialStore(str(tmp_path / "credentials.json"))
+    store.save(EMAIL, credentials(datetime.now() + timedelta(minutes=30)))
+
+    # No responses are registered, any request would fail
+    with aioresponses():
+        async with aiohttp.ClientSession() as session:
+            auth = Auth(email=EMAIL, password=PASSWORD, session=session, credential_store=store)
+
+            assert await auth.async_update_access_token() is True
+            assert auth.access_token == "1234"
+            assert auth.refresh_token == "5678"
+            assert auth.user_id == 1234
+            assert auth.session.session_id == "abcd"
+
+@pytest.mark.asyncio
+async def test_auth_saves_credentials_after_login(tmp_path):
+    auth_response = {
+        "expiresIn": "1234",
+        "idToken": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    store = FileCredentialStore(str(tmp_path / "credentials.json"))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+
+        async with aiohttp.ClientSession() as session:
+            auth = Auth(email=EMAIL, password=PASSWORD, session=session, credential_store=store)
+
+            assert await auth.async_update_access_token() is True
+
+            stored = store.load(EMAIL)
+            assert stored["access_token"] == "1234"
+            assert stored["user_id"] == "1234"
+            assert datetime.fromisoformat(stored["access_token_expiry"]) == auth.access_token_expiry
+            assert "password" not in stored
+
+            auth.invalidate_session()
+            assert store.load(EMAIL) is None
+
+@pytest.mark.asyncio
+async def test_auth_logs_in_again_when_the_stored_refresh_token_is_revoked(tmp_path):
+    auth_response = {
+        "expiresIn": "1234",
+        "idToken": "9999",
+        "refreshToken": "9999"
+    }
+    session_response = {
+        "sessions": {
+            "id": "efgh",
+            "user_id": "1234"
+        }
+    }
+    store = FileCredentialStore(str(tmp_path / "credentials.json"))
+    store.save(EMAIL, credentials(datetime.now() - timedelta(minutes=30)))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}', status=400, body='{"error": {"message": "INVALID_REFRESH_TOKEN"}}')
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+
+        async with aiohttp.ClientSession() as session:
+            auth = Auth(email=EMAIL, password=PASSWORD, session=session, credential_store=store)
+
+            assert await auth.async_update_access_token() is True
+            assert 1 == len(m.requests[('POST', URL(f'{GOOGLE_TOKEN_BASE_URL}{TOKEN}'))])
+            assert 1 == len(m.requests[('POST', URL(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}'))])
+            assert auth.refresh_token == "9999"
+
+            stored = store.load(EMAIL)
+            assert stored["access_token"] == "9999"
+            assert stored["refresh_token"] == "9999"
+            assert stored["session_id"] == "efgh"
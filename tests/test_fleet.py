@@ -0,0 +1,208 @@
+import asyncio
+from datetime import datetime, timedelta
+import json
+import re
+
+from aioresponses import aioresponses
+import aiohttp
+import pytest
+
+from podpointclient.client import PodPointClient
+from podpointclient.endpoints import GOOGLE_BASE_URL, PASSWORD_VERIFY, API_BASE_URL, SESSIONS, USERS, PODS, UNITS, FIRMWARE, CHARGE_OVERRIDE, MOBILE_API_BASE_URL, CHARGERS, CONNECTIVITY_STATUS
+from podpointclient.errors import APIError
+from podpointclient.fleet import PodPointFleet, FleetCycle, FleetResult
+from podpointclient.helpers.connection_pool import ConnectionPool
+from podpointclient.helpers.rate_limiter import RateLimiter
+from podpointclient.pod import Pod
+
+def fleet_with_accounts(count, **kwargs):
+    fleet = PodPointFleet(**kwargs)
+    for number in range(count):
+        fleet.add_account(username=f"user{number}@example.com", password="1234")
+
+    return fleet
+
+@pytest.mark.asyncio
+async def test_accounts_share_the_fleet_session_and_client_kwargs():
+    rate_limiter = RateLimiter()
+    fleet = PodPointFleet(rate_limiter=rate_limiter, include_timestamp=True)
+
+    first = fleet.add_account(username="first@example.com", password="1234")
+    second = fleet.add_account(username="second@example.com", password="1234", include_timestamp=False)
+
+    assert 2 == len(fleet)
+    assert {"first@example.com": first, "second@example.com": second} == fleet.clients
+    assert isinstance(first, PodPointClient)
+    assert isinstance(fleet._session, ConnectionPool)
+    assert first._session is fleet._session
+    assert second._session is fleet._session
+    assert first.api_wrapper._rate_limiter is rate_limiter
+    assert first.include_timestamp is True
+    assert second.include_timestamp is False
+
+    with pytest.raises(ValueError):
+        fleet.add_account(username="first@example.com", password="1234")
+
+    await fleet.remove_account("first@example.com")
+    assert ["second@example.com"] == list(fleet.clients)
+
+    await fleet.async_close()
+    assert fleet._session.closed is True
+
+@pytest.mark.asyncio
+async def test_async_poll_returns_a_result_for_every_account_in_order():
+    async def poll(client):
+        # Finish in the reverse order to the accounts being added
+        await asyncio.sleep(0.01 * (3 - int(client.email[4])))
+        if client.email.startswith("user1"):
+            raise APIError("Unavailable")
+        return client.email
+
+    async with fleet_with_accounts(3, poll=poll, jitter=0) as fleet:
+        cycle = await fleet.async_poll()
+
+        assert isinstance(cycle, FleetCycle)
+        assert 1 == cycle.number
+        assert ["user0@example.com", "user1@example.com", "user2@example.com"] == [result.username for result in cycle.results]
+        assert ["user0@example.com", "user2@example.com"] == [result.value for result in cycle.succeeded]
+
+        failed, = cycle.failed
+        assert isinstance(failed, FleetResult)
+        assert failed.ok is False
+        assert failed.value is None
+        assert isinstance(failed.error, APIError)
+
+@pytest.mark.asyncio
+async def test_async_iter_poll_yields_results_as_they_complete():
+    async def poll(client):
+        await asyncio.sleep(0.01 * (3 - int(client.email[4])))
+        return client.email
+
+    async with fleet_with_accounts(3, poll=poll, jitter=0) as fleet:
+        usernames = [result.username async for result in fleet.async_iter_poll()]
+
+        assert ["user2@example.com", "user1@example.com", "user0@example.com"] == usernames
+
+@pytest.mark.asyncio
+async def test_polls_are_bounded_by_concurrency():
+    running = 0
+    most_running = 0
+
+    async def poll(client):
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    async with fleet_with_accounts(10, poll=poll, jitter=0, concurrency=3) as fleet:
+        cycle = await fleet.async_poll()
+
+        assert 10 == len(cycle.succeeded)
+        assert 3 == most_running
+
+@pytest.mark.asyncio
+async def test_polls_start_after_a_jittered_delay():
+    delays = []
+
+    async def sleep(seconds):
+        delays.append(seconds)
+
+    async def poll(client):
+        return None
+
+    async with fleet_with_accounts(20, poll=poll, jitter=5.0, sleep=sleep) as fleet:
+        await fleet.async_poll()
+
+        assert 20 == len(delays)
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+@pytest.mark.asyncio
+async def test_async_iter_cycles_polls_every_interval():
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    async def poll(client):
+        return None
+
+    async with fleet_with_accounts(2, poll=poll, jitter=0, interval=30, sleep=sleep) as fleet:
+        cycles = [cycle async for cycle in fleet.async_iter_cycles(cycles=3)]
+
+        assert [1, 2, 3] == [cycle.number for cycle in cycles]
+        assert all(2 == len(cycle.succeeded) for cycle in cycles)
+        assert 2 == len(sleeps)
+        assert all(29 < seconds <= 30 for seconds in sleeps)
+
+@pytest.mark.asyncio
+async def test_token_refreshes_are_staggered_once_logged_in():
+    async def poll(client):
+        # Log in without making a request
+        if client.email != "user0@example.com":
+            client.auth.access_token = "1234"
+            client.auth.access_token_expiry = datetime.now() + timedelta(hours=1)
+
+    fleet = fleet_with_accounts(
+        5,
+        poll=poll,
+        jitter=0,
+        refresh_margin=timedelta(minutes=5),
+        refresh_jitter=timedelta(minutes=10)
+    )
+    await fleet.async_poll()
+
+    margins = list(fleet._refresh_margins.values())
+    assert all(timedelta(minutes=5) <= margin <= timedelta(minutes=15) for margin in margins)
+    assert len(set(margins)) > 1
+
+    clients = fleet.clients
+    assert clients["user0@example.com"].auth._background_refresh_task is None
+    tasks = [clients[f"user{number}@example.com"].auth._background_refresh_task for number in range(1, 5)]
+    assert all(task is not None and not task.done() for task in tasks)
+
+    await fleet.async_close()
+    assert all(task.done() for task in tasks)
+
+@pytest.mark.asyncio
+async def test_default_poll_returns_refreshed_pods():
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+    pods_response = {"pods": [json.load(open('./tests/fixtures/complete_pod.json'))]}
+    firmware_response = json.load(open('./tests/fixtures/complete_firmware.json'))
+    connectivity_status_response = json.load(open('./tests/fixtures/connectivity_status.json'))
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response)
+        m.get(re.compile(f'{re.escape(API_BASE_URL)}{USERS}/1234{PODS}.*'), payload=pods_response)
+        m.get(f'{API_BASE_URL}{UNITS}/198765{FIRMWARE}', payload=firmware_response)
+        m.get(f'{MOBILE_API_BASE_URL}{CHARGERS}/PSL-254321{CONNECTIVITY_STATUS}', payload=connectivity_status_response)
+        m.get(f'{API_BASE_URL}{UNITS}/198765{CHARGE_OVERRIDE}', status=204)
+
+        async with aiohttp.ClientSession() as session:
+            async with PodPointFleet(session=session, jitter=0) as fleet:
+                fleet.add_account(username="user@example.com", password="1234")
+
+                cycle = await fleet.async_poll()
+
+                result, = cycle.results
+                assert result.ok is True
+                pod, = result.value
+                assert isinstance(pod, Pod)
+                assert "PSL-254321" == pod.ppid
+                assert pod.firmware.serial_number == '123456789'
+                assert pod.connectivity_status is not None
+
+            # The fleet does not close a session it was given
+            assert session.closed is False
@@ -2,7 +2,7 @@ from re import X
 from datetime import datetime, timezone, timedelta
 import pytest
 import pytz
-from podpointclient.helpers.functions import auth_headers, lazy_convert_to_datetime, lazy_iso_format_datetime
+from podpointclient.helpers.functions import async_sleep, auth_headers, lazy_convert_to_datetime, lazy_iso_format_datetime, _convert_to_datetime
 import logging
 
 def test_auth_headers():
@@ -35,4 +35,31 @@ def test_lazy_iso_format_datetime():
     assert lazy_iso_format_datetime(date_time=12345) == None
 
     # When passing a datetime
-    assert lazy_iso_format_datetime(date_time=datetime(2022,1,25,9,0,0, tzinfo=timezone.utc)) == "2022-01-25T09:00:00+00:00"
\ No newline at end of file
+    assert lazy_iso_format_datetime(date_time=datetime(2022,1,25,9,0,0, tzinfo=timezone.utc)) == "2022-01-25T09:00:00+00:00"
+
+def test_lazy_convert_to_datetime_caches_results(caplog):
+    _convert_to_datetime.cache_clear()
+
+    first = lazy_convert_to_datetime("2024-04-05T18:26:26.819Z")
+    assert first == datetime(2024,4,5,18,26,26,819000, tzinfo=timezone.utc)
+    assert lazy_convert_to_datetime("2024-04-05T18:26:26.819Z") is first
+    assert 1 == _convert_to_datetime.cache_info().hits
+
+    # Failures are not cached, so are logged every time
+    caplog.set_level(logging.WARNING)
+    caplog.clear()
+    assert lazy_convert_to_datetime("Break Me") is None
+    assert lazy_convert_to_datetime("Break Me") is None
+    assert 2 == len(caplog.records)
+
+@pytest.mark.asyncio
+async def test_async_sleep_uses_the_injected_sleep():
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    await async_sleep(5, sleep=sleep)
+    await async_sleep(0)
+
+    assert [5] == sleeps
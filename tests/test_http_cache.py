@@ -0,0 +1,94 @@
+from podpointclient.helpers.api_response import APIResponse
+from podpointclient.helpers.http_cache import HTTPCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def response(headers=None, body=b'{}'):
+    return APIResponse(
+        method="get",
+        url="https://google.com/api/v1/test",
+        status=200,
+        headers=headers if headers is not None else {},
+        body=body
+    )
+
+def test_key_ignores_timestamp_and_param_order():
+    assert HTTPCache.key_for("https://google.com", {"a": 1, "b": 2, "timestamp": 1.0}) == \
+        HTTPCache.key_for("https://google.com", {"b": 2, "a": 1})
+    assert HTTPCache.key_for("https://google.com", None) == HTTPCache.key_for("https://google.com", {})
+    assert HTTPCache.key_for("https://google.com", {"page": 1}) != HTTPCache.key_for("https://google.com", {"page": 2})
+
+def test_stores_responses_with_validators():
+    cache = HTTPCache()
+    key = cache.key_for("https://google.com", None)
+
+    assert cache.store(key, response()) is None
+    assert cache.get(key) is None
+
+    entry = cache.store(key, response(headers={"ETag": '"abc"', "Last-Modified": "Sat, 01 Jan 2022 00:00:00 GMT"}))
+    assert entry is cache.get(key)
+    assert {"If-None-Match": '"abc"', "If-Modified-Since": "Sat, 01 Jan 2022 00:00:00 GMT"} == entry.validators
+    assert cache.fresh(entry) is False
+
+def test_does_not_store_no_store_responses():
+    cache = HTTPCache(ttl=60)
+    key = cache.key_for("https://google.com", None)
+
+    assert cache.store(key, response(headers={"ETag": '"abc"', "Cache-Control": "no-store"})) is None
+    assert 0 == len(cache)
+
+def test_ttl():
+    clock = FakeClock()
+    cache = HTTPCache(ttl=30, clock=clock)
+    key = cache.key_for("https://google.com", None)
+
+    entry = cache.store(key, response())
+    clock.now = 29
+    assert cache.fresh(entry) is True
+    clock.now = 30
+    assert cache.fresh(entry) is False
+
+def test_revalidated_updates_entry():
+    clock = FakeClock()
+    cache = HTTPCache(ttl=30, clock=clock)
+    key = cache.key_for("https://google.com", None)
+    cached = response(headers={"ETag": '"abc"'})
+    entry = cache.store(key, cached)
+
+    clock.now = 40
+    not_modified = APIResponse(method="get", url="https://google.com", status=304, headers={"ETag": '"def"'}, body=b"")
+    assert cached is cache.revalidated(entry, not_modified)
+    assert '"def"' == entry.etag
+    assert cache.fresh(entry) is True
+
+def test_evicts_least_recently_used():
+    cache = HTTPCache(ttl=60, max_entries=2)
+    first, second, third = [cache.key_for(f"https://google.com/{i}", None) for i in range(3)]
+
+    cache.store(first, response())
+    cache.store(second, response())
+    cache.get(first)
+    cache.store(third, response())
+
+    assert cache.get(first) is not None
+    assert cache.get(second) is None
+    assert cache.get(third) is not None
+
+    cache.clear()
+    assert 0 == len(cache)
+
+def test_responses_requested_before_a_clear_are_not_stored():
+    cache = HTTPCache()
+    key = cache.key_for("https://google.com", None)
+
+    generation = cache.generation
+    cache.clear()
+
+    assert cache.store(key, response(headers={"ETag": '"abc"'}), generation=generation) is None
+    assert 0 == len(cache)
+    assert cache.store(key, response(headers={"ETag": '"abc"'}), generation=cache.generation) is not None
@@ -232,3 +232,35 @@ def test_serialisation():
     assert pod.location.to_json() == '{"lat": 51.4995, "lng": 0.1248}'
     assert pod.statuses[0].to_json() == '{"id": 2, "name": "Charging", "key_name": "charging", "label": "Charging", "door": "A", "door_id": 1}'
     assert pod.firmware.to_json() == '{"serial_number": "123456789", "version_info": {"manifest_id": "A30P-3.1.22-00001"}, "update_status": {"is_update_available": false}}'
+
+def test_lazy_pod_builds_nested_objects_on_first_access():
+    pod = Pod(data=complete_pod_fixture(), lazy=True)
+
+    for attribute in Pod.LAZY_ATTRIBUTES:
+        assert attribute not in pod.__dict__
+
+    assert pod.id == 113113
+    assert pod.ppid == "PSL-254321"
+
+    model = pod.model
+    assert 'model' in pod.__dict__
+    assert model is pod.model
+    assert 'statuses' not in pod.__dict__
+
+def test_lazy_pod_matches_eager_pod():
+    lazy_pod = Pod(data=complete_pod_fixture(), lazy=True)
+    eager_pod = Pod(data=complete_pod_fixture())
+
+    for attribute in Pod.LAZY_ATTRIBUTES:
+        assert attribute in eager_pod.__dict__
+    assert '_data' not in eager_pod.__dict__
+
+    assert eager_pod.dict == lazy_pod.dict
+
+def test_lazy_attributes_can_be_assigned():
+    pod = Pod(data=complete_pod_fixture(), lazy=True)
+
+    pod.charge_override = None
+
+    assert pod.charge_override is None
+    assert pod.charge_mode == "Smart"
@@ -21,3 +21,9 @@ def test_pod_factory_with_no_pods():
 def test_pod_factory_with_none_passed():
     factory = PodFactory()
     assert factory.build_pods(None) == []
+
+def test_pod_factory_lazy_pod_creation():
+    pods = PodFactory().build_pods(pods_response=Mocks().pods_response(), lazy=True)
+
+    assert 1 == len(pods)
+    assert 'model' not in pods[0].__dict__
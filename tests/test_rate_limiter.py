@@ -0,0 +1,102 @@
+import asyncio
+
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from podpointclient.client import PodPointClient
+from podpointclient.endpoints import API_BASE_URL, MOBILE_API_BASE_URL, GOOGLE_BASE_URL, GOOGLE_TOKEN_BASE_URL, PASSWORD_VERIFY, SESSIONS, USERS, PODS, CHARGERS, CONNECTIVITY_STATUS
+from podpointclient.helpers.rate_limiter import RateLimiter, TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_a_burst_then_queues():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        assert await bucket.acquire() == 0
+
+    # The bucket is empty, each request waits for a token at 2 per second
+    assert await bucket.acquire() == 0.5
+    assert await bucket.acquire() == 0.5
+    assert clock.sleeps == [0.5, 0.5]
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    assert bucket.tokens == 0
+
+    clock.now += 100
+    assert bucket.tokens == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_queued_not_failed():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+
+    waits = await asyncio.gather(*[bucket.acquire() for _ in range(4)])
+
+    assert sorted(waits) == [0, 1, 1, 1]
+    assert clock.now == 3
+
+def test_keys_by_upstream():
+    limiter = RateLimiter(limits={"example.com": (1, 1)})
+
+    assert limiter.key_for(f"{API_BASE_URL}{USERS}/1{PODS}") == API_BASE_URL
+    assert limiter.key_for(f"{MOBILE_API_BASE_URL}{CHARGERS}/PSL-1{CONNECTIVITY_STATUS}") == MOBILE_API_BASE_URL
+    assert limiter.key_for(f"{GOOGLE_BASE_URL}{PASSWORD_VERIFY}") == GOOGLE_BASE_URL
+    assert limiter.key_for(f"{GOOGLE_TOKEN_BASE_URL}/token") == GOOGLE_TOKEN_BASE_URL
+    assert limiter.key_for("https://example.com/foo") == "example.com"
+
+    assert limiter.bucket(f"{API_BASE_URL}{USERS}") is limiter.bucket(f"{API_BASE_URL}{PODS}")
+    assert limiter.bucket(f"{API_BASE_URL}{USERS}") is not limiter.bucket(MOBILE_API_BASE_URL)
+    assert limiter.bucket("https://example.com/foo").rate == 1
+
+@pytest.mark.asyncio
+async def test_limiter_is_shared_between_clients():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+    auth_response = {
+        "idToken": "1234",
+        "expiresIn": "1234",
+        "refreshToken": "1234"
+    }
+    session_response = {
+        "sessions": {
+            "id": "1234",
+            "user_id": "1234"
+        }
+    }
+
+    with aioresponses() as m:
+        m.post(f'{GOOGLE_BASE_URL}{PASSWORD_VERIFY}', payload=auth_response, repeat=True)
+        m.post(f'{API_BASE_URL}{SESSIONS}', payload=session_response, repeat=True)
+        m.get(f'{API_BASE_URL}{USERS}/1234{PODS}?perpage=1&page=1', payload={"pods": []}, repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            clients = [
+                PodPointClient(username="1233", password="1234", session=session, rate_limiter=limiter)
+                for _ in range(2)
+            ]
+            for client in clients:
+                await client.async_credentials_verified()
+
+        # Two logins to google fit in its burst, but the four requests to the API
+        # (a session and listing per client) had to wait for two tokens
+        assert clock.sleeps == [1, 1]
@@ -0,0 +1,56 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import aiohttp
+
+from podpointclient.helpers.retry import RetryPolicy
+
+def test_can_retry_idempotent_methods_only():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.can_retry("get", 1) is True
+    assert policy.can_retry("put", 2) is True
+    assert policy.can_retry("delete", 1) is True
+    assert policy.can_retry("get", 3) is False
+    assert policy.can_retry("post", 1) is False
+
+def test_retries_exception():
+    policy = RetryPolicy()
+
+    assert policy.retries_exception(asyncio.TimeoutError()) is True
+    assert policy.retries_exception(aiohttp.ClientConnectionError()) is True
+    assert policy.retries_exception(KeyError()) is False
+    assert policy.retries_exception(None) is False
+
+def test_backoff_without_jitter():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3, jitter=False)
+
+    assert policy.backoff(1) == 0.5
+    assert policy.backoff(2) == 1.0
+    assert policy.backoff(3) == 2.0
+    assert policy.backoff(4) == 3
+
+def test_backoff_with_jitter():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3, jitter=True)
+
+    for attempt in range(1, 6):
+        for _ in range(20):
+            assert 0 <= policy.backoff(attempt) <= min(3, 0.5 * (2 ** (attempt - 1)))
+
+def test_delay_honours_retry_after():
+    policy = RetryPolicy(jitter=False, retry_after_max=30)
+
+    assert policy.delay(1, retry_after="7") == 7
+    assert policy.delay(1, retry_after="120") == 30
+    assert policy.delay(1, retry_after="nonsense") == 0.5
+    assert policy.delay(1, retry_after=None) == 0.5
+
+    policy = RetryPolicy(jitter=False, respect_retry_after=False)
+    assert policy.delay(1, retry_after="7") == 0.5
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=20)
+    seconds = RetryPolicy.parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert 18 <= seconds <= 20
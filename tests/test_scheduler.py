@@ -0,0 +1,225 @@
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+
+from podpointclient.charge_override import ChargeOverride
+from podpointclient.connectivity_status import ConnectivityStatus
+from podpointclient.errors import APIError
+from podpointclient.pod import Pod
+from podpointclient.scheduler import PodState, PollingPolicy, PollScheduler, POLL_RETRY_INTERVAL, pod_state
+
+def connectivity_status(status="ONLINE", charging_state="SUSPENDED_EV", offering_energy=True):
+    data = json.load(open('./tests/fixtures/connectivity_status.json'))
+    evse = data["evses"][0]
+    evse["connectivityState"]["connectivityStatus"] = status
+    evse["connectors"][0]["chargingState"] = charging_state
+    evse["energyOfferStatus"]["isOfferingEnergy"] = offering_energy
+
+    return ConnectivityStatus(data=data)
+
+def refreshed_pod(unit_id=1, status="ONLINE", charging_state="SUSPENDED_EV", offering_energy=True, override_ends_at=None):
+    pod = Pod(data={"unit_id": unit_id, "ppid": f"PSL-{unit_id}"})
+    set_state(pod, status=status, charging_state=charging_state, offering_energy=offering_energy, override_ends_at=override_ends_at)
+
+    return pod
+
+def set_state(pod, status="ONLINE", charging_state="SUSPENDED_EV", offering_energy=True, override_ends_at=None):
+    pod.connectivity_status = connectivity_status(status, charging_state, offering_energy)
+    pod.charging_state = charging_state
+    pod.offering_energy = offering_energy
+    pod.charge_override = None
+    if override_ends_at is not None:
+        pod.charge_override = ChargeOverride(data={
+            "ppid": pod.ppid,
+            "requested_at": "2022-01-01T00:00:00.000Z",
+            "received_at": "2022-01-01T00:00:00.000Z",
+            "ends_at": override_ends_at.isoformat()
+        })
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FakeClient:
+    """Lists pods and refreshes them to the states in `states`, by unit id"""
+    def __init__(self, unit_ids, states):
+        self.unit_ids = unit_ids
+        self.states = states
+        self.listings = 0
+        self.refreshed = []
+
+    async def async_get_all_pods(self):
+        self.listings += 1
+        return [Pod(data={"unit_id": unit_id, "ppid": f"PSL-{unit_id}"}) for unit_id in self.unit_ids]
+
+    async def async_refresh_pods(self, pods, firmware=True):
+        assert firmware is False
+        for pod in pods:
+            self.refreshed.append(pod.unit_id)
+            set_state(pod, **self.states[pod.unit_id])
+        return pods
+
+def test_pod_state():
+    in_an_hour = datetime.now(timezone.utc) + timedelta(hours=1)
+    an_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    assert PodState.UNKNOWN == pod_state(Pod(data={"unit_id": 1}))
+    assert PodState.OFFLINE == pod_state(refreshed_pod(status="OFFLINE", charging_state="CHARGING"))
+    assert PodState.CHARGING == pod_state(refreshed_pod(charging_state="CHARGING"))
+    assert PodState.OVERRIDE == pod_state(refreshed_pod(charging_state=None, offering_energy=False, override_ends_at=in_an_hour))
+    assert PodState.CONNECTED == pod_state(refreshed_pod(charging_state="SUSPENDED_EV", offering_energy=False))
+    assert PodState.CONNECTED == pod_state(refreshed_pod(charging_state=None, offering_energy=True))
+    assert PodState.IDLE == pod_state(refreshed_pod(charging_state="IDLE", offering_energy=False, override_ends_at=an_hour_ago))
+
+def test_polling_policy_intervals():
+    policy = PollingPolicy(charging=10, override=20, connected=30, idle=40, offline=50, unknown=15, jitter=0)
+
+    assert 15 == policy.interval_for(Pod(data={"unit_id": 1}))
+    assert 10 == policy.interval_for(refreshed_pod(charging_state="CHARGING"))
+    assert 30 == policy.interval_for(refreshed_pod())
+    assert 40 == policy.interval_for(refreshed_pod(charging_state=None, offering_energy=False))
+    assert 50 == policy.interval_for(refreshed_pod(status="OFFLINE"))
+
+    # An override ending before the next poll is polled when it ends
+    ends_soon = datetime.now(timezone.utc) + timedelta(seconds=5)
+    assert 0 < policy.interval_for(refreshed_pod(charging_state=None, offering_energy=False, override_ends_at=ends_soon)) <= 5
+    ends_later = datetime.now(timezone.utc) + timedelta(hours=1)
+    assert 20 == policy.interval_for(refreshed_pod(charging_state=None, offering_energy=False, override_ends_at=ends_later))
+
+def test_polling_policy_backs_off_unknown_pods():
+    policy = PollingPolicy(offline=100, unknown=15, min_interval=5, jitter=0)
+    pod = Pod(data={"unit_id": 1})
+
+    assert [15, 15, 30, 60, 100, 100] == [policy.interval_for(pod, failures=failures) for failures in range(6)]
+
+    # Intervals never fall below the minimum
+    assert 5 == PollingPolicy(unknown=0, min_interval=5, jitter=0).interval_for(pod)
+
+def test_polling_policy_jitter():
+    policy = PollingPolicy(charging=100, jitter=0.1)
+
+    intervals = {policy.interval_for(refreshed_pod(charging_state="CHARGING")) for _ in range(20)}
+
+    assert all(90 <= interval <= 110 for interval in intervals)
+    assert len(intervals) > 1
+
+@pytest.mark.asyncio
+async def test_busy_pods_are_polled_more_often_than_idle_pods():
+    client = FakeClient(
+        unit_ids=[1, 2, 3],
+        states={
+            1: {"charging_state": "CHARGING"},
+            2: {"charging_state": None, "offering_energy": False},
+            3: {"status": "OFFLINE"},
+        }
+    )
+    clock = Clock()
+    scheduler = PollScheduler(client=client, policy=PollingPolicy(jitter=0), clock=clock)
+
+    # Every pod is polled when first listed
+    polled = await scheduler.async_poll_due()
+    assert [1, 2, 3] == [pod.unit_id for pod in polled]
+    assert 1 == client.listings
+    assert 30 == scheduler.next_due_in()
+
+    # Poll for the rest of the hour, whenever a pod is due
+    while clock.now + scheduler.next_due_in() < 3600:
+        clock.now += scheduler.next_due_in()
+        await scheduler.async_poll_due()
+
+    assert 1 == client.listings
+    assert 3600 // 30 == client.refreshed.count(1)
+    assert 3600 // 600 == client.refreshed.count(2)
+    assert 3600 // 900 == client.refreshed.count(3)
+
+    # Pods are listed again after the listing interval
+    clock.now = 3600
+    await scheduler.async_poll_due()
+    assert 2 == client.listings
+
+@pytest.mark.asyncio
+async def test_listing_keeps_known_pods_state_and_schedule():
+    client = FakeClient(unit_ids=[1, 2], states={1: {"charging_state": "CHARGING"}, 2: {"charging_state": "CHARGING"}})
+    clock = Clock()
+    scheduler = PollScheduler(client=client, policy=PollingPolicy(jitter=0), clock=clock)
+    await scheduler.async_poll_due()
+
+    clock.now = 10
+    client.unit_ids = [2, 3]
+    client.states[3] = {"charging_state": None, "offering_energy": False}
+    await scheduler.async_list_pods()
+
+    assert [2, 3] == [pod.unit_id for pod in scheduler.pods]
+    pod_2, pod_3 = scheduler.pods
+    assert PodState.CHARGING == pod_state(pod_2)
+    assert PodState.UNKNOWN == pod_state(pod_3)
+    # Only the new pod is due
+    assert [pod_3] == scheduler.due()
+    assert 0 == scheduler.next_due_in()
+
+@pytest.mark.asyncio
+async def test_async_iter_updates():
+    client = FakeClient(unit_ids=[1], states={1: {"charging_state": "CHARGING"}})
+    clock = Clock()
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    list_pods = client.async_get_all_pods
+    failures = 1
+
+    async def async_get_all_pods():
+        nonlocal failures
+        if failures > 0:
+            failures -= 1
+            raise APIError("Unavailable")
+        return await list_pods()
+
+    client.async_get_all_pods = async_get_all_pods
+
+    scheduler = PollScheduler(client=client, policy=PollingPolicy(jitter=0), clock=clock, sleep=sleep)
+
+    updates = []
+    async for pods in scheduler.async_iter_updates():
+        updates.append([pod.unit_id for pod in pods])
+        if len(updates) == 3:
+            break
+
+    assert [[1], [1], [1]] == updates
+    assert [POLL_RETRY_INTERVAL, 30, 30] == sleeps
+
+@pytest.mark.asyncio
+async def test_pods_left_unknown_are_not_polled_in_a_busy_loop():
+    client = FakeClient(unit_ids=[1, 2], states={})
+    clock = Clock()
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    async def async_refresh_pods(pods, firmware=True):
+        # Every refresh fails, leaving the pods without a connectivity status
+        client.refreshed.extend(pod.unit_id for pod in pods)
+        return pods
+
+    client.async_refresh_pods = async_refresh_pods
+
+    scheduler = PollScheduler(client=client, policy=PollingPolicy(jitter=0), clock=clock, sleep=sleep)
+
+    updates = 0
+    async for pods in scheduler.async_iter_updates():
+        assert all(PodState.UNKNOWN == pod_state(pod) for pod in pods)
+        updates += 1
+        if updates == 7:
+            break
+
+    assert all(seconds > 0 for seconds in sleeps)
+    assert [30, 60, 120, 240, 480, 900] == sleeps
+    assert 7 * 2 == len(client.refreshed)
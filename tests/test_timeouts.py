@@ -0,0 +1,28 @@
+import aiohttp
+
+from podpointclient.helpers.timeouts import RequestTimeout, RequestType, TimeoutPolicy
+
+def test_client_timeout():
+    timeout = RequestTimeout(total=30, connect=5, first_byte=20)
+
+    assert aiohttp.ClientTimeout(total=30, sock_connect=5, sock_read=20) == timeout.client_timeout
+
+def test_coerce():
+    timeout = RequestTimeout(total=1)
+
+    assert RequestTimeout.coerce(None) is None
+    assert RequestTimeout.coerce(timeout) is timeout
+    assert RequestTimeout(total=2.5) == RequestTimeout.coerce(2.5)
+
+def test_for_type():
+    policy = TimeoutPolicy(control=RequestTimeout(total=2))
+
+    assert RequestTimeout(total=2) == policy.for_type(RequestType.CONTROL)
+    assert policy.listing == policy.for_type(RequestType.LISTING)
+    assert policy.auth == policy.for_type(RequestType.AUTH)
+    assert policy.default == policy.for_type(RequestType.DEFAULT)
+
+def test_control_requests_fail_faster_than_listings():
+    policy = TimeoutPolicy()
+
+    assert policy.control.total < policy.default.total < policy.listing.total
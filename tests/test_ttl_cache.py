@@ -0,0 +1,82 @@
+from podpointclient.helpers.ttl_cache import TTLCache, MISSING
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_results_expire_after_their_endpoint_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttls={"pods": 10, "firmware": 100}, clock=clock)
+
+    cache.set("pods", 1, value="pods")
+    cache.set("firmware", 1, value="firmware")
+
+    clock.now = 9
+    assert "pods" == cache.get("pods", 1)
+    clock.now = 10
+    assert cache.get("pods", 1) is MISSING
+    assert "firmware" == cache.get("firmware", 1)
+
+def test_endpoints_without_a_ttl_are_not_cached():
+    cache = TTLCache(ttls={"pods": 0})
+
+    cache.set("pods", 1, value="pods")
+    cache.set("unknown", 1, value="unknown")
+
+    assert cache.caches("pods") is False
+    assert cache.get("pods", 1) is MISSING
+    assert cache.get("unknown", 1) is MISSING
+    assert 0 == len(cache)
+
+def test_none_can_be_cached():
+    cache = TTLCache()
+
+    cache.set("charge_override", 1, value=None)
+
+    assert cache.get("charge_override", 1) is None
+
+def test_invalidate_by_tag():
+    cache = TTLCache()
+
+    cache.set("firmware", 1, value="one", tags=("unit:1",))
+    cache.set("firmware", 2, value="two", tags=("unit:2",))
+    cache.set("pods", 5, 1, value="pods", tags=("pods",))
+
+    assert 2 == cache.invalidate("unit:1", "pods")
+    assert cache.get("firmware", 1) is MISSING
+    assert cache.get("pods", 5, 1) is MISSING
+    assert "two" == cache.get("firmware", 2)
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+
+    cache.set("firmware", 1, value="one")
+    cache.set("firmware", 2, value="two")
+    cache.get("firmware", 1)
+    cache.set("firmware", 3, value="three")
+
+    assert "one" == cache.get("firmware", 1)
+    assert cache.get("firmware", 2) is MISSING
+    assert "three" == cache.get("firmware", 3)
+
+def test_results_requested_before_an_invalidation_are_not_cached():
+    cache = TTLCache()
+
+    generation = cache.generation
+    cache.invalidate("unit:1")
+    cache.set("firmware", 1, value="stale", tags=("unit:1",), generation=generation)
+    cache.set("firmware", 2, value="two", tags=("unit:2",), generation=generation)
+
+    assert cache.get("firmware", 1) is MISSING
+    assert "two" == cache.get("firmware", 2)
+
+    generation = cache.generation
+    cache.clear()
+    cache.set("firmware", 2, value="stale", tags=("unit:2",), generation=generation)
+    assert cache.get("firmware", 2) is MISSING
+
+    cache.set("firmware", 1, value="one", tags=("unit:1",), generation=cache.generation)
+    assert "one" == cache.get("firmware", 1)